@@ -5,3 +5,6 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Entities whose history is sent in each chunk of a chunked history response
+ENTITIES_PER_HISTORY_CHUNK = 25
@@ -38,7 +38,11 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    ENTITIES_PER_HISTORY_CHUNK,
+    EVENT_COALESCE_TIME,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -59,6 +63,7 @@ class HistoryLiveStream:
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history websocket API."""
     websocket_api.async_register_command(hass, ws_get_history_during_period)
+    websocket_api.async_register_command(hass, ws_get_history_during_period_chunked)
     websocket_api.async_register_command(hass, ws_stream)
 
 
@@ -171,6 +176,138 @@ async def ws_get_history_during_period(
     )
 
 
+def _ws_get_significant_states_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    complete: bool,
+) -> bytes:
+    """Fetch the history of a chunk of entities and convert it to json in the executor."""
+    return json_bytes(
+        messages.event_message(
+            msg_id,
+            {
+                "states": history.get_significant_states(
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    None,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    True,
+                ),
+                "complete": complete,
+            },
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/history_during_period_chunked",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): [str],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("minimal_response", default=False): bool,
+        vol.Optional("no_attributes", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_get_history_during_period_chunked(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle history during period websocket command sending the history in chunks.
+
+    The history of ENTITIES_PER_HISTORY_CHUNK entities at a time is sent
+    as an event. The next chunk is only fetched once the connection has
+    taken the previous one from its queue, so a slow client holds back
+    the fetching instead of chunks piling up in memory. The last event
+    has complete set, the subscription ends with it. Unsubscribing stops
+    sending the remaining chunks.
+    """
+    msg_id: int = msg["id"]
+    start_time_str = msg["start_time"]
+    end_time_str = msg.get("end_time")
+
+    if start_time := dt_util.parse_datetime(start_time_str):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg_id, "invalid_start_time", "Invalid start_time")
+        return
+
+    end_time: dt | None = None
+    if end_time_str:
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg_id, "invalid_end_time", "Invalid end_time")
+            return
+
+    entity_ids: list[str] = msg["entity_ids"]
+    for entity_id in entity_ids:
+        if not hass.states.get(entity_id) and not valid_entity_id(entity_id):
+            connection.send_error(msg_id, "invalid_entity_ids", "Invalid entity_ids")
+            return
+
+    include_start_time_state = msg["include_start_time_state"]
+    no_attributes = msg["no_attributes"]
+
+    connection.subscriptions[msg_id] = callback(lambda: None)
+    connection.send_result(msg_id)
+    if (
+        not entity_ids
+        or start_time > dt_util.utcnow()
+        or (end_time and not has_recorder_run_after(hass, end_time))
+        or not include_start_time_state
+        and entity_ids
+        and not entities_may_have_state_changes_after(
+            hass, entity_ids, start_time, no_attributes
+        )
+    ):
+        connection.send_event(msg_id, {"states": {}, "complete": True})
+        connection.subscriptions.pop(msg_id, None)
+        return
+
+    instance = get_instance(hass)
+    try:
+        for index in range(0, len(entity_ids), ENTITIES_PER_HISTORY_CHUNK):
+            # Wait for the client to read the previous chunk
+            await connection.drain()
+            if msg_id not in connection.subscriptions:
+                # Unsubscribe happened while waiting for the client
+                return
+            chunk = await instance.async_add_executor_job(
+                _ws_get_significant_states_chunk,
+                hass,
+                msg_id,
+                start_time,
+                end_time,
+                entity_ids[index : index + ENTITIES_PER_HISTORY_CHUNK],
+                include_start_time_state,
+                msg["significant_changes_only"],
+                msg["minimal_response"],
+                no_attributes,
+                index + ENTITIES_PER_HISTORY_CHUNK >= len(entity_ids),
+            )
+            if msg_id not in connection.subscriptions:
+                # Unsubscribe happened while fetching the chunk
+                return
+            connection.send_message(chunk)
+    finally:
+        connection.subscriptions.pop(msg_id, None)
+
+
 def _generate_stream_message(
     states: dict[str, list[dict[str, Any]]],
     start_day: dt,
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Generator, Iterable, Mapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final, NamedTuple, cast
 
+from lru import LRU
 from propcache import cached_property
 from sqlalchemy.engine.row import Row
 
@@ -40,8 +41,8 @@ class LazyEventPartialState:
 
     def __init__(
         self,
-        row: Row | EventAsRow,
-        event_data_cache: dict[str, dict[str, Any]],
+        row: Row | EventAsRow | LogbookTableRow,
+        event_data_cache: dict[str, dict[str, Any]] | LRU[str, dict[str, Any]],
     ) -> None:
         """Init the lazy event."""
         self.row = row
@@ -113,6 +114,9 @@ CONTEXT_ONLY_POS: Final = 10
 DATA_POS: Final = 11
 CONTEXT_POS: Final = 12
 
+CURSOR_SOURCE_EVENT: Final = "e"
+CURSOR_SOURCE_STATE: Final = "s"
+
 
 class EventAsRow(NamedTuple):
     """Convert an event to a row.
@@ -177,3 +181,103 @@ def async_event_to_row(event: Event) -> EventAsRow:
         data=event.data,
         context=context,
     )
+
+
+class LogbookCursor(NamedTuple):
+    """The position of a row in the logbook, pages continue after it.
+
+    Events and states are numbered separately, so rows with the same
+    time are told apart by whether they are states before their id.
+    """
+
+    time_fired_ts: float
+    is_state: bool
+    row_id: int
+
+    def as_string(self) -> str:
+        """Return the cursor as an opaque string for clients."""
+        source = CURSOR_SOURCE_STATE if self.is_state else CURSOR_SOURCE_EVENT
+        return f"{self.time_fired_ts!r}:{source}:{self.row_id}"
+
+    @classmethod
+    def from_string(cls, cursor: str) -> LogbookCursor:
+        """Return the cursor from its string, raise ValueError if it is invalid."""
+        time_fired_ts, source, row_id = cursor.split(":")
+        if source not in (CURSOR_SOURCE_EVENT, CURSOR_SOURCE_STATE):
+            raise ValueError(f"Invalid cursor source {source}")
+        return cls(float(time_fired_ts), source == CURSOR_SOURCE_STATE, int(row_id))
+
+
+class LogbookTableRow(NamedTuple):
+    """A row of the logbook table.
+
+    The fields before context_row must always match the order of the
+    columns in queries/common.py.
+    """
+
+    row_id: int | None
+    event_type: EventType[Any] | str | None
+    event_data: str | None
+    time_fired_ts: float
+    context_id_bin: bytes | None
+    context_user_id_bin: bytes | None
+    context_parent_id_bin: bytes | None
+    state: str | None
+    entity_id: str | None
+    icon: str | None
+    context_only: bool | None
+
+    # The origin of the context, stored with the row
+    context_row: LogbookTableRow | None
+
+
+def logbook_table_rows(rows: Iterable[Row]) -> Generator[LogbookTableRow]:
+    """Convert the rows of the logbook table query to logbook rows."""
+    for (
+        row_id,
+        event_type,
+        event_data,
+        time_fired_ts,
+        context_id_bin,
+        context_user_id_bin,
+        context_parent_id_bin,
+        state,
+        entity_id,
+        icon,
+        context_event_type,
+        context_entity_id,
+        context_state,
+        context_event_data,
+    ) in rows:
+        context_row = None
+        if context_event_type is not None or context_entity_id is not None:
+            context_row = LogbookTableRow(
+                row_id=None,
+                event_type=context_event_type,
+                event_data=context_event_data,
+                time_fired_ts=time_fired_ts,
+                context_id_bin=None,
+                context_user_id_bin=None,
+                context_parent_id_bin=None,
+                state=context_state,
+                entity_id=context_entity_id,
+                icon=None,
+                context_only=True,
+                context_row=None,
+            )
+        yield LogbookTableRow(
+            row_id=row_id,
+            event_type=event_type,
+            event_data=event_data,
+            time_fired_ts=time_fired_ts,
+            context_id_bin=context_id_bin,
+            context_user_id_bin=context_user_id_bin,
+            context_parent_id_bin=context_parent_id_bin,
+            state=state,
+            # Like the events selected from the events table, the
+            # entity_id is only set for state changes
+            entity_id=entity_id if event_type is None else None,
+            icon=icon,
+            context_only=None,
+            context_row=context_row,
+        )
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterable
 from dataclasses import dataclass
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
+from itertools import chain
 import logging
 import time
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy.engine import Result
+from lru import LRU
 from sqlalchemy.engine.row import Row
 
 from homeassistant.components.recorder import get_instance
@@ -77,19 +78,35 @@ from .models import (
     EventAsRow,
     LazyEventPartialState,
     LogbookConfig,
+    LogbookCursor,
+    LogbookTableRow,
     async_event_to_row,
+    logbook_table_rows,
 )
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.logbook_table import logbook_table_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
+# The contexts and events looked up while humanifying rows are bounded
+# so long periods can be streamed without keeping every row
+CONTEXT_LOOKUP_SIZE = 16384
+EVENT_CACHE_SIZE = 2048
+
+# The rows before a page are read again to find the
+# context of its first events
+CONTEXT_LOOKBACK = timedelta(minutes=10)
+
 
 @dataclass(slots=True)
 class LogbookRun:
     """A logbook run which may be a long running event stream or single request."""
 
-    context_lookup: dict[bytes | None, Row | EventAsRow | None]
+    context_lookup: (
+        dict[bytes | None, Row | EventAsRow | LogbookTableRow | None]
+        | LRU[bytes | None, Row | EventAsRow | LogbookTableRow | None]
+    )
     external_events: dict[
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
@@ -127,13 +144,14 @@ class EventProcessor:
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
         self.logbook_run = LogbookRun(
-            context_lookup={None: None},
+            context_lookup=LRU(CONTEXT_LOOKUP_SIZE),
             external_events=logbook_config.external_events,
-            event_cache=EventCache({}),
+            event_cache=EventCache(LRU(EVENT_CACHE_SIZE)),
             entity_name_cache=EntityNameCache(self.hass),
             include_entity_name=include_entity_name,
             timestamp=timestamp,
         )
+        self.logbook_run.context_lookup[None] = None
         self.context_augmenter = ContextAugmenter(self.logbook_run)
 
     @property
@@ -156,9 +174,76 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        return self.humanify(self._iter_rows(start_day, end_day))
+
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        limit: int,
+        after: LogbookCursor | None = None,
+    ) -> tuple[list[dict[str, Any]], LogbookCursor | None]:
+        """Get at most limit events for a period of time after a cursor.
+
+        Rows are streamed from the database and stop being read once the
+        page is full. The rows up to CONTEXT_LOOKBACK before the cursor
+        are read again only to look up the context of the first events.
+
+        Returns the events and the cursor of the next page, which is None
+        once there are no more events.
+        """
+        query_start = start_day
+        if after is not None:
+            query_start = max(
+                start_day,
+                dt_util.utc_from_timestamp(after.time_fired_ts) - CONTEXT_LOOKBACK,
+            )
+        last_row: list[Row | LogbookTableRow] = []
+        rows = self._iter_rows(query_start, end_day)
+        try:
+            events: list[dict[str, Any]] = []
+            cursor: LogbookCursor | None = None
+            for event in _humanify(
+                self.hass,
+                _rows_after(rows, after, self.logbook_run, last_row),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
+            ):
+                if len(events) == limit:
+                    return events, cursor
+                events.append(event)
+                cursor = LogbookCursor(*_row_sort_key(last_row[0]))
+            return events, None
+        finally:
+            rows.close()
+
+    def _iter_rows(
+        self, start_day: dt, end_day: dt
+    ) -> Generator[Row | LogbookTableRow]:
+        """Stream the rows for a period of time from the database."""
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
+            if (
+                (self.entity_ids or self.device_ids)
+                and (logbook_table_since := instance.logbook_table_since) is not None
+                and start_day.timestamp() >= logbook_table_since
+            ):
+                # The recorder has written every entry since the start
+                table_stmt = logbook_table_stmt(
+                    start_day.timestamp(),
+                    end_day.timestamp(),
+                    self.event_types,
+                    self.entity_ids,
+                    self.device_ids,
+                )
+                yield from logbook_table_rows(
+                    execute_stmt_lambda_element(
+                        session, table_stmt, start_day, end_day, orm_rows=False
+                    )
+                )
+                return
             if self.entity_ids:
                 metadata_ids = extract_metadata_ids(
                     instance.states_meta_manager.get_many(
@@ -180,12 +265,13 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            # Ranges of more than a day are streamed in batches
+            yield from execute_stmt_lambda_element(
+                session, stmt, start_day, end_day, orm_rows=False
             )
 
     def humanify(
-        self, rows: Generator[EventAsRow] | Sequence[Row] | Result
+        self, rows: Iterable[Row | EventAsRow | LogbookTableRow]
     ) -> list[dict[str, str]]:
         """Humanify rows."""
         return list(
@@ -199,9 +285,58 @@ class EventProcessor:
         )
 
 
+def _rows_after(
+    rows: Iterable[Row | LogbookTableRow],
+    after: LogbookCursor | None,
+    logbook_run: LogbookRun,
+    last_row: list[Row | LogbookTableRow],
+) -> Generator[Row | LogbookTableRow]:
+    """Generate the rows after a cursor ordered by time, source and row id.
+
+    The rows up to the cursor are only used to look up contexts. The
+    last generated row is kept in last_row to find the cursor of the
+    events generated from it.
+    """
+    context_lookup = logbook_run.context_lookup
+    same_time: list[Row | LogbookTableRow] = []
+    for row in chain(rows, (None,)):
+        # Rows are ordered by time, rows with the same time are
+        # ordered by source and id so the cursor is stable
+        if (
+            same_time
+            and row is not None
+            and row[TIME_FIRED_TS_POS] == same_time[0][TIME_FIRED_TS_POS]
+        ):
+            same_time.append(row)
+            continue
+        same_time.sort(key=_row_sort_key)
+        for same_time_row in same_time:
+            if after is not None and _row_sort_key(same_time_row) <= after:
+                if (
+                    context_id_bin := same_time_row[CONTEXT_ID_BIN_POS]
+                ) not in context_lookup:
+                    context_lookup[context_id_bin] = same_time_row
+                continue
+            last_row[:] = [same_time_row]
+            yield same_time_row
+        same_time = [] if row is None else [row]
+
+
+def _row_sort_key(row: Row | LogbookTableRow) -> tuple[float, bool, int]:
+    """Return the time, source and id of a row to order it.
+
+    Events come before states, rows without an id come first.
+    """
+    return (
+        row[TIME_FIRED_TS_POS],
+        row[EVENT_TYPE_POS] is PSEUDO_EVENT_STATE_CHANGED,
+        row[ROW_ID_POS] or 0,
+    )
+
+
 def _humanify(
     hass: HomeAssistant,
-    rows: Generator[EventAsRow] | Sequence[Row] | Result,
+    rows: Iterable[Row | EventAsRow | LogbookTableRow],
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
@@ -322,9 +457,14 @@ class ContextAugmenter:
         self.include_entity_name = logbook_run.include_entity_name
 
     def get_context(
-        self, context_id_bin: bytes | None, row: Row | EventAsRow | None
-    ) -> Row | EventAsRow | None:
+        self,
+        context_id_bin: bytes | None,
+        row: Row | EventAsRow | LogbookTableRow | None,
+    ) -> Row | EventAsRow | LogbookTableRow | None:
         """Get the context row from the id or row context."""
+        if type(row) is LogbookTableRow:
+            # The context was resolved when the row was recorded
+            return row.context_row
         if context_id_bin is not None and (
             context_row := self.context_lookup.get(context_id_bin)
         ):
@@ -337,7 +477,9 @@ class ContextAugmenter:
             return async_event_to_row(origin_event)
         return None
 
-    def augment(self, data: dict[str, Any], context_row: Row | EventAsRow) -> None:
+    def augment(
+        self, data: dict[str, Any], context_row: Row | EventAsRow | LogbookTableRow
+    ) -> None:
         """Augment data from the row and cache."""
         event_type = context_row[EVENT_TYPE_POS]
         # State change
@@ -385,7 +527,10 @@ class ContextAugmenter:
             data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(attr_entity_id)
 
 
-def _rows_ids_match(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
+def _rows_ids_match(
+    row: Row | EventAsRow | LogbookTableRow,
+    other_row: Row | EventAsRow | LogbookTableRow,
+) -> bool:
     """Check of rows match by using the same method as Events __hash__."""
     return bool((row_id := row[ROW_ID_POS]) and row_id == other_row[ROW_ID_POS])
 
@@ -419,12 +564,17 @@ class EntityNameCache:
 class EventCache:
     """Cache LazyEventPartialState by row."""
 
-    def __init__(self, event_data_cache: dict[str, dict[str, Any]]) -> None:
+    def __init__(
+        self,
+        event_data_cache: dict[str, dict[str, Any]] | LRU[str, dict[str, Any]],
+    ) -> None:
         """Init the cache."""
         self._event_data_cache = event_data_cache
-        self.event_cache: dict[Row | EventAsRow, LazyEventPartialState] = {}
+        self.event_cache: LRU[
+            Row | EventAsRow | LogbookTableRow, LazyEventPartialState
+        ] = LRU(EVENT_CACHE_SIZE)
 
-    def get(self, row: EventAsRow | Row) -> LazyEventPartialState:
+    def get(self, row: EventAsRow | Row | LogbookTableRow) -> LazyEventPartialState:
         """Get the event from the row."""
         if type(row) is EventAsRow:  # - this is never subclassed
             return LazyEventPartialState(row, self._event_data_cache)
@@ -437,5 +587,5 @@ class EventCache:
 
     def clear(self) -> None:
         """Clear the event cache."""
-        self._event_data_cache = {}
-        self.event_cache = {}
+        self._event_data_cache.clear()
+        self.event_cache.clear()
@@ -0,0 +1,83 @@
+"""Logbook table queries for logbook."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from typing import Any
+
+from sqlalchemy import lambda_stmt, select, union_all
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.sql.selectable import Select
+
+from homeassistant.components.recorder.db_schema import Logbook
+from homeassistant.util.event_type import EventType
+
+LOGBOOK_TABLE_COLUMNS = (
+    Logbook.logbook_id.label("row_id"),
+    Logbook.event_type.label("event_type"),
+    Logbook.event_data.label("event_data"),
+    Logbook.time_fired_ts.label("time_fired_ts"),
+    Logbook.context_id_bin.label("context_id_bin"),
+    Logbook.context_user_id_bin.label("context_user_id_bin"),
+    Logbook.context_parent_id_bin.label("context_parent_id_bin"),
+    Logbook.state.label("state"),
+    Logbook.entity_id.label("entity_id"),
+    Logbook.icon.label("icon"),
+    Logbook.context_event_type.label("context_event_type"),
+    Logbook.context_entity_id.label("context_entity_id"),
+    Logbook.context_state.label("context_state"),
+    Logbook.context_event_data.label("context_event_data"),
+)
+
+
+def _select_logbook_table(
+    start_day: float,
+    end_day: float,
+    event_types: Collection[EventType[Any] | str],
+) -> Select:
+    """Generate a select for the state changes and events of a timeframe."""
+    return (
+        select(*LOGBOOK_TABLE_COLUMNS)
+        .where((Logbook.time_fired_ts > start_day) & (Logbook.time_fired_ts < end_day))
+        .where(Logbook.event_type.is_(None) | Logbook.event_type.in_(event_types))
+    )
+
+
+def logbook_table_stmt(
+    start_day: float,
+    end_day: float,
+    event_types: Collection[EventType[Any] | str],
+    entity_ids: Collection[str] | None,
+    device_ids: Collection[str] | None,
+) -> StatementLambdaElement:
+    """Generate a logbook query for entities and devices from the logbook table.
+
+    Each select is a range scan of the index of the entity or device ids
+    since the context of each entry is stored with it.
+    """
+    if entity_ids and device_ids:
+        return lambda_stmt(
+            lambda: union_all(
+                _select_logbook_table(start_day, end_day, event_types).where(
+                    Logbook.entity_id.in_(entity_ids)
+                ),
+                _select_logbook_table(start_day, end_day, event_types)
+                .where(Logbook.device_id.in_(device_ids))
+                # Entries of the entities are already in the first select
+                .where(
+                    Logbook.entity_id.is_(None) | Logbook.entity_id.not_in(entity_ids)
+                ),
+            ).order_by(Logbook.time_fired_ts)
+        )
+    if entity_ids:
+        return lambda_stmt(
+            lambda: _select_logbook_table(start_day, end_day, event_types)
+            .where(Logbook.entity_id.in_(entity_ids))
+            .order_by(Logbook.time_fired_ts)
+        )
+    assert device_ids
+    return lambda_stmt(
+        lambda: _select_logbook_table(start_day, end_day, event_types)
+        .where(Logbook.device_id.in_(device_ids))
+        .order_by(Logbook.time_fired_ts)
+    )
@@ -13,15 +13,22 @@ import voluptuous as vol
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
+from homeassistant.const import CONTENT_TYPE_JSON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import InvalidEntityFormatError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
 from .helpers import async_determine_event_types
+from .models import LogbookCursor
 from .processor import EventProcessor
 
+# The events are fetched and sent in pages so the
+# response of long periods is not built in memory
+LOGBOOK_PAGE_SIZE = 1000
+
 
 @callback
 def async_setup(
@@ -54,7 +61,7 @@ class LogbookView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Retrieve logbook entries."""
         if datetime:
             if (datetime_dt := dt_util.parse_datetime(datetime)) is None:
@@ -107,8 +114,27 @@ class LogbookView(HomeAssistantView):
             include_entity_name=True,
         )
 
-        def json_events() -> web.Response:
-            """Fetch events and generate JSON."""
-            return self.json(event_processor.get_events(start_day, end_day))
-
-        return await get_instance(hass).async_add_executor_job(json_events)
+        def json_events_page(
+            cursor: LogbookCursor | None,
+        ) -> tuple[bytes, LogbookCursor | None]:
+            """Fetch a page of events and generate its JSON without the brackets."""
+            events, next_cursor = event_processor.get_events_page(
+                start_day, end_day, LOGBOOK_PAGE_SIZE, cursor
+            )
+            return json_bytes(events)[1:-1], next_cursor
+
+        instance = get_instance(hass)
+        page, cursor = await instance.async_add_executor_job(json_events_page, None)
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_JSON
+        await response.prepare(request)
+        await response.write(b"[" + page)
+        while cursor is not None:
+            page, cursor = await instance.async_add_executor_job(
+                json_events_page, cursor
+            )
+            if page:
+                await response.write(b"," + page)
+        await response.write(b"]")
+        await response.write_eof()
+        return response
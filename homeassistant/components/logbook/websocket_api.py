@@ -26,7 +26,7 @@ from .helpers import (
     async_filter_entities,
     async_subscribe_events,
 )
-from .models import LogbookConfig, async_event_to_row
+from .models import LogbookConfig, LogbookCursor, async_event_to_row
 from .processor import EventProcessor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
@@ -432,11 +432,26 @@ def _ws_formatted_get_events(
     start_time: dt,
     end_time: dt,
     event_processor: EventProcessor,
+    limit: int | None,
+    cursor: LogbookCursor | None,
 ) -> bytes:
     """Fetch events and convert them to json in the executor."""
+    if limit is None:
+        return json_bytes(
+            messages.result_message(
+                msg_id, event_processor.get_events(start_time, end_time)
+            )
+        )
+    events, next_cursor = event_processor.get_events_page(
+        start_time, end_time, limit, cursor
+    )
     return json_bytes(
         messages.result_message(
-            msg_id, event_processor.get_events(start_time, end_time)
+            msg_id,
+            {
+                "events": events,
+                "next_cursor": next_cursor and next_cursor.as_string(),
+            },
         )
     )
 
@@ -449,6 +464,8 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("cursor"): str,
     }
 )
 @websocket_api.async_response
@@ -474,8 +491,24 @@ async def ws_get_events(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
+    # Events are sent in pages of limit events when it is set,
+    # the cursor of the previous page continues after it
+    limit: int | None = msg.get("limit")
+    cursor: LogbookCursor | None = None
+    if cursor_str := msg.get("cursor"):
+        try:
+            cursor = LogbookCursor.from_string(cursor_str)
+        except ValueError:
+            cursor = None
+        if cursor is None or limit is None:
+            connection.send_error(msg["id"], "invalid_cursor", "Invalid cursor")
+            return
+    no_events: list[dict[str, Any]] | dict[str, Any] = (
+        [] if limit is None else {"events": [], "next_cursor": None}
+    )
+
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        connection.send_result(msg["id"], no_events)
         return
 
     device_ids = msg.get("device_ids")
@@ -485,7 +518,7 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            connection.send_result(msg["id"], no_events)
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -507,5 +540,7 @@ async def ws_get_events(
             start_time,
             end_time,
             event_processor,
+            limit,
+            cursor,
         )
     )
@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
+from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable, Iterator
 import contextlib
 from dataclasses import dataclass
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import chain, count, groupby
 import logging
 from operator import attrgetter
 import socket
@@ -267,12 +267,121 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _SubscriptionTrieNode:
+    """A node in the subscription trie, one per topic level."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: set[Subscription] = set()
+
+
+class SubscriptionTrie:
+    """Match topics against wildcard subscriptions.
+
+    Subscriptions are stored in a trie keyed by topic level, with
+    the `+` and `#` wildcards as regular children of a node.
+    Matching a topic costs time proportional to the topic depth
+    instead of the number of subscriptions.
+    """
+
+    __slots__ = ("_root", "_order", "_counter")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+        # Subscription order is preserved so callbacks are
+        # called in the order they subscribed.
+        self._order: dict[Subscription, int] = {}
+        self._counter = count()
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions."""
+        return len(self._order)
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over the subscriptions in the order they were added."""
+        return iter(self._order)
+
+    def __contains__(self, subscription: object) -> bool:
+        """Return if the subscription is tracked."""
+        return subscription in self._order
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions.add(subscription)
+        self._order[subscription] = next(self._counter)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError if the subscription is not tracked.
+        """
+        del self._order[subscription]
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        # Prune the nodes that no longer lead to a subscription
+        for parent, level in reversed(path):
+            if node.subscriptions or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if there is a subscription for the exact topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        levels = topic.split("/")
+        num_levels = len(levels)
+        # Wildcards at the first level must not match topics starting
+        # with `$`, as specified in [MQTT-4.7.2-1].
+        match_wildcards = not topic.startswith("$")
+        matches: list[Subscription] = []
+        stack: list[tuple[_SubscriptionTrieNode, int]] = [(self._root, 0)]
+        while stack:
+            node, idx = stack.pop()
+            children = node.children
+            if (match_wildcards or idx) and (
+                multi_level := children.get("#")
+            ) is not None:
+                matches.extend(multi_level.subscriptions)
+            if idx == num_levels:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[idx])) is not None:
+                stack.append((child, idx + 1))
+            if (match_wildcards or idx) and (
+                single_level := children.get("+")
+            ) is not None:
+                stack.append((single_level, idx + 1))
+        if len(matches) > 1:
+            matches.sort(key=self._order.__getitem__)
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -376,9 +485,7 @@ class MQTT:
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
         )
-        # To ensure the wildcard subscriptions order is preserved, we use a dict
-        # with `None` values instead of a set.
-        self._wildcard_subscriptions: dict[Subscription, None] = {}
+        self._wildcard_subscriptions = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -626,8 +733,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_topic(topic)
         )
 
     async def async_publish(
@@ -756,7 +863,7 @@ class MQTT:
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
-            self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -774,7 +881,7 @@ class MQTT:
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
             else:
-                del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscriptions.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -837,9 +944,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1051,13 +1157,8 @@ class MQTT:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions.matches(topic))
         return subscriptions
 
     @callback
@@ -1249,13 +1350,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
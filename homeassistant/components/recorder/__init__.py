@@ -35,6 +35,7 @@ from .const import (  # noqa: F401
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_METHODS,
     SQLITE_URL_PREFIX,
+    PartitionInterval,
     SupportedDialect,
 )
 from .core import Recorder
@@ -51,6 +52,8 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_BULK_INSERT = False
+DEFAULT_LOGBOOK_TABLE = False
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
@@ -61,6 +64,10 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT = "bulk_insert"
+CONF_PARTITION_INTERVAL = "partition_interval"
+CONF_ARCHIVE_AFTER_DAYS = "archive_after_days"
+CONF_LOGBOOK_TABLE = "logbook_table"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -113,6 +120,18 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(
+                        CONF_BULK_INSERT, default=DEFAULT_BULK_INSERT
+                    ): cv.boolean,
+                    vol.Optional(CONF_PARTITION_INTERVAL): vol.All(
+                        cv.string, vol.Coerce(PartitionInterval)
+                    ),
+                    vol.Optional(CONF_ARCHIVE_AFTER_DAYS): vol.All(
+                        vol.Coerce(int), vol.Range(min=1)
+                    ),
+                    vol.Optional(
+                        CONF_LOGBOOK_TABLE, default=DEFAULT_LOGBOOK_TABLE
+                    ): cv.boolean,
                 }
             ),
         )
@@ -142,6 +161,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    bulk_insert = conf[CONF_BULK_INSERT]
+    partition_interval = conf.get(CONF_PARTITION_INTERVAL)
+    archive_after_days = conf.get(CONF_ARCHIVE_AFTER_DAYS)
+    logbook_table = conf[CONF_LOGBOOK_TABLE]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -163,6 +186,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        bulk_insert=bulk_insert,
+        partition_interval=partition_interval,
+        archive_after_days=archive_after_days,
+        logbook_table=logbook_table,
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -0,0 +1,288 @@
+"""Accumulate the states of sensors for short term statistics.
+
+The recorder feeds the states it records to the accumulator, so short
+term statistics can be compiled without reading back the states which
+were just written:
+
+- The numeric states of entities with a mean are accumulated into time
+  weighted sums, min and max per 5 minute period and unit, like the
+  aggregates computed by the database.
+- The states of entities with a sum are kept until their period is
+  compiled, since reset detection needs every state.
+
+Entities are tracked from their current state when statistics are
+compiled, periods starting before that are not accumulated and must be
+compiled from the database. The accumulator is only accessed from the
+recorder thread.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+import math
+from operator import attrgetter
+from typing import Any
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import State
+
+from .db_schema import StatisticsShortTerm
+from .history import NumericStatesAggregate
+
+PERIOD_SECONDS = StatisticsShortTerm.duration.total_seconds()
+
+_LAST_UPDATED_TIMESTAMP = attrgetter("last_updated_timestamp")
+
+
+def _period_start_ts(timestamp: float) -> float:
+    """Return the start of the short term statistics period of a timestamp."""
+    return timestamp - timestamp % PERIOD_SECONDS
+
+
+def _float_or_none(state: State) -> float | None:
+    """Return the value of a state if it is a finite number."""
+    try:
+        value = float(state.state)
+    except (ValueError, TypeError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+@dataclass(slots=True)
+class _Aggregate:
+    """Time weighted sum, min and max of states with the same unit."""
+
+    attributes: dict[str, Any]
+    first_ts: float
+    min: float
+    max: float
+    duration: float = 0.0
+    weighted_sum: float = 0.0
+
+
+class _MeanAccumulator:
+    """Accumulate the numeric states of an entity per period."""
+
+    __slots__ = (
+        "_attributes",
+        "_numeric",
+        "_periods",
+        "_until",
+        "_value",
+        "last_updated_ts",
+        "since_ts",
+    )
+
+    def __init__(self, state: State) -> None:
+        """Start accumulating from the current state of the entity."""
+        self.since_ts = self.last_updated_ts = state.last_updated_timestamp
+        self._value: float | None = None
+        # If the last state is numeric
+        self._numeric = False
+        self._attributes: dict[str, Any] = {}
+        self._until = self.last_updated_ts
+        self._periods: dict[float, dict[Any, _Aggregate]] = {}
+        self._set_value(state)
+
+    def add_state(self, state: State) -> None:
+        """Add a recorded state."""
+        if (timestamp := state.last_updated_timestamp) <= self.last_updated_ts:
+            return
+        self.last_updated_ts = timestamp
+        # Like the significant states of the history, changes
+        # of only the attributes are ignored
+        if state.last_changed_timestamp == timestamp:
+            self._set_value(state)
+
+    def _set_value(self, state: State) -> None:
+        """Set the value from a state.
+
+        Like _time_weighted_average, a non numeric state keeps the value of
+        the last numeric state until the end of its period.
+        """
+        timestamp = state.last_updated_timestamp
+        self._accumulate_until(timestamp)
+        if (value := _float_or_none(state)) is None:
+            self._numeric = False
+            return
+        self._numeric = True
+        self._value = value
+        self._attributes = state.attributes
+        self._aggregate(timestamp)
+
+    def _aggregate(self, timestamp: float) -> _Aggregate:
+        """Return the aggregate of the value at a timestamp."""
+        assert self._value is not None
+        value = self._value
+        aggregates = self._periods.setdefault(_period_start_ts(timestamp), {})
+        unit = self._attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if (aggregate := aggregates.get(unit)) is None:
+            aggregates[unit] = aggregate = _Aggregate(
+                self._attributes, timestamp, value, value
+            )
+        elif value < aggregate.min:
+            aggregate.min = value
+        elif value > aggregate.max:
+            aggregate.max = value
+        return aggregate
+
+    def _accumulate_until(self, timestamp: float) -> None:
+        """Accumulate the value until a timestamp."""
+        while self._until < timestamp:
+            if not self._numeric and _period_start_ts(self._until) == self._until:
+                # A period starting with a non numeric state has no value
+                # until the next numeric state
+                self._value = None
+            if self._value is None:
+                self._until = timestamp
+                return
+            end = min(timestamp, _period_start_ts(self._until) + PERIOD_SECONDS)
+            aggregate = self._aggregate(self._until)
+            duration = end - self._until
+            aggregate.duration += duration
+            aggregate.weighted_sum += self._value * duration
+            self._until = end
+
+    def pop_period(
+        self, start_ts: float, end_ts: float
+    ) -> list[NumericStatesAggregate] | None:
+        """Return the aggregates of a period and forget older periods."""
+        # Older periods are not accumulated since they are not compiled
+        self._until = max(self._until, start_ts)
+        self._accumulate_until(end_ts)
+        aggregates = self._periods.pop(start_ts, {})
+        for period_start_ts in [ts for ts in self._periods if ts < start_ts]:
+            del self._periods[period_start_ts]
+        if self.since_ts > start_ts:
+            return None
+        return [
+            NumericStatesAggregate(
+                aggregate.attributes,
+                aggregate.first_ts,
+                aggregate.duration,
+                aggregate.weighted_sum,
+                aggregate.min,
+                aggregate.max,
+            )
+            for aggregate in aggregates.values()
+        ]
+
+
+class _StatesAccumulator:
+    """Keep the states of an entity until their period is compiled."""
+
+    __slots__ = ("_states", "last_updated_ts", "since_ts")
+
+    def __init__(self, state: State) -> None:
+        """Start keeping states from the current state of the entity."""
+        self.since_ts = self.last_updated_ts = state.last_updated_timestamp
+        self._states = [state]
+
+    def add_state(self, state: State) -> None:
+        """Add a recorded state."""
+        if (timestamp := state.last_updated_timestamp) <= self.last_updated_ts:
+            return
+        self.last_updated_ts = timestamp
+        self._states.append(state)
+
+    def pop_period(self, start_ts: float, end_ts: float) -> list[State] | None:
+        """Return the start state and states of a period and forget older states.
+
+        The last state before the end of the period is kept as the start
+        state of the next period.
+        """
+        states = self._states
+        end_index = bisect_left(states, end_ts, key=_LAST_UPDATED_TIMESTAMP)
+        start_index = bisect_left(
+            states, start_ts, hi=end_index, key=_LAST_UPDATED_TIMESTAMP
+        )
+        period_states = states[max(start_index - 1, 0) : end_index]
+        self._states = states[max(end_index - 1, 0) :]
+        if self.since_ts > start_ts:
+            return None
+        return period_states
+
+
+class ShortTermStatisticsAccumulator:
+    """Accumulate the states of sensors for short term statistics."""
+
+    def __init__(self) -> None:
+        """Initialize the accumulator."""
+        self._entities: dict[str, _MeanAccumulator | _StatesAccumulator] = {}
+
+    def add_state(self, entity_id: str, state: State) -> None:
+        """Add a state recorded by the recorder."""
+        if (entity := self._entities.get(entity_id)) is not None:
+            entity.add_state(state)
+
+    def track(
+        self, mean_states: Iterable[State], states_states: Iterable[State]
+    ) -> None:
+        """Track entities from their current state.
+
+        The numeric states of the entities of mean_states are accumulated,
+        all states of the entities of states_states are kept. Entities
+        which are not passed are no longer tracked.
+        """
+        entities: dict[str, _MeanAccumulator | _StatesAccumulator] = {}
+        for states, accumulator_type in (
+            (mean_states, _MeanAccumulator),
+            (states_states, _StatesAccumulator),
+        ):
+            for state in states:
+                entity_id = state.entity_id
+                if type(entity := self._entities.get(entity_id)) is accumulator_type:
+                    entities[entity_id] = entity
+                    continue
+                entities[entity_id] = accumulator_type(state)
+        self._entities = entities
+
+    def pop_aggregates(
+        self, entity_ids: Iterable[str], start: datetime, end: datetime
+    ) -> dict[str, list[NumericStatesAggregate]]:
+        """Return the aggregates of the numeric states during a period.
+
+        Entities which were not tracked since the start of the period
+        are not included. Entities without numeric states have no
+        aggregates.
+        """
+        start_ts = start.timestamp()
+        end_ts = end.timestamp()
+        result: dict[str, list[NumericStatesAggregate]] = {}
+        for entity_id in entity_ids:
+            if (
+                type(entity := self._entities.get(entity_id)) is _MeanAccumulator
+                and (aggregates := entity.pop_period(start_ts, end_ts)) is not None
+            ):
+                result[entity_id] = aggregates
+        return result
+
+    def pop_states(
+        self, entity_ids: Iterable[str], start: datetime, end: datetime
+    ) -> dict[str, list[State]]:
+        """Return the start state and the states during a period.
+
+        Entities which were not tracked since the start of the period
+        are not included.
+        """
+        start_ts = start.timestamp()
+        end_ts = end.timestamp()
+        result: dict[str, list[State]] = {}
+        for entity_id in entity_ids:
+            if (
+                type(entity := self._entities.get(entity_id)) is _StatesAccumulator
+                and (states := entity.pop_period(start_ts, end_ts)) is not None
+            ):
+                result[entity_id] = states
+        return result
+
+    def reset(self) -> None:
+        """Stop tracking all entities.
+
+        Called when recorded states may have been lost, periods are
+        compiled from the database until the entities are tracked again.
+        """
+        self._entities.clear()
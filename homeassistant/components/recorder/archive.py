@@ -0,0 +1,284 @@
+"""Archive old states into compressed blocks.
+
+Archived states are moved out of the states table, so writing to it and
+querying recent history does not get slower with the amount of history
+that is kept. Each block holds consecutive states of a single entity,
+stored as columns which compress much better than rows:
+
+- last_updated_ts as microseconds since the previous state
+- last_changed_ts as microseconds before last_updated_ts, 0 when unchanged
+- state and attributes as indexes into the distinct values of the block
+
+The shared attributes are stored in the block instead of the
+attributes_id, so archived states do not keep the state_attributes rows
+from being purged.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from itertools import accumulate
+import logging
+from operator import itemgetter
+import struct
+import sys
+from typing import TYPE_CHECKING, NamedTuple
+import zlib
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm.session import Session
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+from .db_schema import StatesArchive
+from .purge import _purge_state_ids, _purge_unused_attributes_ids
+from .queries import (
+    find_oldest_metadata_id_to_archive,
+    find_states_archived_until,
+    find_states_to_archive,
+)
+from .util import execute_stmt_lambda_element, retryable_database_job, session_scope
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+ARCHIVE_BLOCK_VERSION = 1
+
+# Number of entities archived before the task is rescheduled
+ARCHIVE_ENTITIES_PER_RUN = 100
+
+# Block format version, number of states and length of the distinct values
+_HEADER = struct.Struct("<BII")
+_COLUMN_TYPECODES = ("q", "q", "I", "I")
+_SWAP_BYTES = sys.byteorder == "big"
+_SORT_KEY = itemgetter(0, 2)
+
+
+class ArchivedState(NamedTuple):
+    """A state read from the archive.
+
+    The fields match the columns of the history queries, so archived
+    states can be processed like the rows of the states table.
+    """
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    attributes: str | None
+
+
+def encode_block(states: Sequence[ArchivedState]) -> bytes:
+    """Encode consecutive states of an entity into a compressed block."""
+    state_values: dict[str | None, int] = {}
+    attributes_values: dict[str | None, int] = {}
+    columns = tuple(array(typecode) for typecode in _COLUMN_TYPECODES)
+    updated, changed, state_indexes, attributes_indexes = columns
+    previous_updated_us = 0
+    for state in states:
+        updated_us = round(state.last_updated_ts * 1_000_000)
+        updated.append(updated_us - previous_updated_us)
+        previous_updated_us = updated_us
+        changed.append(
+            0
+            if state.last_changed_ts is None
+            else updated_us - round(state.last_changed_ts * 1_000_000)
+        )
+        state_indexes.append(state_values.setdefault(state.state, len(state_values)))
+        attributes_indexes.append(
+            attributes_values.setdefault(state.attributes, len(attributes_values))
+        )
+    values = json_bytes([list(state_values), list(attributes_values)])
+    if _SWAP_BYTES:
+        for column in columns:
+            column.byteswap()
+    return zlib.compress(
+        b"".join(
+            (
+                _HEADER.pack(ARCHIVE_BLOCK_VERSION, len(states), len(values)),
+                values,
+                *(column.tobytes() for column in columns),
+            )
+        )
+    )
+
+
+def decode_block(metadata_id: int, block: bytes) -> list[ArchivedState]:
+    """Decode the states of a compressed block."""
+    data = zlib.decompress(block)
+    version, count, values_length = _HEADER.unpack_from(data)
+    if version != ARCHIVE_BLOCK_VERSION:
+        raise ValueError(f"Unsupported archive block version {version}")
+    offset = _HEADER.size
+    state_values, attributes_values = json_loads(data[offset : offset + values_length])  # type: ignore[misc]
+    offset += values_length
+    columns: list[array] = []
+    for typecode in _COLUMN_TYPECODES:
+        column = array(typecode)
+        end = offset + count * column.itemsize
+        column.frombytes(data[offset:end])
+        if _SWAP_BYTES:
+            column.byteswap()
+        columns.append(column)
+        offset = end
+    updated, changed, state_indexes, attributes_indexes = columns
+    return [
+        ArchivedState(
+            metadata_id,
+            state_values[state_index],
+            updated_us / 1_000_000,
+            (updated_us - changed_us) / 1_000_000 if changed_us else None,
+            attributes_values[attributes_index],
+        )
+        for updated_us, changed_us, state_index, attributes_index in zip(
+            accumulate(updated), changed, state_indexes, attributes_indexes, strict=True
+        )
+    ]
+
+
+def get_archived_until(session: Session) -> float | None:
+    """Return the timestamp of the newest archived state."""
+    return session.execute(find_states_archived_until()).scalar()
+
+
+@retryable_database_job("archive")
+def archive_states(instance: Recorder, archive_before: datetime) -> bool:
+    """Move the states before archive_before from the states table to the archive.
+
+    Entities are archived one at a time, starting with the entity of the
+    oldest state. Returns False when more states remain to be archived.
+    """
+    archive_before_ts = archive_before.timestamp()
+    with session_scope(session=instance.get_session()) as session:
+        for _ in range(ARCHIVE_ENTITIES_PER_RUN):
+            if (
+                metadata_id := session.execute(
+                    find_oldest_metadata_id_to_archive(archive_before_ts)
+                ).scalar()
+            ) is None:
+                return True
+            _archive_entity_states(instance, session, metadata_id, archive_before_ts)
+            session.commit()
+    return False
+
+
+def _archive_entity_states(
+    instance: Recorder, session: Session, metadata_id: int, archive_before_ts: float
+) -> None:
+    """Archive the states of an entity before archive_before_ts.
+
+    Blocks hold up to max_bind_vars states so the archived states can be
+    deleted with a single statement.
+    """
+    max_bind_vars = instance.max_bind_vars
+    while rows := execute_stmt_lambda_element(
+        session, find_states_to_archive(metadata_id, archive_before_ts, max_bind_vars)
+    ):
+        states = [
+            ArchivedState(
+                metadata_id,
+                row.state,
+                row.last_updated_ts,
+                row.last_changed_ts,
+                row.attributes,
+            )
+            for row in rows
+        ]
+        end_ts = states[-1].last_updated_ts
+        session.add(
+            StatesArchive(
+                metadata_id=metadata_id,
+                start_ts=states[0].last_updated_ts,
+                end_ts=end_ts,
+                row_count=len(states),
+                block=encode_block(states),
+            )
+        )
+        _LOGGER.debug("Archiving %s states of metadata_id %s", len(states), metadata_id)
+        _purge_state_ids(instance, session, {row.state_id for row in rows})
+        _purge_unused_attributes_ids(
+            instance,
+            session,
+            {row.attributes_id for row in rows if row.attributes_id is not None},
+        )
+        if (
+            instance.states_archived_until is None
+            or end_ts > instance.states_archived_until
+        ):
+            instance.states_archived_until = end_ts
+        if len(rows) < max_bind_vars:
+            return
+
+
+def get_archived_states(
+    session: Session,
+    metadata_ids: Iterable[int],
+    start_time_ts: float,
+    end_time_ts: float | None,
+) -> list[ArchivedState]:
+    """Return the archived states of entities during a period.
+
+    The states are sorted by metadata_id and last_updated_ts.
+    """
+    stmt = select(StatesArchive.metadata_id, StatesArchive.block).where(
+        StatesArchive.metadata_id.in_(metadata_ids),
+        StatesArchive.end_ts > start_time_ts,
+    )
+    if end_time_ts:
+        stmt = stmt.where(StatesArchive.start_ts < end_time_ts)
+    states = [
+        state
+        for metadata_id, block in session.execute(stmt)
+        for state in decode_block(metadata_id, block)
+        if state.last_updated_ts > start_time_ts
+        and (not end_time_ts or state.last_updated_ts < end_time_ts)
+    ]
+    states.sort(key=_SORT_KEY)
+    return states
+
+
+def get_archived_start_states(
+    session: Session, metadata_ids: Iterable[int], start_time_ts: float
+) -> list[ArchivedState]:
+    """Return the last archived state of each entity before start_time_ts.
+
+    Like the start states of the history queries, they have a
+    last_updated_ts of 0.
+    """
+    latest_blocks = (
+        select(
+            StatesArchive.metadata_id.label("latest_metadata_id"),
+            func.max(StatesArchive.start_ts).label("latest_start_ts"),
+        )
+        .where(
+            StatesArchive.metadata_id.in_(metadata_ids),
+            StatesArchive.start_ts < start_time_ts,
+        )
+        .group_by(StatesArchive.metadata_id)
+        .subquery()
+    )
+    start_states: dict[int, ArchivedState] = {}
+    for metadata_id, block in session.execute(
+        select(StatesArchive.metadata_id, StatesArchive.block).join(
+            latest_blocks,
+            and_(
+                StatesArchive.metadata_id == latest_blocks.c.latest_metadata_id,
+                StatesArchive.start_ts == latest_blocks.c.latest_start_ts,
+            ),
+        )
+    ):
+        start_state: ArchivedState | None = None
+        for state in decode_block(metadata_id, block):
+            if state.last_updated_ts >= start_time_ts:
+                break
+            start_state = state
+        if start_state is not None:
+            start_states[metadata_id] = start_state._replace(
+                last_updated_ts=0.0, last_changed_ts=None
+            )
+    return sorted(start_states.values(), key=_SORT_KEY)
@@ -37,6 +37,9 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        purge_progress = (
+            progress.as_dict() if (progress := instance.purge_progress) else None
+        )
     else:
         backlog = None
         migration_in_progress = False
@@ -44,12 +47,14 @@ def ws_info(
         recording = False
         is_running = False
         max_backlog = None
+        purge_progress = None
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "purge_progress": purge_progress,
         "recording": recording,
         "thread_running": is_running,
     }
@@ -0,0 +1,181 @@
+"""Write recorder rows in bulk without the ORM unit of work."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Table, insert, update
+from sqlalchemy.orm.session import Session
+
+from .db_schema import (
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    Logbook,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+# Tables are inserted in this order so the ids of the rows a row
+# refers to are known by the time it is inserted
+_MODELS_IN_INSERT_ORDER: tuple[type[Base], ...] = (
+    EventTypes,
+    EventData,
+    StatesMeta,
+    StateAttributes,
+    Events,
+    States,
+    Logbook,
+)
+
+# Foreign key column, relationship and primary key of the related row
+_RELATIONSHIPS: dict[type[Base], tuple[tuple[str, str, str], ...]] = {
+    Events: (
+        ("event_type_id", "event_type_rel", "event_type_id"),
+        ("data_id", "event_data_rel", "data_id"),
+    ),
+    States: (
+        ("metadata_id", "states_meta_rel", "metadata_id"),
+        ("attributes_id", "state_attributes", "attributes_id"),
+        ("old_state_id", "old_state", "state_id"),
+    ),
+}
+
+
+class _BulkTable:
+    """Rows waiting to be inserted into a table."""
+
+    __slots__ = (
+        "model",
+        "table",
+        "primary_key",
+        "columns",
+        "defaults",
+        "relationships",
+        "pending",
+    )
+
+    def __init__(self, model: type[Base]) -> None:
+        """Initialize the bulk table."""
+        table: Table = model.__table__  # type: ignore[assignment]
+        (primary_key,) = table.primary_key.columns
+        self.model = model
+        self.table = table
+        self.primary_key: str = primary_key.key
+        self.columns = tuple(
+            column.key for column in table.columns if not column.primary_key
+        )
+        # The ORM applies Python side defaults when it flushes,
+        # they must be applied here for attributes that were never set
+        self.defaults: tuple[tuple[str, Any], ...] = tuple(
+            (column.key, column.default)
+            for column in table.columns
+            if not column.primary_key
+            and column.default is not None
+            and (column.default.is_scalar or column.default.is_callable)
+        )
+        self.relationships = _RELATIONSHIPS.get(model, ())
+        self.pending: list[Base] = []
+
+    def row(self, obj: Base, deferred: list[tuple[Base, str, Base]]) -> dict[str, Any]:
+        """Return the row of a pending object.
+
+        Related rows that are not inserted yet are added to deferred.
+        """
+        values = obj.__dict__
+        row = {column: values.get(column) for column in self.columns}
+        for column, default in self.defaults:
+            if column not in values:
+                row[column] = default.arg(None) if default.is_callable else default.arg
+        for foreign_key, relationship, primary_key in self.relationships:
+            if (related := values.get(relationship)) is None:
+                continue
+            if (related_id := getattr(related, primary_key)) is None:
+                deferred.append((obj, foreign_key, related))
+            row[foreign_key] = related_id
+        return row
+
+
+class BulkWriter:
+    """Insert the rows of the event session with multi-row INSERT ... RETURNING.
+
+    Rows are collected from the transient objects the recorder creates for
+    each event, which are never added to the session. The pending maps of
+    the table managers keep referring to these objects to resolve foreign
+    keys between rows of the same commit, and the ids returned by the
+    database are assigned back to the objects so the managers can load
+    them after the commit.
+
+    Each table is written with a single executemany, which SQLAlchemy
+    batches into multi-row statements. The dialect must support RETURNING
+    for executemany sorted by parameter order.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk writer."""
+        self._tables = {model: _BulkTable(model) for model in _MODELS_IN_INSERT_ORDER}
+        self._inserted: list[tuple[Base, str]] = []
+
+    def add(self, obj: Base) -> bool:
+        """Add an object to be inserted at the next flush.
+
+        Returns False if the object cannot be written in bulk.
+        """
+        if (bulk_table := self._tables.get(type(obj))) is None:
+            return False
+        bulk_table.pending.append(obj)
+        return True
+
+    def flush(self, session: Session) -> None:
+        """Insert all pending rows."""
+        for bulk_table in self._tables.values():
+            if bulk_table.pending:
+                self._insert(session, bulk_table)
+
+    def _insert(self, session: Session, bulk_table: _BulkTable) -> None:
+        """Insert rows and assign the returned primary keys to the objects."""
+        table = bulk_table.table
+        primary_key = bulk_table.primary_key
+        pending = bulk_table.pending
+        # States link to the previous state of the same entity, which
+        # can be part of the same insert
+        deferred: list[tuple[Base, str, Base]] = []
+        rows = [bulk_table.row(obj, deferred) for obj in pending]
+        ids = session.execute(
+            insert(table).returning(table.c[primary_key], sort_by_parameter_order=True),
+            rows,
+        ).scalars()
+        inserted = self._inserted
+        for obj, id_ in zip(pending, ids, strict=True):
+            setattr(obj, primary_key, id_)
+            inserted.append((obj, primary_key))
+        if not deferred:
+            return
+        tables = self._tables
+        session.execute(
+            update(bulk_table.model),
+            [
+                {
+                    primary_key: getattr(obj, primary_key),
+                    foreign_key: getattr(related, tables[type(related)].primary_key),
+                }
+                for obj, foreign_key, related in deferred
+            ],
+        )
+
+    def rollback(self) -> None:
+        """Forget the ids of rows that were not committed.
+
+        The rows are kept pending to be inserted again.
+        """
+        for obj, primary_key in self._inserted:
+            setattr(obj, primary_key, None)
+        self._inserted.clear()
+
+    def clear(self) -> None:
+        """Forget all rows after they were committed or discarded."""
+        for bulk_table in self._tables.values():
+            bulk_table.pending.clear()
+        self._inserted.clear()
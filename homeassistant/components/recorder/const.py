@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 from typing import TYPE_CHECKING
 
 from homeassistant.const import (
@@ -80,3 +80,18 @@ class SupportedDialect(StrEnum):
     SQLITE = "sqlite"
     MYSQL = "mysql"
     POSTGRESQL = "postgresql"
+
+
+class PartitionInterval(StrEnum):
+    """Periods covered by the partitions of the states and events tables."""
+
+    DAILY = "daily"
+    MONTHLY = "monthly"
+
+
+class StatisticsRollupPeriod(IntEnum):
+    """Periods the hourly statistics are rolled up to."""
+
+    DAY = 1
+    WEEK = 2
+    MONTH = 3
@@ -7,12 +7,14 @@ from collections.abc import Callable, Iterable
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 import queue
 import sqlite3
 import threading
 import time
 from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import quote
 
 from propcache import cached_property
 import psutil_home_assistant as ha_psutil
@@ -49,7 +51,9 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
-from . import migration, statistics
+from . import archive, migration, partitions, statistics
+from .accumulator import ShortTermStatisticsAccumulator
+from .bulk_writer import BulkWriter
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -63,6 +67,7 @@ from .const import (
     MYSQLDB_URL_PREFIX,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
+    PartitionInterval,
     SupportedDialect,
 )
 from .db_schema import (
@@ -78,10 +83,14 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .history.cache import HistoryCache
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
-from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .pool import POOL_SIZE, MutexPool, PoolWaitStatistics, ReadOnlyPool, RecorderPool
+from .purge import PurgeProgress
+from .queries import delete_all_logbook_rows, find_logbook_oldest_time_fired
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
+from .table_managers.logbook import LogbookManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
 from .table_managers.states import StatesManager
@@ -90,6 +99,7 @@ from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
     AdjustLRUSizeTask,
     AdjustStatisticsTask,
+    ArchiveTask,
     ChangeStatisticsUnitTask,
     ClearStatisticsTask,
     CommitTask,
@@ -99,6 +109,7 @@ from .tasks import (
     KeepAliveTask,
     PerodicCleanupTask,
     PurgeTask,
+    RebuildStatisticsRollupsTask,
     RecorderTask,
     StatisticsTask,
     StopTask,
@@ -116,6 +127,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_only_sqlite_connection,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -164,6 +176,11 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        *,
+        bulk_insert: bool = False,
+        partition_interval: PartitionInterval | None = None,
+        archive_after_days: int | None = None,
+        logbook_table: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -181,6 +198,28 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.bulk_insert = bulk_insert
+        self._bulk_writer: BulkWriter | None = None
+        self.partition_interval = partition_interval
+        self.archive_after_days = archive_after_days
+        # Timestamp of the newest archived state, or None if nothing is archived
+        self.states_archived_until: float | None = None
+        self.purge_progress: PurgeProgress | None = None
+        # Timestamp of the newest committed state, history before it is
+        # cached since no more states are recorded during it
+        self.states_committed_until: float | None = None
+        self._states_pending_since: float | None = None
+        self._states_pending_until: float | None = None
+        self.history_cache = HistoryCache()
+        self.logbook_table = logbook_table
+        # Timestamp since which the logbook table has all entries,
+        # or None if it is not written
+        self.logbook_table_since: float | None = None
+        # Time zone of the statistics rollups, they are used once they are
+        # rebuilt for all statistics
+        self.statistics_rollup_time_zone: str | None = None
+        self.statistics_rollups_ready = False
+        self.statistics_rollup_verified_ids: set[int] = set()
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -211,9 +250,13 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.logbook_manager = LogbookManager(self)
+        self.statistics_accumulator = ShortTermStatisticsAccumulator()
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._read_only_engine: Engine | None = None
+        self._get_read_only_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.migration_in_progress = False
         self.migration_is_live = False
@@ -265,6 +308,34 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_only_session(self) -> Session:
+        """Get a new sqlalchemy session for reading.
+
+        On SQLite, sessions outside the recorder thread use a separate pool
+        of read only connections so long queries do not hold up the recorder
+        thread. The recorder thread always uses its own connection since it
+        must see the writes of its event session.
+        """
+        if (
+            self._get_read_only_session is None
+            or threading.get_ident() == self.thread_id
+        ):
+            return self.get_session()
+        return self._get_read_only_session()
+
+    @property
+    def pool_wait_statistics(self) -> dict[str, PoolWaitStatistics]:
+        """Return the time spent waiting for connections by pool."""
+        return {
+            name: wait_statistics
+            for name, engine in (
+                ("database", self.engine),
+                ("read_only", self._read_only_engine),
+            )
+            if engine
+            and (wait_statistics := getattr(engine.pool, "wait_statistics", None))
+        }
+
     def queue_task(self, task: RecorderTask | Event) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -508,7 +579,10 @@ class Recorder(threading.Thread):
 
     @callback
     def async_nightly_tasks(self, now: datetime) -> None:
-        """Trigger the purge."""
+        """Trigger the archive and the purge."""
+        if self.archive_after_days:
+            archive_before = dt_util.utcnow() - timedelta(days=self.archive_after_days)
+            self.queue_task(ArchiveTask(archive_before))
         if self.auto_purge:
             # Purge will schedule the periodic cleanups
             # after it completes to ensure it does not happen
@@ -688,7 +762,8 @@ class Recorder(threading.Thread):
     def _add_to_session(self, session: Session, obj: object) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        if self._bulk_writer is None or not self._bulk_writer.add(obj):
+            session.add(obj)
 
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
@@ -779,6 +854,11 @@ class Recorder(threading.Thread):
             self._dismiss_migration_in_progress()
             self._setup_run()
 
+        if self.partition_interval:
+            self._setup_partitions()
+
+        # Bring the statistics rollups up to date before more hours are compiled
+        self.queue_statistics_rollup_rebuild()
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
@@ -1013,6 +1093,11 @@ class Recorder(threading.Thread):
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
+        if self.logbook_table and (
+            logbook_entry := self.logbook_manager.entry_from_event(event)
+        ):
+            assert self.event_session is not None
+            self._add_to_session(self.event_session, logbook_entry)
         # Commit if the commit interval is zero
         if not self.commit_interval:
             self._commit_event_session_or_retry()
@@ -1145,6 +1230,15 @@ class Recorder(threading.Thread):
             dbstate.state_attributes = dbstate_attributes
 
         self._add_to_session(session, dbstate)
+        if (last_updated_ts := dbstate.last_updated_ts) is not None:
+            if (
+                self._states_pending_since is None
+                or last_updated_ts < self._states_pending_since
+            ):
+                self._states_pending_since = last_updated_ts
+            self._states_pending_until = last_updated_ts
+        if new_state := event.data["new_state"]:
+            self.statistics_accumulator.add_state(entity_id, new_state)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1192,6 +1286,16 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if bulk_writer := self._bulk_writer:
+            try:
+                bulk_writer.flush(session)
+            except Exception:
+                # Like a failed ORM flush, discard the partial
+                # transaction so the rows can be written again
+                session.rollback()
+                bulk_writer.rollback()
+                raise
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1207,9 +1311,17 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
-        session.commit()
+        try:
+            session.commit()
+        except Exception:
+            if bulk_writer:
+                bulk_writer.rollback()
+            raise
 
         self._event_session_has_pending_writes = False
+        if bulk_writer:
+            bulk_writer.clear()
+        self._post_commit_states()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1227,6 +1339,21 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _post_commit_states(self) -> None:
+        """Advance the history which no more states are recorded during."""
+        if (pending_until := self._states_pending_until) is None:
+            return
+        assert self._states_pending_since is not None
+        if (
+            self.states_committed_until is not None
+            and self._states_pending_since < self.states_committed_until
+        ):
+            # The clock went backwards, states were recorded
+            # during history which may have been cached
+            self.history_cache.clear()
+        self.states_committed_until = pending_until
+        self._states_pending_since = self._states_pending_until = None
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1234,6 +1361,7 @@ class Recorder(threading.Thread):
         finally:
             self._close_connection()
         move_away_broken_database(dburl_to_path(self.db_url))
+        self.history_cache.clear()
         self.recorder_runs_manager.reset()
         self._setup_recorder()
         if setup_run:
@@ -1247,6 +1375,12 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self.logbook_manager.reset()
+        # States which were not committed may be lost
+        self.statistics_accumulator.reset()
+        self._states_pending_since = self._states_pending_until = None
+        if self._bulk_writer:
+            self._bulk_writer.clear()
 
         if not self.event_session:
             return
@@ -1409,28 +1543,105 @@ class Recorder(threading.Thread):
 
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
+        if self.bulk_insert:
+            if self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+                self._bulk_writer = BulkWriter()
+            else:
+                _LOGGER.warning(
+                    "The %s database does not support bulk inserts, "
+                    "falling back to regular inserts",
+                    self.engine.dialect.name,
+                )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        if self._using_file_sqlite:
+            self._setup_read_only_connection()
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_only_connection(self) -> None:
+        """Set up the pool of read only connections to the SQLite database."""
+        path = quote(dburl_to_path(self.db_url))
+        self._read_only_engine = create_engine(
+            SQLITE_URL_PREFIX,
+            creator=partial(
+                sqlite3.connect,
+                f"file:{path}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            ),
+            poolclass=ReadOnlyPool,
+            future=True,
+        )
+        sqlalchemy_event.listen(
+            self._read_only_engine, "connect", setup_read_only_sqlite_connection
+        )
+        self._get_read_only_session = scoped_session(
+            sessionmaker(bind=self._read_only_engine, future=True)
+        )
+
     def _close_connection(self) -> None:
         """Close the connection."""
         if self.engine:
             self.engine.dispose()
             self.engine = None
+        if self._read_only_engine:
+            self._read_only_engine.dispose()
+            self._read_only_engine = None
+        self._bulk_writer = None
         self._get_session = None
+        self._get_read_only_session = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
         with session_scope(session=self.get_session()) as session:
             end_incomplete_runs(session, self.recorder_runs_manager.recording_start)
             self.recorder_runs_manager.start(session)
+            self.states_archived_until = archive.get_archived_until(session)
+            self._setup_logbook_table(session)
 
         self._open_event_session()
 
+    def _setup_logbook_table(self, session: Session) -> None:
+        """Find since when the logbook table has all entries.
+
+        The entries are deleted when the table is disabled, so the table
+        never has gaps once it is enabled again.
+        """
+        if not self.logbook_table:
+            session.execute(delete_all_logbook_rows())
+            self.logbook_table_since = None
+            return
+        self.logbook_table_since = (
+            session.execute(find_logbook_oldest_time_fired()).scalar()
+            or self.recorder_runs_manager.recording_start.timestamp()
+        )
+
+    def _setup_partitions(self) -> None:
+        """Partition the states and events tables and create upcoming partitions."""
+        if self.dialect_name != SupportedDialect.POSTGRESQL:
+            _LOGGER.warning(
+                "Partitioning the states and events tables is only supported"
+                " with PostgreSQL, ignoring the partition interval"
+            )
+            self.partition_interval = None
+            return
+        assert self.partition_interval is not None
+        try:
+            with session_scope(session=self.get_session()) as session:
+                partitions.migrate_to_partitioned_tables(
+                    session, self.partition_interval, dt_util.utcnow()
+                )
+        except SQLAlchemyError:
+            _LOGGER.exception("Error partitioning the states and events tables")
+            self.partition_interval = None
+
     def _schedule_compile_missing_statistics(self) -> None:
         """Add tasks for missing statistics runs."""
         self.queue_task(CompileMissingStatisticsTask())
 
+    def queue_statistics_rollup_rebuild(self) -> None:
+        """Queue a task to bring the statistics rollups up to date."""
+        self.queue_task(RebuildStatisticsRollupsTask())
+
     def _end_session(self) -> None:
         """End the recorder session."""
         if self.event_session is None:
@@ -94,6 +94,9 @@ TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 TABLE_MIGRATION_CHANGES = "migration_changes"
+TABLE_STATES_ARCHIVE = "states_archive"
+TABLE_STATISTICS_ROLLUP = "statistics_rollup"
+TABLE_LOGBOOK = "logbook"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -116,6 +119,9 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATES_ARCHIVE,
+    TABLE_STATISTICS_ROLLUP,
+    TABLE_LOGBOOK,
 ]
 
 TABLES_TO_CHECK = [
@@ -130,7 +136,10 @@ METADATA_ID_LAST_UPDATED_INDEX_TS = "ix_states_metadata_id_last_updated_ts"
 EVENTS_CONTEXT_ID_BIN_INDEX = "ix_events_context_id_bin"
 STATES_CONTEXT_ID_BIN_INDEX = "ix_states_context_id_bin"
 LEGACY_STATES_EVENT_ID_INDEX = "ix_states_event_id"
+STATES_ARCHIVE_METADATA_ID_START_INDEX = "ix_states_archive_metadata_id_start_ts"
 LEGACY_STATES_ENTITY_ID_LAST_UPDATED_INDEX = "ix_states_entity_id_last_updated_ts"
+LOGBOOK_ENTITY_ID_TIME_FIRED_INDEX = "ix_logbook_entity_id_time_fired_ts"
+LOGBOOK_DEVICE_ID_TIME_FIRED_INDEX = "ix_logbook_device_id_time_fired_ts"
 CONTEXT_ID_BIN_MAX_LENGTH = 16
 
 MYSQL_COLLATE = "utf8mb4_unicode_ci"
@@ -228,6 +237,11 @@ BIG_INTEGER_SQL = "BIGINT"
 CONTEXT_BINARY_TYPE = LargeBinary(CONTEXT_ID_BIN_MAX_LENGTH).with_variant(
     NativeLargeBinary(CONTEXT_ID_BIN_MAX_LENGTH), "mysql", "mariadb", "sqlite"
 )
+ARCHIVE_BLOCK_TYPE = (
+    LargeBinary()
+    .with_variant(mysql.LONGBLOB(), "mysql", "mariadb")  # type: ignore[no-untyped-call]
+    .with_variant(NativeLargeBinary(), "sqlite")
+)
 
 TIMESTAMP_TYPE = DOUBLE_TYPE
 
@@ -668,6 +682,88 @@ class StatesMeta(Base):
         )
 
 
+class StatesArchive(Base):
+    """Archived states of an entity, stored as a compressed block.
+
+    See archive.py for the format of the block.
+    """
+
+    __table_args__ = (
+        Index(STATES_ARCHIVE_METADATA_ID_START_INDEX, "metadata_id", "start_ts"),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATES_ARCHIVE
+    archive_id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    metadata_id: Mapped[int] = mapped_column(
+        ID_TYPE, ForeignKey("states_meta.metadata_id")
+    )
+    start_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+    end_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE, index=True)
+    row_count: Mapped[int] = mapped_column(Integer)
+    block: Mapped[bytes] = mapped_column(ARCHIVE_BLOCK_TYPE)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.StatesArchive("
+            f"id={self.archive_id}, metadata_id={self.metadata_id}, "
+            f"start_ts={self.start_ts}, end_ts={self.end_ts}, "
+            f"row_count={self.row_count}"
+            ")>"
+        )
+
+
+class Logbook(Base):
+    """Logbook entries of entities and devices with the origin of their context.
+
+    Only written when the logbook table is enabled, see
+    table_managers/logbook.py.
+    """
+
+    __table_args__ = (
+        Index(LOGBOOK_ENTITY_ID_TIME_FIRED_INDEX, "entity_id", "time_fired_ts"),
+        Index(LOGBOOK_DEVICE_ID_TIME_FIRED_INDEX, "device_id", "time_fired_ts"),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_LOGBOOK
+    logbook_id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    time_fired_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE, index=True)
+    entity_id: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_ENTITY_ID))
+    device_id: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_ENTITY_ID))
+    # None for state changes
+    event_type: Mapped[str | None] = mapped_column(String(MAX_LENGTH_EVENT_EVENT_TYPE))
+    event_data: Mapped[str | None] = mapped_column(
+        Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
+    )
+    state: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_STATE))
+    icon: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_STATE))
+    context_id_bin: Mapped[bytes | None] = mapped_column(CONTEXT_BINARY_TYPE)
+    context_user_id_bin: Mapped[bytes | None] = mapped_column(CONTEXT_BINARY_TYPE)
+    context_parent_id_bin: Mapped[bytes | None] = mapped_column(CONTEXT_BINARY_TYPE)
+    # The event or state change which started the context of the entry,
+    # or of its parent context if the entry started its own context
+    context_event_type: Mapped[str | None] = mapped_column(
+        String(MAX_LENGTH_EVENT_EVENT_TYPE)
+    )
+    context_entity_id: Mapped[str | None] = mapped_column(
+        String(MAX_LENGTH_STATE_ENTITY_ID)
+    )
+    context_state: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_STATE))
+    context_event_data: Mapped[str | None] = mapped_column(
+        Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.Logbook("
+            f"id={self.logbook_id}, time_fired_ts={self.time_fired_ts}, "
+            f"entity_id='{self.entity_id}', device_id='{self.device_id}', "
+            f"event_type='{self.event_type}', state='{self.state}'"
+            ")>"
+        )
+
+
 class StatisticsBase:
     """Statistics base class."""
 
@@ -789,6 +885,55 @@ class LegacyStatisticsShortTerm(LegacyBase, _StatisticsShortTerm):
     )
 
 
+class StatisticsRollup(Base):
+    """Hourly statistics rolled up to a day, week or month.
+
+    The periods start at midnight in the time zone the rollups were
+    built in. mean_sum and mean_count hold the sum and the number of the
+    hourly means, while last_reset_ts, state and sum are those of the
+    hour starting at last_start_ts, the last hour of the period.
+    """
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_rollup_metadata_id_period_start_ts",
+            "metadata_id",
+            "period",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_ROLLUP
+    id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    metadata_id: Mapped[int] = mapped_column(
+        ID_TYPE,
+        ForeignKey(f"{TABLE_STATISTICS_META}.id", ondelete="CASCADE"),
+    )
+    period: Mapped[int] = mapped_column(SmallInteger)
+    time_zone: Mapped[str] = mapped_column(String(64))
+    start_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+    end_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+    last_start_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+    mean_sum: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    mean_count: Mapped[int] = mapped_column(Integer)
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    last_reset_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    state: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    sum: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.StatisticsRollup("
+            f"id={self.id}, metadata_id={self.metadata_id}, "
+            f"period={self.period}, start_ts={self.start_ts}, "
+            f"time_zone={self.time_zone}"
+            ")>"
+        )
+
+
 class _StatisticsMeta:
     """Statistics meta data."""
 
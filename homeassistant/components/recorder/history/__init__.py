@@ -13,8 +13,10 @@ from homeassistant.helpers.recorder import get_instance
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    NumericStatesAggregate,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
+    get_numeric_states_aggregates_with_session as _modern_get_numeric_states_aggregates_with_session,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
@@ -24,8 +26,10 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "NumericStatesAggregate",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
+    "get_numeric_states_aggregates_with_session",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
@@ -80,6 +84,25 @@ def get_last_state_changes(
     return _target(hass, number_of_states, entity_id)
 
 
+def get_numeric_states_aggregates_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+) -> dict[str, list[NumericStatesAggregate]]:
+    """Return the aggregates of the numeric states of entities during a period.
+
+    Nothing is aggregated before the states are migrated to the states_meta
+    table, the states of the entities have to be processed one by one.
+    """
+    if not get_instance(hass).states_meta_manager.active:
+        return {}
+    return _modern_get_numeric_states_aggregates_with_session(
+        hass, session, start_time, end_time, entity_ids
+    )
+
+
 def get_significant_states(
     hass: HomeAssistant,
     start_time: datetime,
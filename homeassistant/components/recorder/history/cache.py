@@ -0,0 +1,250 @@
+"""Cache the states of closed periods of the history.
+
+History is split into periods aligned to the hour. Once a period ended
+before the newest committed state, no more states are recorded during
+it, so its states can be reused by later history queries for the same
+entities. Only the periods which are still open are queried from the
+database each time.
+
+The states of each period are cached compressed, the least recently
+used periods are evicted when the cache grows over its size. Purging
+states invalidates the periods they were recorded in, and periods
+before a purge are not cached again.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+import math
+import threading
+from typing import Any, NamedTuple
+import zlib
+
+from sqlalchemy.engine.row import Row
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+from ..archive import ArchivedState
+
+PERIOD_SECONDS = 3600
+
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+# Estimated size of a cached period besides its compressed states
+_ENTRY_OVERHEAD_BYTES = 200
+
+
+class CachedState(NamedTuple):
+    """A state read from the cache.
+
+    Like archived states, the fields match the columns of the history
+    queries.
+    """
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    last_reported_ts: float | None
+    attributes: str | None
+
+
+def _cached_state(row: Row | ArchivedState) -> CachedState:
+    """Return the cached state of a row of a history query."""
+    return CachedState(
+        row.metadata_id,
+        row.state,
+        row.last_updated_ts,
+        getattr(row, "last_changed_ts", None),
+        getattr(row, "last_reported_ts", None),
+        getattr(row, "attributes", None),
+    )
+
+
+def _encode(states: list[CachedState]) -> bytes:
+    """Encode the states of a period."""
+    return zlib.compress(json_bytes([tuple(state) for state in states]))
+
+
+def _decode(data: bytes) -> list[CachedState]:
+    """Decode the states of a period."""
+    rows: list[list[Any]] = json_loads(zlib.decompress(data))  # type: ignore[assignment]
+    return [CachedState(*row) for row in rows]
+
+
+class HistoryCache:
+    """Cache the states of closed periods of the history.
+
+    The cache is shared by the history queries, which run in the
+    executor, and the recorder thread which invalidates it.
+    """
+
+    def __init__(self, max_bytes: int = MAX_CACHE_BYTES) -> None:
+        """Initialize the cache."""
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._periods: OrderedDict[tuple[Hashable, tuple[int, ...], int], bytes] = (
+            OrderedDict()
+        )
+        self._size = 0
+        # Incremented when periods are invalidated, so periods which were
+        # queried before are not added to the cache
+        self._generation = 0
+        self._purged_before = 0.0
+        self._entities_purged_before: dict[int, float] = {}
+
+    @property
+    def size(self) -> int:
+        """Return the estimated size of the cache in bytes."""
+        return self._size
+
+    def closed_periods(
+        self,
+        metadata_ids: tuple[int, ...],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        committed_until: float | None,
+    ) -> range:
+        """Return the starts of the closed periods between start_time_ts and end_time_ts.
+
+        Periods start after start_time_ts, since states at the start time
+        are not part of the history, and after the newest purge of the
+        entities.
+        """
+        if committed_until is None:
+            return range(0)
+        with self._lock:
+            purged_before = max(
+                [
+                    self._purged_before,
+                    *(
+                        self._entities_purged_before.get(id_, 0.0)
+                        for id_ in metadata_ids
+                    ),
+                ]
+            )
+        first_start = max(
+            (int(start_time_ts) // PERIOD_SECONDS + 1) * PERIOD_SECONDS,
+            math.ceil(purged_before / PERIOD_SECONDS) * PERIOD_SECONDS,
+        )
+        end_ts = (
+            committed_until
+            if end_time_ts is None
+            else min(end_time_ts, committed_until)
+        )
+        return range(
+            first_start,
+            int(end_ts) // PERIOD_SECONDS * PERIOD_SECONDS - PERIOD_SECONDS + 1,
+            PERIOD_SECONDS,
+        )
+
+    def get_states(
+        self,
+        metadata_ids: tuple[int, ...],
+        query_key: Hashable,
+        period_starts: range,
+        fetch: Callable[[float, float], Iterable[Row]],
+    ) -> list[list[CachedState]]:
+        """Return the states of closed periods sorted by metadata_id and time.
+
+        Consecutive periods which are not cached are queried at once with
+        fetch, which returns the states after its start and before its end.
+        """
+        with self._lock:
+            generation = self._generation
+            cached: list[bytes | None] = []
+            for period_start in period_starts:
+                key = (query_key, metadata_ids, period_start)
+                if (data := self._periods.get(key)) is not None:
+                    self._periods.move_to_end(key)
+                cached.append(data)
+        periods = [None if data is None else _decode(data) for data in cached]
+        index = 0
+        while index < len(periods):
+            if periods[index] is not None:
+                index += 1
+                continue
+            end_index = index + 1
+            while end_index < len(periods) and periods[end_index] is None:
+                end_index += 1
+            first_start = period_starts[index]
+            fetched: list[list[CachedState]] = [[] for _ in range(index, end_index)]
+            for row in fetch(
+                # The states at the start of the first period are included
+                math.nextafter(first_start, -math.inf),
+                period_starts[end_index - 1] + PERIOD_SECONDS,
+            ):
+                state = _cached_state(row)
+                fetched[
+                    int((state.last_updated_ts - first_start) // PERIOD_SECONDS)
+                ].append(state)
+            periods[index:end_index] = fetched
+            self._add_periods(
+                generation,
+                [
+                    ((query_key, metadata_ids, period_starts[index + offset]), states)
+                    for offset, states in enumerate(fetched)
+                ],
+            )
+            index = end_index
+        return periods  # type: ignore[return-value]
+
+    def _add_periods(
+        self,
+        generation: int,
+        periods: list[tuple[tuple[Hashable, tuple[int, ...], int], list[CachedState]]],
+    ) -> None:
+        """Add periods and evict the least recently used ones over the size."""
+        encoded = [(key, _encode(states)) for key, states in periods]
+        with self._lock:
+            if generation != self._generation:
+                return
+            for key, data in encoded:
+                if (size := len(data) + _ENTRY_OVERHEAD_BYTES) > self._max_bytes:
+                    continue
+                if (previous := self._periods.pop(key, None)) is not None:
+                    self._size -= len(previous) + _ENTRY_OVERHEAD_BYTES
+                self._periods[key] = data
+                self._size += size
+            while self._size > self._max_bytes:
+                _, data = self._periods.popitem(last=False)
+                self._size -= len(data) + _ENTRY_OVERHEAD_BYTES
+
+    def invalidate_before(self, purge_before_ts: float) -> None:
+        """Invalidate the periods with states before purge_before_ts."""
+        with self._lock:
+            self._purged_before = max(self._purged_before, purge_before_ts)
+            self._invalidate(
+                lambda metadata_ids, period_start: period_start < purge_before_ts
+            )
+
+    def invalidate_entities(
+        self, metadata_ids: Iterable[int], purge_before_ts: float
+    ) -> None:
+        """Invalidate the periods with states of entities before purge_before_ts."""
+        with self._lock:
+            purged_ids = set(metadata_ids)
+            for metadata_id in purged_ids:
+                self._entities_purged_before[metadata_id] = max(
+                    self._entities_purged_before.get(metadata_id, 0.0),
+                    purge_before_ts,
+                )
+            self._invalidate(
+                lambda ids, period_start: period_start < purge_before_ts
+                and not purged_ids.isdisjoint(ids)
+            )
+
+    def _invalidate(self, predicate: Callable[[tuple[int, ...], int], bool]) -> None:
+        """Remove the periods matching predicate, the lock must be held."""
+        self._generation += 1
+        for key in [key for key in self._periods if predicate(key[1], key[2])]:
+            self._size -= len(self._periods.pop(key)) + _ENTRY_OVERHEAD_BYTES
+
+    def clear(self) -> None:
+        """Remove all periods."""
+        with self._lock:
+            self._generation += 1
+            self._periods.clear()
+            self._size = 0
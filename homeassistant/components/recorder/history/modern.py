@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections import defaultdict
+from collections.abc import Callable, Collection, Hashable, Iterable, Iterator
 from datetime import datetime
+from functools import partial
+from heapq import merge
 from itertools import groupby
+import math
 from operator import itemgetter
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 from sqlalchemy import (
+    ColumnElement,
     CompoundSelect,
+    Float,
     Select,
     Subquery,
     and_,
+    case,
     func,
     lambda_stmt,
     literal,
     select,
+    type_coerce,
     union_all,
 )
 from sqlalchemy.engine.row import Row
@@ -27,7 +35,8 @@ from homeassistant.core import HomeAssistant, State, split_entity_id
 from homeassistant.helpers.recorder import get_instance
 import homeassistant.util.dt as dt_util
 
-from ..const import LAST_REPORTED_SCHEMA_VERSION
+from ..archive import ArchivedState, get_archived_start_states, get_archived_states
+from ..const import LAST_REPORTED_SCHEMA_VERSION, SupportedDialect
 from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, States
 from ..filters import Filters
 from ..models import (
@@ -37,7 +46,9 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..models.state_attributes import decode_attributes_from_source
 from ..util import execute_stmt_lambda_element, session_scope
+from .cache import PERIOD_SECONDS, CachedState
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -45,11 +56,27 @@ from .const import (
     STATE_KEY,
 )
 
+if TYPE_CHECKING:
+    from .. import Recorder
+
 _FIELD_MAP = {
     "metadata_id": 0,
     "state": 1,
     "last_updated_ts": 2,
 }
+_SORT_KEY = itemgetter(_FIELD_MAP["metadata_id"], _FIELD_MAP["last_updated_ts"])
+# Numbers which the database converts like float(). With at most 20 digits
+# before and after the point and exponents up to 287, they are normal doubles
+_NUMERIC_STATE_PATTERN = (
+    r"^[-+]?([0-9]{1,20}([.][0-9]{0,20})?|[.][0-9]{1,20})"
+    r"([eE][-+]?([0-9]{1,2}|1[0-9]{2}|2[0-7][0-9]|28[0-7]))?$"
+)
+# Characters float() never accepts: ASCII letters other than e and ASCII
+# punctuation other than signs, points and underscores
+_NON_NUMERIC_STATE_PATTERN = r"[!-*,/:-@\[-^`a-df-z\{-~A-DF-Z]"
+_NON_NUMERIC_STATE_GLOB = "*[!-*,/:-@[-^`a-df-z{-~A-DF-Z]*"
+# Largest double, larger numbers are not finite
+_MAX_FLOAT = 1.7976931348623157e308
 
 
 def _stmt_and_join_attributes(
@@ -201,6 +228,101 @@ def _significant_states_stmt(
     ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
 
 
+def _significant_states_rows(
+    session: Session,
+    archived_until: float | None,
+    single_metadata_id: int | None,
+    metadata_ids: list[int],
+    metadata_ids_in_significant_domains: list[int],
+    significant_changes_only: bool,
+    no_attributes: bool,
+    run_start_ts: float | None,
+    start_time_ts: float,
+    end_time_ts: float | None,
+    include_start_time_state: bool,
+) -> Iterable[Row]:
+    """Return the significant states during a period, including archived states."""
+    stmt = lambda_stmt(
+        lambda: _significant_states_stmt(
+            start_time_ts,
+            end_time_ts,
+            single_metadata_id,
+            metadata_ids,
+            metadata_ids_in_significant_domains,
+            significant_changes_only,
+            no_attributes,
+            include_start_time_state,
+            run_start_ts,
+        ),
+        track_on=[
+            bool(single_metadata_id),
+            bool(metadata_ids_in_significant_domains),
+            bool(end_time_ts),
+            significant_changes_only,
+            no_attributes,
+            include_start_time_state,
+        ],
+    )
+    states: Iterable[Row] = execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    if archived_until is not None:
+        states = _merge_archived_states(
+            session,
+            states,
+            archived_until,
+            metadata_ids,
+            start_time_ts,
+            end_time_ts,
+            include_start_time_state,
+            significant_changes_only,
+            metadata_ids_in_significant_domains,
+            no_attributes,
+        )
+    return states
+
+
+def _states_with_history_cache(
+    instance: Recorder,
+    metadata_ids: list[int],
+    query_key: Hashable,
+    start_time_ts: float,
+    end_time_ts: float | None,
+    include_start_time_state: bool,
+    fetch: Callable[[float, float | None, bool], Iterable[Row]],
+) -> Iterable[Row]:
+    """Return the states during a period, reusing the cached closed periods.
+
+    fetch queries the states after its start and before its end, only
+    the states before the first and after the last closed period are
+    queried each time.
+    """
+    cache = instance.history_cache
+    cached_metadata_ids = tuple(sorted(metadata_ids))
+    if not (
+        period_starts := cache.closed_periods(
+            cached_metadata_ids,
+            start_time_ts,
+            end_time_ts,
+            instance.states_committed_until,
+        )
+    ):
+        return fetch(start_time_ts, end_time_ts, include_start_time_state)
+    parts: list[Iterable[Row | CachedState]] = [
+        fetch(start_time_ts, period_starts[0], include_start_time_state),
+        *cache.get_states(
+            cached_metadata_ids,
+            query_key,
+            period_starts,
+            lambda start_ts, end_ts: fetch(start_ts, end_ts, False),
+        ),
+    ]
+    closed_until = period_starts[-1] + PERIOD_SECONDS
+    if not end_time_ts or closed_until < end_time_ts:
+        # The states at the end of the last closed period are not cached
+        parts.append(fetch(math.nextafter(closed_until, -math.inf), end_time_ts, False))
+    # Cached states have the same fields as the rows
+    return cast(Iterable[Row], merge(*parts, key=_SORT_KEY))
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -254,29 +376,32 @@ def get_significant_states_with_session(
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
-    stmt = lambda_stmt(
-        lambda: _significant_states_stmt(
-            start_time_ts,
-            end_time_ts,
+    states = _states_with_history_cache(
+        instance,
+        metadata_ids,
+        (
+            "significant_states",
+            tuple(sorted(metadata_ids_in_significant_domains)),
+            significant_changes_only,
+            no_attributes,
+        ),
+        start_time_ts,
+        end_time_ts,
+        include_start_time_state,
+        partial(
+            _significant_states_rows,
+            session,
+            instance.states_archived_until,
             single_metadata_id,
             metadata_ids,
             metadata_ids_in_significant_domains,
             significant_changes_only,
             no_attributes,
-            include_start_time_state,
             run_start_ts,
         ),
-        track_on=[
-            bool(single_metadata_id),
-            bool(metadata_ids_in_significant_domains),
-            bool(end_time_ts),
-            significant_changes_only,
-            no_attributes,
-            include_start_time_state,
-        ],
     )
     return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        states,
         start_time_ts if include_start_time_state else None,
         entity_ids,
         entity_id_to_metadata_id,
@@ -319,6 +444,232 @@ def get_full_significant_states_with_session(
     )
 
 
+class NumericStatesAggregate(NamedTuple):
+    """Aggregate of the numeric states of an entity with the same attributes.
+
+    Each state is weighted by the time until the next numeric state of the
+    entity, or until the end of the period for the last state.
+    """
+
+    attributes: dict[str, Any] | None
+    first_ts: float
+    duration: float
+    weighted_sum: float
+    min: float
+    max: float
+
+
+def _numeric_state_filter(
+    dialect_name: SupportedDialect | None, state: ColumnElement
+) -> ColumnElement[bool]:
+    """Return a filter for states which the database converts like float().
+
+    Only finite numbers are included.
+    """
+    if dialect_name == SupportedDialect.SQLITE:
+        # SQLite has no regular expressions, but numbers are valid JSON.
+        # JSON5 also allows hexadecimal numbers, Infinity and NaN.
+        return (
+            case((func.json_valid(state) == 1, func.json_type(state)), else_=None).in_(
+                ("integer", "real")
+            )
+            & ~state.op("GLOB")(_NON_NUMERIC_STATE_GLOB)
+            & (func.abs(state.cast(Float)) <= _MAX_FLOAT)
+        )
+    return state.regexp_match(_NUMERIC_STATE_PATTERN)
+
+
+def _maybe_numeric_state_filter(
+    dialect_name: SupportedDialect | None, state: ColumnElement
+) -> ColumnElement[bool]:
+    """Return a filter for states which float() may accept.
+
+    These are states with a digit or a non ASCII character, which may be a
+    digit or a space, and without characters float() never accepts.
+    """
+    if dialect_name == SupportedDialect.SQLITE:
+        return ~state.op("GLOB")(_NON_NUMERIC_STATE_GLOB) & (
+            state.op("GLOB")("*[0-9]*") | state.op("GLOB")("*[^ -~]*")
+        )
+    return ~state.regexp_match(_NON_NUMERIC_STATE_PATTERN) & state.regexp_match(
+        r"[0-9]|[^\x01-\x7f]"
+    )
+
+
+def _numeric_state_value(
+    dialect_name: SupportedDialect | None, state: ColumnElement
+) -> ColumnElement[float]:
+    """Return the value of a numeric state."""
+    if dialect_name == SupportedDialect.MYSQL:
+        # Not all supported versions of MySQL and MariaDB can cast to a float
+        return type_coerce(state, Float) + 0.0
+    return state.cast(Float)
+
+
+def _numeric_states_aggregates_stmt(
+    dialect_name: SupportedDialect | None,
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: list[int],
+    run_start_ts: float | None,
+) -> Select:
+    """Return the aggregates of the numeric states during a period."""
+    stmt = select(
+        States.metadata_id,
+        States.state,
+        States.last_updated_ts,
+        States.attributes_id,
+    ).filter(
+        (
+            (States.last_changed_ts == States.last_updated_ts)
+            | States.last_changed_ts.is_(None)
+        )
+        & States.metadata_id.in_(metadata_ids)
+        & (States.last_updated_ts >= start_time_ts)
+        & (States.last_updated_ts < end_time_ts)
+    )
+    states = (
+        union_all(
+            _get_start_time_state_for_entities_stmt(
+                run_start_ts, start_time_ts, metadata_ids, True, False
+            ).add_columns(States.attributes_id),
+            stmt,
+        )
+        if run_start_ts
+        else stmt
+    ).subquery()
+    # The start state is clamped to the start of the period
+    state_start_ts = case(
+        (states.c.last_updated_ts < start_time_ts, start_time_ts),
+        else_=states.c.last_updated_ts,
+    )
+    # States which float() may accept but the database does not convert are
+    # marked as unconverted, the states of their entity must be loaded
+    converted = _numeric_state_filter(dialect_name, states.c.state)
+    numeric_states = (
+        select(
+            states.c.metadata_id,
+            states.c.attributes_id,
+            case(
+                (converted, _numeric_state_value(dialect_name, states.c.state)),
+                else_=None,
+            ).label("value"),
+            case((converted, 0), else_=1).label("unconverted"),
+            state_start_ts.label("start_ts"),
+            func.coalesce(
+                func.lead(state_start_ts).over(
+                    partition_by=states.c.metadata_id,
+                    order_by=states.c.last_updated_ts,
+                ),
+                end_time_ts,
+            ).label("end_ts"),
+        )
+        .filter(converted | _maybe_numeric_state_filter(dialect_name, states.c.state))
+        .subquery()
+    )
+    duration = numeric_states.c.end_ts - numeric_states.c.start_ts
+    aggregates = (
+        select(
+            numeric_states.c.metadata_id,
+            numeric_states.c.attributes_id,
+            func.min(numeric_states.c.start_ts).label("first_ts"),
+            func.sum(duration).label("duration"),
+            func.sum(numeric_states.c.value * duration).label("weighted_sum"),
+            func.min(numeric_states.c.value).label("min"),
+            func.max(numeric_states.c.value).label("max"),
+            func.max(numeric_states.c.unconverted).label("unconverted"),
+        )
+        .group_by(numeric_states.c.metadata_id, numeric_states.c.attributes_id)
+        .subquery()
+    )
+    return select(
+        aggregates.c.metadata_id,
+        StateAttributes.shared_attrs,
+        aggregates.c.attributes_id,
+        aggregates.c.first_ts,
+        aggregates.c.duration,
+        aggregates.c.weighted_sum,
+        aggregates.c.min,
+        aggregates.c.max,
+        aggregates.c.unconverted,
+    ).outerjoin(
+        StateAttributes, aggregates.c.attributes_id == StateAttributes.attributes_id
+    )
+
+
+def get_numeric_states_aggregates_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+) -> dict[str, list[NumericStatesAggregate]]:
+    """Return the aggregates of the numeric states of entities during a period.
+
+    The time weighted sum, min and max of the numeric states are computed
+    by the database, grouped by the attributes of the states. The last
+    state before start_time is included like the start state of the
+    history, and only significant states are aggregated.
+
+    Entities without numeric states are not included. When states are
+    archived, entities without a start state in the states table are
+    not included either since their start state may be in the archive.
+    """
+    instance = get_instance(hass)
+    start_time_ts = start_time.timestamp()
+    end_time_ts = end_time.timestamp()
+    archived_until = instance.states_archived_until
+    if archived_until is not None and start_time_ts < archived_until:
+        return {}
+    if not (
+        entity_id_to_metadata_id := instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+    ) or not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+        return {}
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    run_start_ts = _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    dialect_name = instance.dialect_name
+    stmt = lambda_stmt(
+        lambda: _numeric_states_aggregates_stmt(
+            dialect_name, start_time_ts, end_time_ts, metadata_ids, run_start_ts
+        ),
+        track_on=[dialect_name, bool(run_start_ts)],
+    )
+    attr_cache: dict[str, dict[str, Any]] = {}
+    result: dict[str, list[NumericStatesAggregate]] = defaultdict(list)
+    unconverted_entity_ids: set[str] = set()
+    for row in execute_stmt_lambda_element(session, stmt, orm_rows=False):
+        if row.unconverted:
+            unconverted_entity_ids.add(metadata_id_to_entity_id[row.metadata_id])
+            continue
+        result[metadata_id_to_entity_id[row.metadata_id]].append(
+            NumericStatesAggregate(
+                None
+                if row.attributes_id is None
+                else decode_attributes_from_source(row.shared_attrs, attr_cache),
+                row.first_ts,
+                row.duration,
+                row.weighted_sum,
+                row.min,
+                row.max,
+            )
+        )
+    for entity_id in unconverted_entity_ids:
+        result.pop(entity_id, None)
+    if archived_until is not None:
+        return {
+            entity_id: aggregates
+            for entity_id, aggregates in result.items()
+            if min(aggregate.first_ts for aggregate in aggregates) == start_time_ts
+        }
+    return result
+
+
 def _state_changed_during_period_stmt(
     start_time_ts: float,
     end_time_ts: float | None,
@@ -437,12 +788,27 @@ def state_changes_during_period(
                 has_last_reported,
             ],
         )
+        states: Iterable[Row] = execute_stmt_lambda_element(
+            session, stmt, None, end_time, orm_rows=False
+        )
+        if (archived_until := instance.states_archived_until) is not None:
+            states = _merge_archived_states(
+                session,
+                states,
+                archived_until,
+                [single_metadata_id],
+                start_time_ts,
+                end_time_ts,
+                include_start_time_state,
+                True,
+                (),
+                no_attributes,
+                limit,
+            )
         return cast(
             dict[str, list[State]],
             _sorted_states_to_dict(
-                execute_stmt_lambda_element(
-                    session, stmt, None, end_time, orm_rows=False
-                ),
+                states,
                 start_time_ts if include_start_time_state else None,
                 entity_ids,
                 entity_id_to_metadata_id,
@@ -671,6 +1037,83 @@ def _get_single_entity_start_time_stmt(
     )
 
 
+def _merge_archived_states(
+    session: Session,
+    states: Iterable[Row],
+    archived_until: float,
+    metadata_ids: list[int],
+    start_time_ts: float,
+    end_time_ts: float | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    metadata_ids_in_significant_domains: Collection[int],
+    no_attributes: bool,
+    limit: int | None = None,
+) -> Iterable[Row]:
+    """Merge the archived states into the states sorted by metadata_id and time.
+
+    The archive is only read for periods that start before the newest
+    archived state, and for the start states of entities which have no
+    state before the start time left in the states table. Archived states
+    have no attributes when no_attributes is set, like the rows.
+    """
+    archived: list[ArchivedState] = []
+    if include_start_time_state:
+        # The start states from the states table are needed to know which
+        # entities need one from the archive, the rows are turned into
+        # states by the caller anyway
+        states = list(states)
+        metadata_id_idx = _FIELD_MAP["metadata_id"]
+        last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+        live_start_metadata_ids = {
+            state[metadata_id_idx] for state in states if not state[last_updated_ts_idx]
+        }
+        if missing_metadata_ids := [
+            metadata_id
+            for metadata_id in metadata_ids
+            if metadata_id not in live_start_metadata_ids
+        ]:
+            archived.extend(
+                get_archived_start_states(session, missing_metadata_ids, start_time_ts)
+            )
+    if start_time_ts < archived_until:
+        significant_metadata_ids = set(metadata_ids_in_significant_domains)
+        archived.extend(
+            state
+            for state in get_archived_states(
+                session, metadata_ids, start_time_ts, end_time_ts
+            )
+            if not significant_changes_only
+            or state.last_changed_ts is None
+            or state.metadata_id in significant_metadata_ids
+        )
+    if not archived:
+        return states
+    if no_attributes:
+        archived = [state._replace(attributes=None) for state in archived]
+    archived.sort(key=_SORT_KEY)
+    merged = merge(states, archived, key=_SORT_KEY)
+    # Archived states have the same fields as the rows
+    return cast(Iterable[Row], merged if not limit else _limit_states(merged, limit))
+
+
+def _limit_states(
+    states: Iterable[Row | ArchivedState], limit: int
+) -> Iterator[Row | ArchivedState]:
+    """Return at most limit states that are not start states.
+
+    Start states have a last_updated_ts of 0.
+    """
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    count = 0
+    for state in states:
+        if state[last_updated_ts_idx]:
+            if count == limit:
+                return
+            count += 1
+        yield state
+
+
 def _sorted_states_to_dict(
     states: Iterable[Row],
     start_time_ts: float | None,
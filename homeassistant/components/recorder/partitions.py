@@ -0,0 +1,373 @@
+"""Time partitioned states and events tables on PostgreSQL.
+
+The states and events tables are range partitioned on their timestamp so
+that purging an expired period drops a whole partition instead of deleting
+its rows in batches. Queries that filter on the timestamp, like history
+and logbook queries, only scan the partitions of the requested period.
+
+Partitioning is not available on MariaDB/MySQL and SQLite:
+
+- MariaDB/MySQL can only range partition on an integer expression or on
+  integer, date or string columns, while the timestamps are stored as
+  doubles. Partitioning on a generated integer column would not prune the
+  partitions for the existing queries, which filter on the timestamps,
+  and converting a table rewrites every row of it while it is locked.
+- SQLite has no partitioning. Per-period tables would need a view with
+  triggers in place of the states and events tables for the recorder to
+  write through, and dropping a table does not shrink the database file
+  any more than deleting its rows does.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import re
+
+from sqlalchemy import Table, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.session import Session
+
+from homeassistant.util import dt as dt_util
+
+from .const import PartitionInterval
+from .db_schema import TABLE_EVENTS, TABLE_STATES, Base
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of periods after the current one that have a partition ready
+PARTITIONS_AHEAD = 3
+
+LEGACY_PARTITION_SUFFIX = "legacy"
+DEFAULT_PARTITION_SUFFIX = "default"
+
+_BOUND_RE = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+
+@dataclass(slots=True, frozen=True)
+class PartitionedTable:
+    """A table partitioned on a timestamp column."""
+
+    name: str
+    column: str
+    primary_key: str
+
+
+STATES_PARTITIONED_TABLE = PartitionedTable(TABLE_STATES, "last_updated_ts", "state_id")
+EVENTS_PARTITIONED_TABLE = PartitionedTable(TABLE_EVENTS, "time_fired_ts", "event_id")
+PARTITIONED_TABLES = (STATES_PARTITIONED_TABLE, EVENTS_PARTITIONED_TABLE)
+
+
+@dataclass(slots=True, frozen=True)
+class Partition:
+    """A partition of a partitioned table."""
+
+    name: str
+    start: float | None
+    end: float | None
+
+
+def period_start(moment: datetime, interval: PartitionInterval) -> datetime:
+    """Return the start of the period of a moment."""
+    start = dt_util.as_utc(moment).replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval is PartitionInterval.MONTHLY:
+        return start.replace(day=1)
+    return start
+
+
+def next_period_start(start: datetime, interval: PartitionInterval) -> datetime:
+    """Return the start of the period after the one starting at start."""
+    if interval is PartitionInterval.MONTHLY:
+        return (start + timedelta(days=32)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def partition_name(
+    table: PartitionedTable, start: datetime, interval: PartitionInterval
+) -> str:
+    """Return the name of the partition of the period starting at start."""
+    if interval is PartitionInterval.MONTHLY:
+        return f"{table.name}_{start:%Y%m}"
+    return f"{table.name}_{start:%Y%m%d}"
+
+
+def _quote(session: Session, name: str) -> str:
+    """Quote an identifier."""
+    return session.get_bind().dialect.identifier_preparer.quote(name)
+
+
+def _parse_bound(bound: str) -> float | None:
+    """Parse a partition bound."""
+    if bound == "MINVALUE":
+        return None
+    return float(bound.strip("'"))
+
+
+def is_partitioned(session: Session, table: PartitionedTable) -> bool:
+    """Return if a table is partitioned."""
+    return (
+        session.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": table.name},
+        ).scalar()
+        == "p"
+    )
+
+
+def get_partitions(session: Session, table: PartitionedTable) -> list[Partition]:
+    """Return the range partitions of a table, oldest first."""
+    partitions: list[Partition] = []
+    for name, bound in session.execute(
+        text(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i"
+            " JOIN pg_class c ON c.oid = i.inhrelid"
+            " WHERE i.inhparent = to_regclass(:table)"
+        ),
+        {"table": table.name},
+    ):
+        if match := _BOUND_RE.search(bound):
+            partitions.append(
+                Partition(name, _parse_bound(match[1]), _parse_bound(match[2]))
+            )
+    partitions.sort(key=lambda partition: partition.end or 0)
+    return partitions
+
+
+def get_expired_partitions(
+    session: Session, table: PartitionedTable, purge_before: datetime
+) -> list[Partition]:
+    """Return the partitions that only contain rows older than purge_before."""
+    purge_before_ts = purge_before.timestamp()
+    return [
+        partition
+        for partition in get_partitions(session, table)
+        if partition.end is not None and partition.end <= purge_before_ts
+    ]
+
+
+def migrate_to_partitioned_tables(
+    session: Session, interval: PartitionInterval, now: datetime
+) -> None:
+    """Partition the states and events tables if they are not yet."""
+    boundary = next_period_start(period_start(now, interval), interval)
+    for table in PARTITIONED_TABLES:
+        if not is_partitioned(session, table):
+            _LOGGER.warning(
+                "Partitioning the %s table, this may take a while", table.name
+            )
+            _partition_table(session, table, boundary)
+            session.commit()
+    create_partitions(session, interval, now)
+
+
+def _partition_table(
+    session: Session, table: PartitionedTable, boundary: datetime
+) -> None:
+    """Replace a table with a partitioned table.
+
+    The existing table becomes the partition of all rows before boundary.
+    """
+    quoted_table = _quote(session, table.name)
+    legacy = f"{table.name}_{LEGACY_PARTITION_SUFFIX}"
+    quoted_legacy = _quote(session, legacy)
+    column = _quote(session, table.column)
+    primary_key = _quote(session, table.primary_key)
+    sequence = f"{table.name}_{table.primary_key}_partitioned_seq"
+    quoted_sequence = _quote(session, sequence)
+
+    # The primary key of the partitioned table includes the partition
+    # key, so foreign keys on the id alone have no unique key to reference
+    for referencing_table, constraint in session.execute(
+        text(
+            "SELECT conrelid::regclass::text, conname FROM pg_constraint"
+            " WHERE contype = 'f' AND confrelid = to_regclass(:table)"
+        ),
+        {"table": table.name},
+    ).all():
+        session.execute(
+            text(
+                f"ALTER TABLE {referencing_table}"
+                f" DROP CONSTRAINT {_quote(session, constraint)}"
+            )
+        )
+
+    session.execute(text(f"ALTER TABLE {quoted_table} RENAME TO {quoted_legacy}"))
+    # The primary key of a partitioned table must include the partition
+    # key, it is recreated on the partitioned table when attaching
+    for (constraint,) in session.execute(
+        text(
+            "SELECT conname FROM pg_constraint"
+            " WHERE contype = 'p' AND conrelid = to_regclass(:table)"
+        ),
+        {"table": legacy},
+    ).all():
+        session.execute(
+            text(
+                f"ALTER TABLE {quoted_legacy}"
+                f" DROP CONSTRAINT {_quote(session, constraint)}"
+            )
+        )
+    # Free the index names for the indexes of the partitioned table,
+    # the existing indexes are attached to them instead of being rebuilt
+    for index, (name,) in enumerate(
+        session.execute(
+            text("SELECT indexname FROM pg_indexes WHERE tablename = :table"),
+            {"table": legacy},
+        ).all()
+    ):
+        session.execute(
+            text(
+                f"ALTER INDEX {_quote(session, name)}"
+                f" RENAME TO {_quote(session, f'{legacy}_{index}')}"
+            )
+        )
+    session.execute(
+        text(f"UPDATE {quoted_legacy} SET {column} = 0 WHERE {column} IS NULL")  # noqa: S608
+    )
+    session.execute(
+        text(f"ALTER TABLE {quoted_legacy} ALTER COLUMN {column} SET NOT NULL")
+    )
+    session.execute(
+        text(
+            f"ALTER TABLE {quoted_legacy}"
+            f" ALTER COLUMN {primary_key} DROP IDENTITY IF EXISTS"
+        )
+    )
+
+    session.execute(
+        text(
+            f"CREATE TABLE {quoted_table} (LIKE {quoted_legacy} INCLUDING DEFAULTS)"
+            f" PARTITION BY RANGE ({column})"
+        )
+    )
+    # Identity columns are not supported on partitioned tables before
+    # PostgreSQL 17, use a sequence continuing from the existing rows
+    session.execute(text(f"CREATE SEQUENCE {quoted_sequence} AS BIGINT"))
+    session.execute(
+        text(
+            f"SELECT setval(:sequence, COALESCE((SELECT MAX({primary_key})"  # noqa: S608
+            f" FROM {quoted_legacy}), 0) + 1, false)"
+        ),
+        {"sequence": sequence},
+    )
+    session.execute(
+        text(
+            f"ALTER TABLE {quoted_table} ALTER COLUMN {primary_key}"
+            f" SET DEFAULT nextval('{sequence}')"
+        )
+    )
+    session.execute(
+        text(f"ALTER SEQUENCE {quoted_sequence} OWNED BY {quoted_table}.{primary_key}")
+    )
+    session.execute(
+        text(f"ALTER TABLE {quoted_table} ADD PRIMARY KEY ({primary_key}, {column})")
+    )
+    schema_table: Table = Base.metadata.tables[table.name]
+    for schema_index in schema_table.indexes:
+        schema_index.create(session.connection())
+    session.execute(
+        text(
+            f"ALTER TABLE {quoted_table} ATTACH PARTITION {quoted_legacy}"
+            f" FOR VALUES FROM (MINVALUE) TO ({boundary.timestamp()!r})"
+        )
+    )
+    session.execute(
+        text(
+            f"CREATE TABLE "
+            f"{_quote(session, f'{table.name}_{DEFAULT_PARTITION_SUFFIX}')}"
+            f" PARTITION OF {quoted_table} DEFAULT"
+        )
+    )
+
+
+def create_partitions(
+    session: Session, interval: PartitionInterval, now: datetime
+) -> None:
+    """Create the partitions of the current and next periods.
+
+    Partitions continue from the end of the last partition, so periods
+    the recorder was not running for get their partition as well. Errors
+    creating a partition are logged, the partitions of the other tables
+    are still created.
+    """
+    end = period_start(now, interval)
+    for _ in range(PARTITIONS_AHEAD + 1):
+        end = next_period_start(end, interval)
+    for table in PARTITIONED_TABLES:
+        partitions = get_partitions(session, table)
+        if partitions and (last_end := partitions[-1].end) is not None:
+            start = dt_util.utc_from_timestamp(last_end)
+        else:
+            start = period_start(now, interval)
+        while start < end:
+            # The last partition can end within a period if the
+            # interval was changed
+            partition_end = next_period_start(period_start(start, interval), interval)
+            name = partition_name(table, start, interval)
+            _LOGGER.debug("Creating partition %s", name)
+            try:
+                with session.begin_nested():
+                    session.execute(
+                        text(
+                            f"CREATE TABLE {_quote(session, name)}"
+                            f" PARTITION OF {_quote(session, table.name)}"
+                            f" FOR VALUES FROM ({start.timestamp()!r})"
+                            f" TO ({partition_end.timestamp()!r})"
+                        )
+                    )
+            except SQLAlchemyError:
+                # Fails if rows of the default partition are in the range,
+                # the later partitions are not created so that they do not
+                # leave a gap which would never get a partition
+                _LOGGER.exception(
+                    "Error creating partition %s of the %s table", name, table.name
+                )
+                break
+            start = partition_end
+    session.commit()
+
+
+def select_partition_ids(
+    session: Session, partition: Partition, column: str
+) -> set[int]:
+    """Return the distinct non null values of an id column of a partition."""
+    quoted_column = _quote(session, column)
+    return set(
+        session.execute(
+            text(
+                f"SELECT DISTINCT {quoted_column}"  # noqa: S608
+                f" FROM {_quote(session, partition.name)}"
+                f" WHERE {quoted_column} IS NOT NULL"
+            )
+        ).scalars()
+    )
+
+
+def select_partition_max_id(
+    session: Session, partition: Partition, column: str
+) -> int | None:
+    """Return the largest value of an id column of a partition."""
+    return session.execute(
+        text(
+            f"SELECT MAX({_quote(session, column)})"  # noqa: S608
+            f" FROM {_quote(session, partition.name)}"
+        )
+    ).scalar()
+
+
+def disconnect_partition_states(session: Session, partition: Partition) -> None:
+    """Remove the links of states to old states in a states partition."""
+    session.execute(
+        text(
+            f"UPDATE {_quote(session, TABLE_STATES)} SET old_state_id = NULL"  # noqa: S608
+            " WHERE old_state_id IN"
+            f" (SELECT state_id FROM {_quote(session, partition.name)})"
+        )
+    )
+
+
+def drop_partition(session: Session, partition: Partition) -> None:
+    """Drop a partition and all its rows."""
+    _LOGGER.debug("Dropping partition %s", partition.name)
+    session.execute(text(f"DROP TABLE {_quote(session, partition.name)}"))
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
+from time import monotonic
 import traceback
 from typing import Any
 
@@ -12,6 +13,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.pool import (
     ConnectionPoolEntry,
     NullPool,
+    QueuePool,
     SingletonThreadPool,
     StaticPool,
 )
@@ -26,12 +28,39 @@ DEBUG_MUTEX_POOL = True
 DEBUG_MUTEX_POOL_TRACE = False
 
 POOL_SIZE = 5
+READ_ONLY_POOL_SIZE = POOL_SIZE - 1
+READ_ONLY_POOL_TIMEOUT = 30
 
 ADVISE_MSG = (
     "Use homeassistant.components.recorder.get_instance(hass).async_add_executor_job()"
 )
 
 
+class PoolWaitStatistics:
+    """Time spent waiting to get a connection from a pool."""
+
+    __slots__ = ("connections", "total_wait", "max_wait")
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.connections = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        """Return the average wait in seconds."""
+        if not self.connections:
+            return 0.0
+        return self.total_wait / self.connections
+
+    def record(self, wait: float) -> None:
+        """Record the wait for a connection."""
+        self.connections += 1
+        self.total_wait += wait
+        self.max_wait = max(wait, self.max_wait)
+
+
 class RecorderPool(SingletonThreadPool, NullPool):
     """A hybrid of NullPool and SingletonThreadPool.
 
@@ -43,6 +72,7 @@ class RecorderPool(SingletonThreadPool, NullPool):
         self,
         creator: Any,
         recorder_and_worker_thread_ids: set[int] | None = None,
+        wait_statistics: PoolWaitStatistics | None = None,
         **kw: Any,
     ) -> None:
         """Create the pool."""
@@ -51,6 +81,7 @@ class RecorderPool(SingletonThreadPool, NullPool):
             recorder_and_worker_thread_ids is not None
         ), "recorder_and_worker_thread_ids is required"
         self.recorder_and_worker_thread_ids = recorder_and_worker_thread_ids
+        self.wait_statistics = wait_statistics or PoolWaitStatistics()
         SingletonThreadPool.__init__(self, creator, **kw)
 
     def recreate(self) -> RecorderPool:
@@ -67,6 +98,7 @@ class RecorderPool(SingletonThreadPool, NullPool):
             _dispatch=self.dispatch,
             dialect=self._dialect,
             recorder_and_worker_thread_ids=self.recorder_and_worker_thread_ids,
+            wait_statistics=self.wait_statistics,
         )
 
     def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
@@ -92,7 +124,10 @@ class RecorderPool(SingletonThreadPool, NullPool):
 
     def _do_get(self) -> ConnectionPoolEntry:  # type: ignore[return]
         if threading.get_ident() in self.recorder_and_worker_thread_ids:
-            return super()._do_get()
+            start = monotonic()
+            conn = super()._do_get()
+            self.wait_statistics.record(monotonic() - start)
+            return conn
         try:
             asyncio.get_running_loop()
         except RuntimeError:
@@ -120,6 +155,48 @@ class RecorderPool(SingletonThreadPool, NullPool):
         return NullPool._create_connection(self)  # noqa: SLF001
 
 
+class ReadOnlyPool(QueuePool):
+    """A bounded pool of read only connections.
+
+    Used for the read only sessions of the database executor on SQLite,
+    where WAL readers do not block the recorder thread while it writes.
+    """
+
+    def __init__(
+        self,
+        creator: Any,
+        wait_statistics: PoolWaitStatistics | None = None,
+        **kw: Any,
+    ) -> None:
+        """Create the pool."""
+        kw.setdefault("pool_size", READ_ONLY_POOL_SIZE)
+        kw.setdefault("max_overflow", 0)
+        kw.setdefault("timeout", READ_ONLY_POOL_TIMEOUT)
+        self.wait_statistics = wait_statistics or PoolWaitStatistics()
+        super().__init__(creator, **kw)
+
+    def recreate(self) -> ReadOnlyPool:
+        """Recreate the pool."""
+        pool = super().recreate()
+        assert isinstance(pool, ReadOnlyPool)
+        pool.wait_statistics = self.wait_statistics
+        return pool
+
+    def _do_get(self) -> ConnectionPoolEntry:  # type: ignore[return]
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            start = monotonic()
+            conn = super()._do_get()
+            self.wait_statistics.record(monotonic() - start)
+            return conn
+        # In the event loop, raise an exception
+        raise_for_blocking_call(  # noqa: RET503
+            super()._do_get, strict=True, advise_msg=ADVISE_MSG
+        )
+        # raise_for_blocking_call will raise an exception
+
+
 class MutexPool(StaticPool):
     """A pool which prevents concurrent accesses from multiple threads.
 
@@ -3,27 +3,35 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from datetime import datetime
+from datetime import datetime, timedelta
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
+from . import partitions
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
+    count_events_to_purge,
+    count_states_to_purge,
     data_ids_exist_in_events,
     data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
     delete_event_rows,
     delete_event_types_rows,
+    delete_logbook_rows,
+    delete_logbook_rows_for_metadata_ids,
     delete_recorder_runs_rows,
+    delete_states_archive_rows,
+    delete_states_archive_rows_for_metadata_ids,
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
@@ -53,6 +61,95 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The number of rows selected per batch adapts so a batch takes about this long
+PURGE_BATCH_TARGET_TIME = 0.5
+MIN_PURGE_BATCH_SIZE = 100
+# A purge run commits and reschedules itself after this many seconds, or
+# when this many items were added to the recorder queue since it started
+PURGE_RUN_TIME_BUDGET = 5
+PURGE_RUN_MAX_BACKLOG_INCREASE = 500
+
+
+class PurgeProgress:
+    """Progress of a purge that runs over multiple purge tasks."""
+
+    __slots__ = (
+        "purge_before",
+        "rows_to_purge",
+        "rows_purged",
+        "batch_size",
+        "_started",
+        "_run_deadline",
+        "_run_max_backlog",
+    )
+
+    def __init__(
+        self, purge_before: datetime, rows_to_purge: int, batch_size: int
+    ) -> None:
+        """Initialize the purge progress."""
+        self.purge_before = purge_before
+        self.rows_to_purge = rows_to_purge
+        self.rows_purged = 0
+        self.batch_size = batch_size
+        self._started = time.monotonic()
+        self._run_deadline = 0.0
+        self._run_max_backlog = 0
+
+    @property
+    def rows_remaining(self) -> int:
+        """Return the estimated number of states and events left to purge."""
+        return max(self.rows_to_purge - self.rows_purged, 0)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the number of rows purged per second since the purge started."""
+        if not (elapsed := time.monotonic() - self._started):
+            return 0.0
+        return self.rows_purged / elapsed
+
+    @property
+    def eta(self) -> datetime | None:
+        """Return the estimated time the purge will finish."""
+        if not (rows_per_second := self.rows_per_second):
+            return None
+        return dt_util.utcnow() + timedelta(
+            seconds=self.rows_remaining / rows_per_second
+        )
+
+    def start_run(self, backlog: int) -> None:
+        """Start a purge run."""
+        self._run_deadline = time.monotonic() + PURGE_RUN_TIME_BUDGET
+        self._run_max_backlog = backlog + PURGE_RUN_MAX_BACKLOG_INCREASE
+
+    def should_yield(self, backlog: int) -> bool:
+        """Return if the purge run should end to let the recorder catch up."""
+        return time.monotonic() > self._run_deadline or backlog > self._run_max_backlog
+
+    def record_batch(self, rows: int, elapsed: float, max_bind_vars: int) -> None:
+        """Record a purged batch and adapt the batch size to its duration."""
+        self.rows_purged += rows
+        # Only full batches tell how long a batch of the current size takes
+        if rows < self.batch_size or elapsed <= 0:
+            return
+        target_batch_size = self.batch_size * PURGE_BATCH_TARGET_TIME / elapsed
+        # Move half way to the target to smooth out outliers
+        self.batch_size = int(
+            min(
+                max_bind_vars,
+                max(MIN_PURGE_BATCH_SIZE, (self.batch_size + target_batch_size) / 2),
+            )
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the purge progress."""
+        eta = self.eta
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "rows_remaining": self.rows_remaining,
+            "rows_per_second": round(self.rows_per_second, 1),
+            "eta": eta.isoformat() if eta else None,
+        }
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -72,8 +169,19 @@ def purge_old_data(
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
     with session_scope(session=instance.get_session()) as session:
+        progress = instance.purge_progress
+        if progress is None or progress.purge_before != purge_before:
+            progress = instance.purge_progress = PurgeProgress(
+                purge_before,
+                _count_rows_to_purge(session, purge_before),
+                instance.max_bind_vars,
+            )
+        progress.start_run(instance.backlog)
+        instance.history_cache.invalidate_before(purge_before.timestamp())
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
+        if instance.partition_interval:
+            _purge_expired_partitions(instance, session, purge_before)
         if instance.use_legacy_events_index and _purging_legacy_format(session):
             _LOGGER.debug(
                 "Purge running in legacy format as there are states with event_id"
@@ -87,10 +195,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -102,12 +210,18 @@ def purge_old_data(
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
 
+        _purge_archived_states(session, purge_before)
+        _purge_logbook_entries(session, purge_before)
+
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
-            _LOGGER.debug("Purging hasn't fully completed yet")
+            _LOGGER.debug(
+                "Purging hasn't fully completed yet, %s rows remaining",
+                progress.rows_remaining,
+            )
             return False
 
         if apply_filter and _purge_filtered_data(instance, session) is False:
@@ -123,11 +237,65 @@ def purge_old_data(
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
+    instance.purge_progress = None
     if repack:
         repack_database(instance)
     return True
 
 
+def _count_rows_to_purge(session: Session, purge_before: datetime) -> int:
+    """Return the number of states and events to purge."""
+    purge_before_ts = purge_before.timestamp()
+    return (session.execute(count_states_to_purge(purge_before_ts)).scalar() or 0) + (
+        session.execute(count_events_to_purge(purge_before_ts)).scalar() or 0
+    )
+
+
+def _purge_expired_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> None:
+    """Drop the states and events partitions older than purge_before.
+
+    Rows of the partition that is only partly expired are left to the
+    batch purge.
+    """
+    for partition in partitions.get_expired_partitions(
+        session, partitions.STATES_PARTITIONED_TABLE, purge_before
+    ):
+        attributes_ids = partitions.select_partition_ids(
+            session, partition, "attributes_id"
+        )
+        max_state_id = partitions.select_partition_max_id(
+            session, partition, "state_id"
+        )
+        partitions.disconnect_partition_states(session, partition)
+        partitions.drop_partition(session, partition)
+        if max_state_id is not None:
+            instance.states_manager.evict_purged_state_ids_before(max_state_id)
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+        session.commit()
+
+    for partition in partitions.get_expired_partitions(
+        session, partitions.EVENTS_PARTITIONED_TABLE, purge_before
+    ):
+        data_ids = partitions.select_partition_ids(session, partition, "data_id")
+        partitions.drop_partition(session, partition)
+        _purge_unused_data_ids(instance, session, data_ids)
+        session.commit()
+
+
+def _purge_archived_states(session: Session, purge_before: datetime) -> None:
+    """Purge the archived states blocks older than purge_before."""
+    deleted_rows = session.execute(delete_states_archive_rows(purge_before.timestamp()))
+    _LOGGER.debug("Deleted %s archived states blocks", deleted_rows)
+
+
+def _purge_logbook_entries(session: Session, purge_before: datetime) -> None:
+    """Purge the logbook table entries older than purge_before."""
+    deleted_rows = session.execute(delete_logbook_rows(purge_before.timestamp()))
+    _LOGGER.debug("Deleted %s logbook table entries", deleted_rows)
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
@@ -178,10 +346,12 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
-    Returns true if there are more states to purge.
+    Stops after states_batch_size batches or when the purge run should
+    yield. Returns true if there are more states to purge.
     """
     database_engine = instance.database_engine
     assert database_engine is not None
@@ -193,14 +363,18 @@ def _purge_states_and_attributes_ids(
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(states_batch_size):
+        start = time.monotonic()
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, progress.batch_size
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        progress.record_batch(len(state_ids), time.monotonic() - start, max_bind_vars)
+        if progress.should_yield(instance.backlog):
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -215,10 +389,12 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
 ) -> bool:
-    """Purge states and linked attributes id in a batch.
+    """Purge events and linked data id in a batch.
 
-    Returns true if there are more states to purge.
+    Stops after events_batch_size batches or when the purge run should
+    yield. Returns true if there are more events to purge.
     """
     has_remaining_event_ids_to_purge = True
     # There are more events relative to data_ids so
@@ -228,14 +404,18 @@ def _purge_events_and_data_ids(
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(events_batch_size):
+        start = time.monotonic()
         event_ids, data_ids = _select_event_data_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, progress.batch_size
         )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        progress.record_batch(len(event_ids), time.monotonic() - start, max_bind_vars)
+        if progress.should_yield(instance.backlog):
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
@@ -640,7 +820,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     # Check if excluded entity_ids are in database
     entity_filter = instance.entity_filter
     has_more_states_to_purge = False
-    excluded_metadata_ids: list[str] = [
+    excluded_metadata_ids: list[int] = [
         metadata_id
         for (metadata_id, entity_id) in session.query(
             StatesMeta.metadata_id, StatesMeta.entity_id
@@ -676,7 +856,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 def _purge_filtered_states(
     instance: Recorder,
     session: Session,
-    metadata_ids_to_purge: list[str],
+    metadata_ids_to_purge: list[int],
     database_engine: DatabaseEngine,
     purge_before_timestamp: float,
 ) -> bool:
@@ -684,6 +864,9 @@ def _purge_filtered_states(
 
     Return true if all states are purged
     """
+    instance.history_cache.invalidate_entities(
+        metadata_ids_to_purge, purge_before_timestamp
+    )
     state_ids: tuple[int, ...]
     attributes_ids: tuple[int, ...]
     event_ids: tuple[int, ...]
@@ -695,6 +878,18 @@ def _purge_filtered_states(
         .all()
     )
     if not to_purge:
+        deleted_rows = session.execute(
+            delete_states_archive_rows_for_metadata_ids(
+                metadata_ids_to_purge, purge_before_timestamp
+            )
+        )
+        _LOGGER.debug("Deleted %s filtered archived states blocks", deleted_rows)
+        deleted_rows = session.execute(
+            delete_logbook_rows_for_metadata_ids(
+                metadata_ids_to_purge, purge_before_timestamp
+            )
+        )
+        _LOGGER.debug("Deleted %s filtered logbook table entries", deleted_rows)
         return True
     state_ids, attributes_ids, event_ids = zip(*to_purge, strict=False)
     filtered_event_ids = {id_ for id_ in event_ids if id_ is not None}
@@ -774,7 +969,7 @@ def purge_entity_data(
     assert database_engine is not None
     purge_before_timestamp = purge_before.timestamp()
     with session_scope(session=instance.get_session()) as session:
-        selected_metadata_ids: list[str] = [
+        selected_metadata_ids: list[int] = [
             metadata_id
             for (metadata_id, entity_id) in session.query(
                 StatesMeta.metadata_id, StatesMeta.entity_id
@@ -10,13 +10,16 @@ from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
 from .db_schema import (
+    SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
     EventData,
     Events,
     EventTypes,
+    Logbook,
     MigrationChanges,
     RecorderRuns,
     StateAttributes,
     States,
+    StatesArchive,
     StatesMeta,
     Statistics,
     StatisticsRuns,
@@ -636,6 +639,24 @@ def find_states_to_purge(
     )
 
 
+def count_states_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Count the states to purge."""
+    return lambda_stmt(
+        lambda: select(func.count(States.state_id)).filter(
+            States.last_updated_ts < purge_before
+        )
+    )
+
+
+def count_events_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Count the events to purge."""
+    return lambda_stmt(
+        lambda: select(func.count(Events.event_id)).filter(
+            Events.time_fired_ts < purge_before
+        )
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -856,7 +877,8 @@ def find_entity_ids_to_purge() -> StatementLambdaElement:
                     StatesMeta.metadata_id
                     == used_states_metadata_id.c.used_states_metadata_id,
                 )
-            )
+            ),
+            StatesMeta.metadata_id.not_in(select(distinct(StatesArchive.metadata_id))),
         )
     )
 
@@ -970,3 +992,104 @@ def delete_duplicate_statistics_row(statistic_id: int) -> StatementLambdaElement
         .where(Statistics.id == statistic_id)
         .execution_options(synchronize_session=False)
     )
+
+
+def find_oldest_metadata_id_to_archive(
+    archive_before: float,
+) -> StatementLambdaElement:
+    """Find the entity of the oldest state to archive."""
+    return lambda_stmt(
+        lambda: select(States.metadata_id)
+        .filter(States.last_updated_ts < archive_before)
+        .filter(States.metadata_id.is_not(None))
+        .order_by(States.last_updated_ts)
+        .limit(1)
+    )
+
+
+def find_states_to_archive(
+    metadata_id: int, archive_before: float, limit: int
+) -> StatementLambdaElement:
+    """Find the oldest states of an entity to archive."""
+    return lambda_stmt(
+        lambda: select(
+            States.state_id,
+            States.state,
+            States.last_updated_ts,
+            States.last_changed_ts,
+            States.attributes_id,
+            SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
+        )
+        .outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+        .filter(States.metadata_id == metadata_id)
+        .filter(States.last_updated_ts < archive_before)
+        .order_by(States.last_updated_ts)
+        .limit(limit)
+    )
+
+
+def find_states_archived_until() -> StatementLambdaElement:
+    """Find the timestamp of the newest archived state."""
+    return lambda_stmt(lambda: select(func.max(StatesArchive.end_ts)))
+
+
+def delete_states_archive_rows(purge_before: float) -> StatementLambdaElement:
+    """Delete archived states blocks that only contain states before purge_before."""
+    return lambda_stmt(
+        lambda: delete(StatesArchive)
+        .where(StatesArchive.end_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_archive_rows_for_metadata_ids(
+    metadata_ids: Iterable[int], purge_before: float
+) -> StatementLambdaElement:
+    """Delete archived states blocks of entities before purge_before."""
+    return lambda_stmt(
+        lambda: delete(StatesArchive)
+        .where(StatesArchive.metadata_id.in_(metadata_ids))
+        .where(StatesArchive.end_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_logbook_oldest_time_fired() -> StatementLambdaElement:
+    """Find the timestamp of the oldest logbook table entry."""
+    return lambda_stmt(lambda: select(func.min(Logbook.time_fired_ts)))
+
+
+def delete_logbook_rows(purge_before: float) -> StatementLambdaElement:
+    """Delete logbook table entries before purge_before."""
+    return lambda_stmt(
+        lambda: delete(Logbook)
+        .where(Logbook.time_fired_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_logbook_rows_for_metadata_ids(
+    metadata_ids: Iterable[int], purge_before: float
+) -> StatementLambdaElement:
+    """Delete logbook table entries of entities before purge_before."""
+    return lambda_stmt(
+        lambda: delete(Logbook)
+        .where(
+            Logbook.entity_id.in_(
+                select(StatesMeta.entity_id).where(
+                    StatesMeta.metadata_id.in_(metadata_ids)
+                )
+            )
+        )
+        .where(Logbook.time_fired_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_all_logbook_rows() -> StatementLambdaElement:
+    """Delete all logbook table entries."""
+    return lambda_stmt(
+        lambda: delete(Logbook).execution_options(synchronize_session=False)
+    )
@@ -13,7 +13,7 @@ from operator import itemgetter
 import re
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, or_, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -26,6 +26,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.util import dt as dt_util
+from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.unit_conversion import (
     BaseUnitConverter,
     BloodGlucoseConcentrationConverter,
@@ -55,12 +56,15 @@ from .const import (
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
+    StatisticsRollupPeriod,
     SupportedDialect,
 )
 from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsMeta,
+    StatisticsRollup,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -162,6 +166,15 @@ UNIT_CLASSES = {
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
 
+STATISTICS_ROLLUP_PERIODS: dict[str, StatisticsRollupPeriod] = {
+    "day": StatisticsRollupPeriod.DAY,
+    "week": StatisticsRollupPeriod.WEEK,
+    "month": StatisticsRollupPeriod.MONTH,
+}
+
+# Number of statistics the rollup rebuild checks before it is rescheduled
+STATISTICS_ROLLUP_REBUILD_BATCH_SIZE = 50
+
 
 def mean(values: list[float]) -> float | None:
     """Return the mean of the values.
@@ -393,12 +406,16 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(
+    instance: Recorder, session: Session, start: datetime
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    The hour is then added to the day, week and month rollups.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
@@ -448,6 +465,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         Statistics.from_stats_ts(metadata_id, summary_item)
         for metadata_id, summary_item in summary.items()
     )
+    _update_statistics_rollups(instance, session, start_time_ts, summary)
 
 
 @retryable_database_job("compile missing statistics")
@@ -605,7 +623,7 @@ def _compile_statistics(
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(instance, session, start)
 
     session.add(StatisticsRuns(start=start))
 
@@ -1118,6 +1136,295 @@ def _reduce_statistics_per_month(
     )
 
 
+_STATISTICS_ROLLUP_PERIOD_FACTORIES = {
+    StatisticsRollupPeriod.DAY: reduce_day_ts_factory,
+    StatisticsRollupPeriod.WEEK: reduce_week_ts_factory,
+    StatisticsRollupPeriod.MONTH: reduce_month_ts_factory,
+}
+
+
+def _statistics_rollup_period_start_end() -> (
+    dict[StatisticsRollupPeriod, Callable[[float], tuple[float, float]]]
+):
+    """Return functions returning the start and end of the periods of a time."""
+    return {
+        period: factory()[1]
+        for period, factory in _STATISTICS_ROLLUP_PERIOD_FACTORIES.items()
+    }
+
+
+def _statistics_rollups_ready(instance: Recorder) -> bool:
+    """Return if the rollups can be used for periods in the current time zone."""
+    return (
+        instance.statistics_rollups_ready
+        and instance.statistics_rollup_time_zone == str(dt_util.get_default_time_zone())
+    )
+
+
+def _statistics_rollup_time_zone(instance: Recorder, session: Session) -> str:
+    """Return the time zone the rollups are maintained in.
+
+    Rollups of other time zones are removed and rebuilt in the current
+    time zone.
+    """
+    time_zone = str(dt_util.get_default_time_zone())
+    if instance.statistics_rollup_time_zone == time_zone:
+        return time_zone
+    query = session.query(StatisticsRollup)
+    if instance.statistics_rollup_time_zone is None:
+        # The rollups of the current time zone were maintained until the
+        # previous run, the rebuild brings them up to date
+        query = query.filter(StatisticsRollup.time_zone != time_zone)
+    else:
+        _LOGGER.info(
+            "Time zone changed to %s, rebuilding the statistics rollups", time_zone
+        )
+    query.delete(synchronize_session=False)
+    if instance.statistics_rollups_ready:
+        instance.queue_statistics_rollup_rebuild()
+    instance.statistics_rollup_time_zone = time_zone
+    instance.statistics_rollups_ready = False
+    instance.statistics_rollup_verified_ids.clear()
+    return time_zone
+
+
+def _new_statistics_rollup(
+    metadata_id: int,
+    period: StatisticsRollupPeriod,
+    time_zone: str,
+    start_ts: float,
+    end_ts: float,
+) -> StatisticsRollup:
+    """Create an empty rollup."""
+    return StatisticsRollup(
+        metadata_id=metadata_id,
+        period=period,
+        time_zone=time_zone,
+        start_ts=start_ts,
+        end_ts=end_ts,
+        last_start_ts=start_ts,
+        mean_sum=None,
+        mean_count=0,
+        min=None,
+        max=None,
+        last_reset_ts=None,
+        state=None,
+        sum=None,
+    )
+
+
+def _add_statistic_to_rollup(
+    rollup: StatisticsRollup, stat: StatisticDataTimestamp
+) -> None:
+    """Add an hour of statistics to the rollup of its period."""
+    if (_mean := stat.get("mean")) is not None:
+        rollup.mean_sum = _mean if rollup.mean_sum is None else rollup.mean_sum + _mean
+        rollup.mean_count += 1
+    if (_min := stat.get("min")) is not None and (
+        rollup.min is None or _min < rollup.min
+    ):
+        rollup.min = _min
+    if (_max := stat.get("max")) is not None and (
+        rollup.max is None or _max > rollup.max
+    ):
+        rollup.max = _max
+    if stat["start_ts"] >= rollup.last_start_ts:
+        rollup.last_start_ts = stat["start_ts"]
+        rollup.last_reset_ts = stat.get("last_reset_ts")
+        rollup.state = stat.get("state")
+        rollup.sum = stat.get("sum")
+
+
+def _update_statistics_rollups(
+    instance: Recorder,
+    session: Session,
+    start_time_ts: float,
+    summary: dict[int, StatisticDataTimestamp],
+) -> None:
+    """Add a compiled hour to the rollups of the periods it is within."""
+    time_zone = _statistics_rollup_time_zone(instance, session)
+    if not instance.statistics_rollups_ready:
+        # The rebuild adds the hour to the rollups of the other statistics
+        verified_ids = instance.statistics_rollup_verified_ids
+        summary = {
+            metadata_id: stat
+            for metadata_id, stat in summary.items()
+            if metadata_id in verified_ids
+        }
+    if not summary:
+        return
+    periods = {
+        period: start_end(start_time_ts)
+        for period, start_end in _statistics_rollup_period_start_end().items()
+    }
+    period_filter = or_(
+        *(
+            and_(StatisticsRollup.period == period, StatisticsRollup.start_ts == start)
+            for period, (start, _) in periods.items()
+        )
+    )
+    rollups: dict[tuple[int, int], StatisticsRollup] = {
+        (rollup.metadata_id, rollup.period): rollup
+        for metadata_ids in chunked_or_all(summary, instance.max_bind_vars)
+        for rollup in session.query(StatisticsRollup).filter(
+            StatisticsRollup.metadata_id.in_(metadata_ids), period_filter
+        )
+    }
+    for metadata_id, stat in summary.items():
+        for period, (start, end) in periods.items():
+            if (rollup := rollups.get((metadata_id, period))) is None:
+                rollup = _new_statistics_rollup(
+                    metadata_id, period, time_zone, start, end
+                )
+                session.add(rollup)
+            _add_statistic_to_rollup(rollup, stat)
+
+
+def _rebuild_statistics_rollups(
+    session: Session, metadata_id: int, time_zone: str, start_ts: float | None
+) -> None:
+    """Rebuild the rollups of a statistic from its hourly statistics.
+
+    The periods from the one start_ts is within are rebuilt, or all
+    periods if start_ts is None.
+    """
+    period_start_end = _statistics_rollup_period_start_end()
+    delete_query = session.query(StatisticsRollup).filter(
+        StatisticsRollup.metadata_id == metadata_id
+    )
+    stmt = (
+        select(
+            Statistics.start_ts,
+            Statistics.mean,
+            Statistics.min,
+            Statistics.max,
+            Statistics.last_reset_ts,
+            Statistics.state,
+            Statistics.sum,
+        )
+        .filter(Statistics.metadata_id == metadata_id)
+        .order_by(Statistics.start_ts)
+    )
+    period_starts: dict[StatisticsRollupPeriod, float] = {}
+    if start_ts is not None:
+        period_starts = {
+            period: start_end(start_ts)[0]
+            for period, start_end in period_start_end.items()
+        }
+        delete_query = delete_query.filter(
+            or_(
+                *(
+                    and_(
+                        StatisticsRollup.period == period,
+                        StatisticsRollup.start_ts >= start,
+                    )
+                    for period, start in period_starts.items()
+                )
+            )
+        )
+        stmt = stmt.filter(Statistics.start_ts >= min(period_starts.values()))
+    delete_query.delete(synchronize_session=False)
+
+    rollups: dict[tuple[int, float], StatisticsRollup] = {}
+    for row in session.execute(stmt):
+        stat = cast(StatisticDataTimestamp, row._asdict())
+        for period, start_end in period_start_end.items():
+            if period in period_starts and row.start_ts < period_starts[period]:
+                continue
+            start, end = start_end(row.start_ts)
+            if (rollup := rollups.get((period, start))) is None:
+                rollup = rollups[period, start] = _new_statistics_rollup(
+                    metadata_id, period, time_zone, start, end
+                )
+            _add_statistic_to_rollup(rollup, stat)
+    session.add_all(rollups.values())
+
+
+def _find_statistics_rollups_rebuild_start(
+    session: Session, metadata_id: int
+) -> tuple[bool, float | None]:
+    """Return if the rollups of a statistic are outdated and where to rebuild.
+
+    The rollups are rebuilt from their last hour if hours were compiled
+    after it, or from the start if they do not cover the first hour.
+    """
+    first_hour_ts, last_hour_ts = session.execute(
+        select(func.min(Statistics.start_ts), func.max(Statistics.start_ts)).filter(
+            Statistics.metadata_id == metadata_id
+        )
+    ).one()
+    first_rollup_ts, last_rollup_hour_ts = session.execute(
+        select(
+            func.min(StatisticsRollup.start_ts),
+            func.max(StatisticsRollup.last_start_ts),
+        ).filter(
+            StatisticsRollup.metadata_id == metadata_id,
+            StatisticsRollup.period == StatisticsRollupPeriod.DAY,
+        )
+    ).one()
+    if first_hour_ts is None:
+        return first_rollup_ts is not None, None
+    if first_rollup_ts is None or first_rollup_ts > first_hour_ts:
+        return True, None
+    return last_hour_ts > last_rollup_hour_ts, last_rollup_hour_ts
+
+
+def _rebuild_statistics_rollups_after_change(
+    instance: Recorder, session: Session, metadata_id: int, start_ts: float | None
+) -> None:
+    """Rebuild the rollups of a statistic after its hourly statistics changed.
+
+    start_ts is the start of the first changed hour, or None if any hour
+    may have changed.
+    """
+    time_zone = _statistics_rollup_time_zone(instance, session)
+    if (
+        start_ts is not None
+        and not instance.statistics_rollups_ready
+        and metadata_id not in instance.statistics_rollup_verified_ids
+    ):
+        # Include the hours the rollups are missing
+        outdated, rebuild_start_ts = _find_statistics_rollups_rebuild_start(
+            session, metadata_id
+        )
+        if outdated:
+            start_ts = (
+                None if rebuild_start_ts is None else min(start_ts, rebuild_start_ts)
+            )
+    _rebuild_statistics_rollups(session, metadata_id, time_zone, start_ts)
+
+
+@retryable_database_job("rebuild statistics rollups")
+def rebuild_statistics_rollups(instance: Recorder) -> bool:
+    """Bring the rollups of a batch of statistics up to date.
+
+    Returns False when more statistics remain to be checked.
+    """
+    verified_ids = instance.statistics_rollup_verified_ids
+    with session_scope(session=instance.get_session()) as session:
+        time_zone = _statistics_rollup_time_zone(instance, session)
+        metadata_ids = [
+            metadata_id
+            for metadata_id in session.execute(
+                select(StatisticsMeta.id).order_by(StatisticsMeta.id)
+            ).scalars()
+            if metadata_id not in verified_ids
+        ][:STATISTICS_ROLLUP_REBUILD_BATCH_SIZE]
+        for metadata_id in metadata_ids:
+            outdated, start_ts = _find_statistics_rollups_rebuild_start(
+                session, metadata_id
+            )
+            if outdated:
+                _LOGGER.debug("Rebuilding statistics rollups of %s", metadata_id)
+                _rebuild_statistics_rollups(session, metadata_id, time_zone, start_ts)
+    verified_ids.update(metadata_ids)
+    if len(metadata_ids) == STATISTICS_ROLLUP_REBUILD_BATCH_SIZE:
+        return False
+    instance.statistics_rollups_ready = True
+    verified_ids.clear()
+    return True
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1141,6 +1448,40 @@ def _generate_statistics_during_period_stmt(
     return stmt
 
 
+def _generate_statistics_rollup_during_period_stmt(
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    period: StatisticsRollupPeriod,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> StatementLambdaElement:
+    """Prepare a database query for the rollups of a period during a given period.
+
+    The columns are named like those of the statistics tables.
+    """
+    start_time_ts = start_time.timestamp()
+    columns = select(StatisticsRollup.metadata_id, StatisticsRollup.start_ts)
+    track_on: list[str | None] = [StatisticsRollup.__tablename__]
+    for key, column in _rollup_type_column_mapping.items():
+        if key in types:
+            columns = columns.add_columns(column)
+            track_on.append(key)
+        else:
+            track_on.append(None)
+    stmt = lambda_stmt(lambda: columns, track_on=track_on)
+    stmt += lambda q: q.filter(StatisticsRollup.period == period)
+    stmt += lambda q: q.filter(StatisticsRollup.start_ts >= start_time_ts)
+    if end_time is not None:
+        end_time_ts = end_time.timestamp()
+        stmt += lambda q: q.filter(StatisticsRollup.start_ts < end_time_ts)
+    if metadata_ids:
+        stmt += lambda q: q.filter(StatisticsRollup.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.order_by(
+        StatisticsRollup.metadata_id, StatisticsRollup.start_ts
+    )
+    return stmt
+
+
 def _generate_max_mean_min_statistic_in_sub_period_stmt(
     columns: Select,
     start_time: datetime | None,
@@ -1613,6 +1954,18 @@ _type_column_mapping = {
 }
 
 
+_rollup_type_column_mapping = {
+    "last_reset": StatisticsRollup.last_reset_ts,
+    "max": StatisticsRollup.max,
+    "mean": (
+        StatisticsRollup.mean_sum / func.nullif(StatisticsRollup.mean_count, 0)
+    ).label("mean"),
+    "min": StatisticsRollup.min,
+    "state": StatisticsRollup.state,
+    "sum": StatisticsRollup.sum,
+}
+
+
 def _generate_select_columns_for_types_stmt(
     table: type[StatisticsBase],
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
@@ -1703,6 +2056,122 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _statistics_during_period_from_table(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    table: type[Statistics | StatisticsShortTerm],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return the rows of a statistics table during UTC period start_time - end_time."""
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, table, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    if not stats:
+        return {}
+    return _sorted_statistics_to_dict(
+        hass, stats, statistic_ids, metadata, True, table, units, types
+    )
+
+
+_STATISTICS_ROLLUP_PERIOD_REDUCERS = {
+    StatisticsRollupPeriod.DAY: _reduce_statistics_per_day,
+    StatisticsRollupPeriod.WEEK: _reduce_statistics_per_week,
+    StatisticsRollupPeriod.MONTH: _reduce_statistics_per_month,
+}
+
+
+def _statistics_rollups_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: StatisticsRollupPeriod,
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return day, week or month statistics during UTC period start_time - end_time.
+
+    The periods within start_time - end_time are read from the rollups. The
+    hours before the first and after the last of these periods are reduced
+    from the hourly statistics.
+    """
+    period_start_end = _STATISTICS_ROLLUP_PERIOD_FACTORIES[period]()[1]
+    reduce_statistics = _STATISTICS_ROLLUP_PERIOD_REDUCERS[period]
+
+    def _reduce_hours(
+        start: datetime, end: datetime | None
+    ) -> dict[str, list[StatisticsRow]]:
+        """Reduce the hourly statistics during start - end."""
+        hours = _statistics_during_period_from_table(
+            hass,
+            session,
+            start,
+            end,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            Statistics,
+            units,
+            types,
+        )
+        return reduce_statistics(hours, types) if hours else {}
+
+    start_time_ts = start_time.timestamp()
+    rollup_start_ts, first_end_ts = period_start_end(start_time_ts)
+    if rollup_start_ts < start_time_ts:
+        rollup_start_ts = first_end_ts
+    rollup_end_ts: float | None = None
+    if end_time is not None:
+        rollup_end_ts = period_start_end(end_time.timestamp())[0]
+        if rollup_end_ts <= rollup_start_ts:
+            # No period is within start_time - end_time
+            return _reduce_hours(start_time, end_time)
+    rollup_start = dt_util.utc_from_timestamp(rollup_start_ts)
+    rollup_end = (
+        None if rollup_end_ts is None else dt_util.utc_from_timestamp(rollup_end_ts)
+    )
+
+    head = _reduce_hours(start_time, rollup_start) if start_time < rollup_start else {}
+    tail = (
+        _reduce_hours(rollup_end, end_time)
+        if rollup_end is not None and end_time is not None and rollup_end < end_time
+        else {}
+    )
+    stmt = _generate_statistics_rollup_during_period_stmt(
+        rollup_start, rollup_end, metadata_ids, period, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    rollups: dict[str, list[StatisticsRow]] = {}
+    if stats:
+        rollups = _sorted_statistics_to_dict(
+            hass, stats, statistic_ids, metadata, True, Statistics, units, types
+        )
+        # The rows were built with the duration of the hourly statistics
+        for rows in rollups.values():
+            for row in rows:
+                row["end"] = period_start_end(row["start"])[1]
+
+    result: dict[str, list[StatisticsRow]] = {}
+    for part in (head, rollups, tail):
+        for statistic_id, rows in part.items():
+            result.setdefault(statistic_id, []).extend(rows)
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1773,35 +2242,44 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
-
-    if not stats:
-        return {}
-
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+    rollup_period = STATISTICS_ROLLUP_PERIODS.get(period)
+    if rollup_period is not None and _statistics_rollups_ready(get_instance(hass)):
+        result = _statistics_rollups_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            rollup_period,
+            units,
+            types,
+        )
+    else:
+        result = _statistics_during_period_from_table(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            table,
+            units,
+            types,
+        )
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+    if not result:
+        return {}
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2345,13 +2823,20 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    first_start: datetime | None = None
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        if first_start is None or stat["start"] < first_start:
+            first_start = stat["start"]
 
     if table != StatisticsShortTerm:
+        if first_start is not None:
+            _rebuild_statistics_rollups_after_change(
+                instance, session, metadata_id, first_start.timestamp()
+            )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2480,6 +2965,12 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+        _rebuild_statistics_rollups_after_change(
+            instance,
+            session,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0).timestamp(),
+        )
 
     return True
 
@@ -2544,6 +3035,7 @@ def change_statistics_unit(
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
+        _rebuild_statistics_rollups_after_change(instance, session, metadata_id, None)
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
@@ -55,6 +55,33 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_pool_wait_info(instance: Recorder) -> dict[str, Any]:
+    """Get the time spent waiting for database connections."""
+    return {
+        f"{name}_pool_wait": (
+            f"{wait_statistics.average_wait * 1000:.2f} ms average,"
+            f" {wait_statistics.max_wait * 1000:.2f} ms max"
+        )
+        for name, wait_statistics in instance.pool_wait_statistics.items()
+    }
+
+
+@callback
+def _async_get_purge_progress_info(instance: Recorder) -> dict[str, Any]:
+    """Get the progress of the running purge."""
+    if (progress := instance.purge_progress) is None:
+        return {}
+    eta = progress.eta
+    return {
+        "purge_progress": (
+            f"{progress.rows_remaining} rows remaining,"
+            f" {progress.rows_per_second:.1f} rows/s"
+            + (f", done at {eta.isoformat(timespec='seconds')}" if eta else "")
+        )
+    }
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -62,6 +89,8 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     recorder_runs_manager = instance.recorder_runs_manager
     database_name = urlparse(instance.db_url).path.lstrip("/")
     db_engine_info = _async_get_db_engine_info(instance)
+    pool_wait_info = _async_get_pool_wait_info(instance)
+    purge_progress_info = _async_get_purge_progress_info(instance)
     db_stats: dict[str, Any] = {}
 
     if instance.async_db_ready.done():
@@ -72,4 +101,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | pool_wait_info | purge_progress_info
@@ -0,0 +1,174 @@
+"""Support managing the logbook table."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from lru import LRU
+
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.const import (
+    ATTR_DEVICE_ID,
+    ATTR_ENTITY_ID,
+    ATTR_ICON,
+    ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, split_entity_id
+
+from ..db_schema import MAX_LENGTH_STATE_ENTITY_ID, MAX_LENGTH_STATE_STATE, Logbook
+from ..models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+if TYPE_CHECKING:
+    from ..core import Recorder
+
+
+CACHE_SIZE = 2048
+
+# Like the logbook, state changes of domains which are always continuous
+# and of sensors with a unit of measurement are not written
+ALWAYS_CONTINUOUS_DOMAINS = {"counter", "proximity"}
+
+
+class ContextOrigin(NamedTuple):
+    """The event or state change which started a context."""
+
+    event_type: str | None
+    entity_id: str | None
+    state: str | None
+    event_data: str | None
+
+
+def _id_or_none(value: Any) -> str | None:
+    """Return an entity or device id from event data if it can be stored."""
+    if type(value) is str and len(value) <= MAX_LENGTH_STATE_ENTITY_ID:
+        return value
+    return None
+
+
+class LogbookManager:
+    """Write the logbook table from the recorded events.
+
+    The origin of the context of each entry is resolved when the event is
+    recorded, so the logbook can read the entries of entities and devices
+    without looking up the events and states which share their context.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the logbook manager."""
+        self.recorder = recorder
+        self._origins: LRU[str, ContextOrigin] = LRU(CACHE_SIZE)
+
+    def entry_from_event(self, event: Event[Any]) -> Logbook | None:
+        """Return the logbook entry of a recorded event if it has one.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        context = event.context
+        origin_event = context.origin_event
+        own_origin: ContextOrigin | None = None
+        if origin_event is event:
+            # The entry started its own context, it was caused by
+            # whatever started the parent context
+            own_origin = self._origins[context.id] = self._origin(event)
+            context_origin = (
+                self._origins.get(parent_id)
+                if (parent_id := context.parent_id)
+                else None
+            )
+        elif (context_origin := self._origins.get(context.id)) is None and (
+            origin_event is not None
+        ):
+            context_origin = self._origins[context.id] = self._origin(origin_event)
+
+        if event.event_type == EVENT_STATE_CHANGED:
+            entry = self._state_entry(event)
+        else:
+            entry = self._event_entry(event, own_origin)
+        if entry is None:
+            return None
+        entry.context_id_bin = ulid_to_bytes_or_none(context.id)
+        entry.context_user_id_bin = uuid_hex_to_bytes_or_none(context.user_id)
+        entry.context_parent_id_bin = ulid_to_bytes_or_none(context.parent_id)
+        if context_origin is not None:
+            entry.context_event_type = context_origin.event_type
+            entry.context_entity_id = context_origin.entity_id
+            entry.context_state = context_origin.state
+            entry.context_event_data = context_origin.event_data
+        return entry
+
+    def _origin(self, event: Event[Any]) -> ContextOrigin:
+        """Return the origin of the contexts started by an event."""
+        if event.event_type == EVENT_STATE_CHANGED:
+            new_state = event.data["new_state"]
+            return ContextOrigin(
+                None,
+                event.data["entity_id"],
+                new_state.state if new_state else None,
+                None,
+            )
+        shared_data = (
+            self.recorder.event_data_manager.serialize_from_event(event)
+            if event.data
+            else None
+        )
+        return ContextOrigin(
+            event.event_type,
+            None,
+            None,
+            shared_data.decode("utf-8") if shared_data else None,
+        )
+
+    def _state_entry(self, event: Event[Any]) -> Logbook | None:
+        """Return the entry of a state change shown in the logbook."""
+        data = event.data
+        if (
+            not (old_state := data["old_state"])
+            or not (new_state := data["new_state"])
+            or new_state.state == old_state.state
+        ):
+            return None
+        entity_id: str = data["entity_id"]
+        domain = split_entity_id(entity_id)[0]
+        attributes = new_state.attributes
+        if domain in ALWAYS_CONTINUOUS_DOMAINS or (
+            domain == SENSOR_DOMAIN and ATTR_UNIT_OF_MEASUREMENT in attributes
+        ):
+            return None
+        icon = attributes.get(ATTR_ICON)
+        return Logbook(
+            time_fired_ts=new_state.last_updated_timestamp,
+            entity_id=entity_id,
+            state=new_state.state,
+            icon=icon
+            if type(icon) is str and len(icon) <= MAX_LENGTH_STATE_STATE
+            else None,
+        )
+
+    def _event_entry(
+        self, event: Event[Any], origin: ContextOrigin | None
+    ) -> Logbook | None:
+        """Return the entry of an event about an entity or device."""
+        data = event.data
+        entity_id = _id_or_none(data.get(ATTR_ENTITY_ID))
+        device_id = _id_or_none(data.get(ATTR_DEVICE_ID))
+        if entity_id is None and device_id is None:
+            return None
+        if origin is None:
+            origin = self._origin(event)
+        return Logbook(
+            time_fired_ts=event.time_fired_timestamp,
+            entity_id=entity_id,
+            device_id=device_id,
+            event_type=event.event_type,
+            event_data=origin.event_data,
+        )
+
+    def reset(self) -> None:
+        """Forget the origins of contexts.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._origins.clear()
@@ -93,6 +93,17 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_purged_state_ids_before(self, max_state_id: int) -> None:
+        """Evict committed states with an id up to max_state_id.
+
+        Used when a whole partition of states is dropped, since the
+        ids of its states are not selected one by one.
+        """
+        last_committed_ids = self._last_committed_id
+        for entity_id, state_id in list(last_committed_ids.items()):
+            if state_id <= max_state_id:
+                del last_committed_ids[entity_id]
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
-from . import entity_registry, purge, statistics
+from . import archive, entity_registry, purge, statistics
 from .const import DOMAIN
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
@@ -133,6 +133,20 @@ class PurgeTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class ArchiveTask(RecorderTask):
+    """Object to store information about an archive task."""
+
+    archive_before: datetime
+
+    def run(self, instance: Recorder) -> None:
+        """Archive old states."""
+        if archive.archive_states(instance, self.archive_before):
+            return
+        # Schedule a new archive task if this one didn't finish
+        instance.queue_task(ArchiveTask(self.archive_before))
+
+
 @dataclass(slots=True)
 class PurgeEntitiesTask(RecorderTask):
     """Object to store entity information about purge task."""
@@ -187,6 +201,18 @@ class CompileMissingStatisticsTask(RecorderTask):
         instance.queue_task(CompileMissingStatisticsTask())
 
 
+@dataclass(slots=True)
+class RebuildStatisticsRollupsTask(RecorderTask):
+    """An object to insert into the recorder queue to rebuild the statistics rollups."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics task to rebuild the statistics rollups."""
+        if statistics.rebuild_statistics_rollups(instance):
+            return
+        # Schedule a new rebuild task if this one didn't finish
+        instance.queue_task(RebuildStatisticsRollupsTask())
+
+
 @dataclass(slots=True)
 class ImportStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an import statistics task."""
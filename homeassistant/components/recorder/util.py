@@ -36,6 +36,7 @@ from homeassistant.helpers.recorder import (  # noqa: F401
 )
 import homeassistant.util.dt as dt_util
 
+from . import partitions
 from .const import (
     DEFAULT_MAX_BIND_VARS,
     DOMAIN,
@@ -493,6 +494,15 @@ def async_create_backup_failure_issue(
     )
 
 
+def setup_read_only_sqlite_connection(
+    dbapi_connection: DBAPIConnection, connection_record: Any
+) -> None:
+    """Execute statements needed for read only SQLite connections."""
+    # The upper bound on the cache size is approximately 16MiB of memory
+    execute_on_connection(dbapi_connection, "PRAGMA cache_size = -16384")
+    execute_on_connection(dbapi_connection, "PRAGMA query_only = ON")
+
+
 def setup_connection_for_dialect(
     instance: Recorder,
     dialect_name: str,
@@ -786,6 +796,12 @@ def periodic_db_cleanups(instance: Recorder) -> None:
         with instance.engine.connect() as connection:
             connection.execute(text("PRAGMA wal_checkpoint(TRUNCATE);"))
             connection.execute(text("PRAGMA OPTIMIZE;"))
+    if instance.partition_interval:
+        _LOGGER.debug("Creating upcoming partitions")
+        with session_scope(session=instance.get_session()) as session:
+            partitions.create_partitions(
+                session, instance.partition_interval, dt_util.utcnow()
+            )
 
 
 @contextmanager
@@ -9,6 +9,7 @@ import datetime
 import itertools
 import logging
 import math
+from operator import attrgetter
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -29,6 +30,7 @@ from homeassistant.const import (
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
+    UnitOfSpeed,
     UnitOfVolume,
 )
 from homeassistant.core import HomeAssistant, State, callback, split_entity_id
@@ -67,6 +69,8 @@ EQUIVALENT_UNITS = {
     "ft³/m": UnitOfVolumeFlowRate.CUBIC_FEET_PER_MINUTE,
 }
 
+# Units which are not converted to or from by a linear function
+NON_LINEAR_UNITS = {UnitOfSpeed.BEAUFORT}
 
 # Keep track of entities for which a warning about decreasing value has been logged
 SEEN_DIP: HassKey[set[str]] = HassKey(f"{DOMAIN}_seen_total_increasing_dip")
@@ -283,6 +287,73 @@ def _normalize_states(
     return statistics_unit, valid_fstates
 
 
+def _normalize_aggregates(
+    old_metadatas: dict[str, tuple[int, StatisticMetaData]],
+    aggregates: list[history.NumericStatesAggregate],
+    entity_id: str,
+    end: datetime.datetime,
+) -> tuple[str | None, tuple[float, float, float]] | None:
+    """Normalize units of aggregated states and return the unit, mean, min and max.
+
+    None is returned if the states need to be normalized one by one, which
+    is the case if the unit of some states is not known, not stable or can't
+    be converted with a linear function.
+    """
+    aggregates = sorted(aggregates, key=attrgetter("first_ts"))
+    units: list[str | None] = []
+    for aggregate in aggregates:
+        if aggregate.attributes is None:
+            return None
+        units.append(aggregate.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+    state_unit = units[0]
+    statistics_unit: str | None
+    if old_metadata := old_metadatas.get(entity_id):
+        statistics_unit = old_metadata[1]["unit_of_measurement"]
+    else:
+        statistics_unit = state_unit
+
+    converters: list[Callable[[float], float] | None] = []
+    if statistics_unit not in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER:
+        if not _equivalent_units(set(units)):
+            return None
+        statistics_unit = state_unit
+        converters = [None] * len(units)
+    else:
+        converter = statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER[statistics_unit]
+        for unit in units:
+            if unit not in converter.VALID_UNITS or (
+                unit != statistics_unit
+                and NON_LINEAR_UNITS.intersection((unit, statistics_unit))
+            ):
+                return None
+            converters.append(
+                None
+                if unit == statistics_unit
+                else converter.converter_factory(unit, statistics_unit)
+            )
+
+    accumulated = 0.0
+    minimums: list[float] = []
+    maximums: list[float] = []
+    for aggregate, convert in zip(aggregates, converters, strict=True):
+        if convert is None:
+            accumulated += aggregate.weighted_sum
+            minimums.append(aggregate.min)
+            maximums.append(aggregate.max)
+            continue
+        if aggregate.duration:
+            # The conversion is linear, so the average of the states
+            # converts like a single state
+            accumulated += (
+                convert(aggregate.weighted_sum / aggregate.duration)
+                * aggregate.duration
+            )
+        minimums.append(convert(aggregate.min))
+        maximums.append(convert(aggregate.max))
+    mean = accumulated / (end.timestamp() - aggregates[0].first_ts)
+    return statistics_unit, (mean, min(minimums), max(maximums))
+
+
 def _suggest_report_issue(hass: HomeAssistant, entity_id: str) -> str:
     """Suggest to report an issue."""
     entity_info = entity_sources(hass).get(entity_id)
@@ -402,6 +473,23 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _add_float_states(
+    entities_with_float_states: dict[str, list[tuple[float, State]]],
+    history_list: dict[str, list[State]],
+    sensor_states: list[State],
+) -> None:
+    """Add the float states of the history of sensors."""
+    for _state in sensor_states:
+        entity_id = _state.entity_id
+        # If there are no recent state changes, the sensor's state may already be pruned
+        # from the recorder. Get the state from the state machine instead.
+        if not (entity_history := history_list.get(entity_id, [_state])):
+            continue
+        if not (float_states := _entity_history_to_float_and_state(entity_history)):
+            continue
+        entities_with_float_states[entity_id] = float_states
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -413,13 +501,33 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list: dict[str, list[State]] = {}
-    if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
+    entities_significant_history = [
+        i.entity_id
+        for i in sensor_states
+        if "sum" not in wanted_statistics[i.entity_id]
+    ]
+    # The states recorded since the sensors were tracked are accumulated
+    # by the recorder, the database is only queried for other sensors
+    accumulator = get_instance(hass).statistics_accumulator
+    history_list = accumulator.pop_states(entities_full_history, start, end)
+    entities_aggregates = accumulator.pop_aggregates(
+        entities_significant_history, start, end
+    )
+    accumulator.track(
+        (i for i in sensor_states if "sum" not in wanted_statistics[i.entity_id]),
+        (i for i in sensor_states if "sum" in wanted_statistics[i.entity_id]),
+    )
+
+    # Get history between start and end
+    if entities_full_history := [
+        entity_id
+        for entity_id in entities_full_history
+        if entity_id not in history_list
+    ]:
+        _history_list = history.get_full_significant_states_with_session(
             hass,
             session,
             start - datetime.timedelta.resolution,
@@ -427,11 +535,25 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_full_history,
             significant_changes_only=False,
         )
-    entities_significant_history = [
-        i.entity_id
-        for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
-    ]
+        history_list = {**history_list, **_history_list}
+    # The mean, min and max are computed from aggregates of the numeric
+    # states by the database, the states are only loaded for entities
+    # which have no aggregates or whose aggregates can't be normalized
+    if entities_significant_history := [
+        entity_id
+        for entity_id in entities_significant_history
+        if entity_id not in entities_aggregates
+    ]:
+        entities_aggregates.update(
+            history.get_numeric_states_aggregates_with_session(
+                hass, session, start, end, entities_significant_history
+            )
+        )
+        entities_significant_history = [
+            entity_id
+            for entity_id in entities_significant_history
+            if entity_id not in entities_aggregates
+        ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
             hass,
@@ -443,27 +565,63 @@ def compile_statistics(  # noqa: C901
         history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
-    for _state in sensor_states:
-        entity_id = _state.entity_id
-        # If there are no recent state changes, the sensor's state may already be pruned
-        # from the recorder. Get the state from the state machine instead.
-        if not (entity_history := history_list.get(entity_id, [_state])):
-            continue
-        if not (float_states := _entity_history_to_float_and_state(entity_history)):
-            continue
-        entities_with_float_states[entity_id] = float_states
+    _add_float_states(
+        entities_with_float_states,
+        history_list,
+        [
+            state
+            for state in sensor_states
+            if state.entity_id not in entities_aggregates
+        ],
+    )
 
     # Only lookup metadata for entities that have valid float states
     # since it will result in cache misses for statistic_ids
     # that are not in the metadata table and we are not working
     # with them anyway.
     old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+        get_instance(hass),
+        session,
+        statistic_ids=set(entities_with_float_states).union(entities_aggregates),
     )
+    aggregated_statistics: dict[str, tuple[str | None, tuple[float, float, float]]] = {}
+    for entity_id, aggregates in entities_aggregates.items():
+        if aggregates and (
+            normalized := _normalize_aggregates(
+                old_metadatas, aggregates, entity_id, end
+            )
+        ):
+            aggregated_statistics[entity_id] = normalized
+    if entities_state_history := [
+        entity_id
+        for entity_id, aggregates in entities_aggregates.items()
+        if aggregates and entity_id not in aggregated_statistics
+    ]:
+        _add_float_states(
+            entities_with_float_states,
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_state_history,
+            ),
+            [
+                state
+                for state in sensor_states
+                if state.entity_id in entities_state_history
+            ],
+        )
+
     to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
+        state_class: str = _state.attributes[ATTR_STATE_CLASS]
+        if entity_id in aggregated_statistics:
+            statistics_unit = aggregated_statistics[entity_id][0]
+            to_process.append((entity_id, statistics_unit, state_class, []))
+            continue
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
         statistics_unit, valid_float_states = _normalize_states(
@@ -474,7 +632,6 @@ def compile_statistics(  # noqa: C901
         )
         if not valid_float_states:
             continue
-        state_class: str = _state.attributes[ATTR_STATE_CLASS]
         to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
         if "sum" in wanted_statistics[entity_id]:
             to_query.add(entity_id)
@@ -525,17 +682,20 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+        if entity_id in aggregated_statistics:
+            stat["mean"], stat["min"], stat["max"] = aggregated_statistics[entity_id][1]
+        else:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
 
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(valid_float_states, start, end)
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
@@ -80,7 +80,11 @@ class TriggerUpdateCoordinator(DataUpdateCoordinator):
 
         if CONF_CONDITION in self.config:
             self._cond_func = await condition.async_conditions_from_config(
-                self.hass, self.config[CONF_CONDITION], _LOGGER, "template entity"
+                self.hass,
+                self.config[CONF_CONDITION],
+                _LOGGER,
+                "template entity",
+                compiled=True,
             )
 
         if start_event is not None:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
+from dataclasses import dataclass
 from functools import lru_cache, partial
 import json
 import logging
@@ -19,6 +21,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -60,6 +63,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +71,9 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+DATA_ENTITIES_BROADCASTER: HassKey[EntitiesBroadcaster] = HassKey(
+    "websocket_api_entities_broadcaster"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -105,6 +112,155 @@ def pong_message(iden: int) -> dict[str, Any]:
     return {"id": iden, "type": "pong"}
 
 
+def _coalesce_seconds(connection: ActiveConnection, msg: dict[str, Any]) -> float:
+    """Return the coalescing window of a subscription in seconds.
+
+    The window of the subscription defaults to the one the connection
+    set in its supported features, 0 sends each change at once.
+    """
+    coalesce_ms = msg.get(
+        "coalesce_ms", connection.supported_features.get(const.FEATURE_COALESCE_MS, 0)
+    )
+    return min(max(coalesce_ms, 0), const.MAX_COALESCE_MS) / 1000
+
+
+class _CoalescedEvents:
+    """Forward the events of a subscription once per coalescing window.
+
+    The state changes of an entity during a window are collapsed to the
+    latest one.
+    """
+
+    __slots__ = (
+        "_event_count",
+        "_hass",
+        "_handle",
+        "_pending",
+        "message_id_as_bytes",
+        "send_message",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[bytes | str | dict[str, Any]], None],
+        message_id_as_bytes: bytes,
+    ) -> None:
+        """Initialize the coalesced events."""
+        self._hass = hass
+        self.send_message = send_message
+        self.message_id_as_bytes = message_id_as_bytes
+        self._pending: dict[str | int, bytes] = {}
+        self._event_count = 0
+        self._handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(self, event: Event, seconds: float) -> None:
+        """Add an event to the window, the window starts with its first event."""
+        key: str | int
+        if event.event_type == EVENT_STATE_CHANGED:
+            key = event.data["entity_id"]
+            # The latest change is sent in the position of the latest event
+            self._pending.pop(key, None)
+        else:
+            key = self._event_count
+            self._event_count += 1
+        self._pending[key] = messages.cached_event_message(
+            self.message_id_as_bytes, event
+        )
+        if self._handle is None:
+            self._handle = self._hass.loop.call_later(seconds, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the events of the window."""
+        self._handle = None
+        pending = self._pending
+        self._pending = {}
+        # The messages are queued together so they are
+        # written in a single frame if the client coalesces
+        for message in pending.values():
+            self.send_message(message)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the events of the window."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._pending.clear()
+
+
+class _CoalescedStates:
+    """Forward the state changes of subscribe_entities once per coalescing window.
+
+    The changes of an entity during a window are merged into a single
+    diff from its state before the window to its latest state.
+    """
+
+    __slots__ = ("_hass", "_handle", "_pending", "message_id_as_bytes", "send_message")
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[bytes | str | dict[str, Any]], None],
+        message_id_as_bytes: bytes,
+    ) -> None:
+        """Initialize the coalesced states."""
+        self._hass = hass
+        self.send_message = send_message
+        self.message_id_as_bytes = message_id_as_bytes
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(self, event: Event[EventStateChangedData], seconds: float) -> None:
+        """Add a state change to the window, the window starts with its first change."""
+        data = event.data
+        entity_id = data["entity_id"]
+        if (pending := self._pending.get(entity_id)) is None:
+            self._pending[entity_id] = (data["old_state"], data["new_state"])
+        else:
+            self._pending[entity_id] = (pending[0], data["new_state"])
+        if self._handle is None:
+            self._handle = self._hass.loop.call_later(seconds, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the merged state changes of the window."""
+        self._handle = None
+        pending = self._pending
+        self._pending = {}
+        if message := messages.coalesced_state_diff_message(
+            self.message_id_as_bytes,
+            (
+                (entity_id, old_state, new_state)
+                for entity_id, (old_state, new_state) in pending.items()
+            ),
+        ):
+            self.send_message(message)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the state changes of the window."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._pending.clear()
+
+
+def _can_read_entity(user: User, entity_id: str) -> bool:
+    """Return if a user can read the state of an entity."""
+    # We have to lookup the permissions again because the user might have
+    # changed since the subscription was created.
+    if user.is_admin:
+        return True
+    permissions = user.permissions
+    return permissions.access_all_entities(POLICY_READ) or permissions.check_entity(
+        entity_id, POLICY_READ
+    )
+
+
 @callback
 def _forward_events_check_permissions(
     send_message: Callable[[bytes | str | dict[str, Any]], None],
@@ -113,14 +269,7 @@ def _forward_events_check_permissions(
     event: Event,
 ) -> None:
     """Forward state changed events to websocket."""
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
+    if not _can_read_entity(user, event.data["entity_id"]):
         return
     send_message(messages.cached_event_message(message_id_as_bytes, event))
 
@@ -135,11 +284,27 @@ def _forward_events_unconditional(
     send_message(messages.cached_event_message(message_id_as_bytes, event))
 
 
+@callback
+def _forward_coalesced_events(
+    coalesced: _CoalescedEvents,
+    seconds: float,
+    user: User | None,
+    event: Event,
+) -> None:
+    """Forward events to websocket once per coalescing window."""
+    if user is not None and not _can_read_entity(user, event.data["entity_id"]):
+        return
+    coalesced.async_add(event, seconds)
+
+
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_events",
         vol.Optional("event_type", default=MATCH_ALL): str,
+        vol.Optional("coalesce_ms"): vol.All(
+            int, vol.Range(min=0, max=const.MAX_COALESCE_MS)
+        ),
     }
 )
 def handle_subscribe_events(
@@ -158,6 +323,28 @@ def handle_subscribe_events(
 
     message_id_as_bytes = str(msg["id"]).encode()
 
+    if coalesce_seconds := _coalesce_seconds(connection, msg):
+        coalesced = _CoalescedEvents(hass, connection.send_message, message_id_as_bytes)
+        unsub = hass.bus.async_listen(
+            event_type,
+            partial(
+                _forward_coalesced_events,
+                coalesced,
+                coalesce_seconds,
+                connection.user if event_type == EVENT_STATE_CHANGED else None,
+            ),
+        )
+
+        @callback
+        def unsub_coalesced() -> None:
+            """Stop forwarding events and drop the pending ones."""
+            unsub()
+            coalesced.async_cancel()
+
+        connection.subscriptions[msg["id"]] = unsub_coalesced
+        connection.send_result(msg["id"])
+        return
+
     if event_type == EVENT_STATE_CHANGED:
         forward_events = partial(
             _forward_events_check_permissions,
@@ -367,31 +554,90 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+@dataclass(slots=True)
+class _EntitiesSubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    send_message: Callable[[str | bytes | dict[str, Any]], None]
+    entity_ids: set[str] | None
+    entity_filter: Callable[[str], bool] | None
+    user: User
+    message_id_as_bytes: bytes
+    coalesce_seconds: float = 0
+    coalesced: _CoalescedStates | None = None
+
+
+class EntitiesBroadcaster:
+    """Forward state changes to the subscribe_entities subscriptions.
+
+    A single listener serves every connection. The message of each state
+    change is serialized once per message id, and connections which
+    subscribed with the same id are sent the same bytes. Permissions are
+    only checked for users which can't read all entities. Subscriptions
+    with a coalescing window are sent the merged changes of each window.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the broadcaster."""
+        self._hass = hass
+        self._subscriptions: tuple[_EntitiesSubscription, ...] = ()
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(self, subscription: _EntitiesSubscription) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_entity_changes
+            )
+        self._subscriptions = (*self._subscriptions, subscription)
+        return partial(self._async_unsubscribe, subscription)
+
+    @callback
+    def _async_unsubscribe(self, subscription: _EntitiesSubscription) -> None:
+        """Remove a subscription."""
+        self._subscriptions = tuple(
+            other for other in self._subscriptions if other is not subscription
+        )
+        if subscription.coalesced is not None:
+            subscription.coalesced.async_cancel()
+        if not self._subscriptions and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_forward_entity_changes(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Forward entity state changed events to websocket."""
+        entity_id = event.data["entity_id"]
+        messages_by_id: dict[bytes, bytes] = {}
+        user_can_read: dict[str, bool] = {}
+        for subscription in self._subscriptions:
+            if (
+                (entity_ids := subscription.entity_ids) and entity_id not in entity_ids
+            ) or (
+                (entity_filter := subscription.entity_filter)
+                and not entity_filter(entity_id)
+            ):
+                continue
+            user = subscription.user
+            if not user.is_admin:
+                if (can_read := user_can_read.get(user.id)) is None:
+                    can_read = user_can_read[user.id] = _can_read_entity(
+                        user, entity_id
+                    )
+                if not can_read:
+                    continue
+            if subscription.coalesced is not None:
+                subscription.coalesced.async_add(event, subscription.coalesce_seconds)
+                continue
+            message_id_as_bytes = subscription.message_id_as_bytes
+            if (message := messages_by_id.get(message_id_as_bytes)) is None:
+                message = messages_by_id[message_id_as_bytes] = (
+                    messages.cached_state_diff_message(message_id_as_bytes, event)
+                )
+            subscription.send_message(message)
 
 
 @callback
@@ -399,6 +645,9 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_ms"): vol.All(
+            int, vol.Range(min=0, max=const.MAX_COALESCE_MS)
+        ),
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -415,16 +664,21 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
+    if (broadcaster := hass.data.get(DATA_ENTITIES_BROADCASTER)) is None:
+        broadcaster = hass.data[DATA_ENTITIES_BROADCASTER] = EntitiesBroadcaster(hass)
+    coalesce_seconds = _coalesce_seconds(connection, msg)
+    connection.subscriptions[msg_id] = broadcaster.async_subscribe(
+        _EntitiesSubscription(
             connection.send_message,
             entity_ids,
             entity_filter,
             connection.user,
             message_id_as_bytes,
-        ),
+            coalesce_seconds,
+            _CoalescedStates(hass, connection.send_message, message_id_as_bytes)
+            if coalesce_seconds
+            else None,
+        )
     )
     connection.send_result(msg_id)
 
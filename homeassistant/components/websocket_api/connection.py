@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Awaitable, Callable, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -48,6 +48,7 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "drain",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -70,6 +71,9 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        # Waits until the client is reading the queued messages, set by
+        # the websocket handler once the connection is authenticated
+        self.drain: Callable[[], Awaitable[None]] = self._async_drained
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
@@ -86,6 +90,9 @@ class ActiveConnection:
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
 
+    async def _async_drained(self) -> None:
+        """Return at once, no messages are queued for the client."""
+
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
         description = self.user.name or ""
@@ -58,3 +58,8 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+
+# Changes of subscriptions are held back for up to this window, the
+# latest state of each entity is sent once the window ends
+FEATURE_COALESCE_MS = "coalesce_ms"
+MAX_COALESCE_MS = 60000
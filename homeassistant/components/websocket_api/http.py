@@ -84,6 +84,7 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_drain_future",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -107,6 +108,7 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        self._drain_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -157,16 +159,14 @@ class WebSocketHandler:
 
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
-                    if is_debug_log_enabled():
-                        debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
-                    continue
-
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
+                else:
+                    message = b"".join((b"[", b",".join(message_queue), b"]"))
+                    message_queue.clear()
+                if not message_queue and self._drain_future is not None:
+                    self._release_drain_future()
                 if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                    debug("%s: Sending %s", self.description, message)
+                await send_bytes_text(message)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -176,6 +176,29 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._release_drain_future()
+
+    async def _async_drain(self) -> None:
+        """Wait until the writer has taken all queued messages.
+
+        The last message taken may still be being written, so a handler
+        awaiting this before queuing its next message keeps at most one
+        more message in memory while a slow client reads.
+        """
+        if self._closing or not self._message_queue:
+            return
+        if (drain_future := self._drain_future) is None:
+            drain_future = self._drain_future = self._loop.create_future()
+        # Shielded as several handlers may wait for the same future
+        await asyncio.shield(drain_future)
+
+    @callback
+    def _release_drain_future(self) -> None:
+        """Release the handlers waiting for the queue to drain."""
+        if (drain_future := self._drain_future) is not None:
+            self._drain_future = None
+            if not drain_future.done():
+                drain_future.set_result(None)
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -288,6 +311,7 @@ class WebSocketHandler:
         """Cancel the connection."""
         self._closing = True
         self._cancel_peak_checker()
+        self._release_drain_future()
         if self._handle_task is not None:
             self._handle_task.cancel()
         if self._writer_task is not None:
@@ -403,6 +427,7 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
+        connection.drain = self._async_drain
         self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
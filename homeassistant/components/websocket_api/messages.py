@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from functools import lru_cache
 import logging
 from typing import Any, Final
@@ -15,7 +16,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -177,6 +178,40 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+def coalesced_state_diff_message(
+    message_id_as_bytes: bytes,
+    changes: Iterable[tuple[str, State | None, State | None]],
+) -> bytes | None:
+    """Return an event message with the state diffs of several entities.
+
+    Each change is an entity id with its state before and after the
+    changes, returns None if nothing changed.
+    """
+    event: dict[str, Any] = {}
+    for entity_id, old_state, new_state in changes:
+        if old_state is None and new_state is None:
+            # Added and removed again
+            continue
+        for key, value in _state_diff(entity_id, old_state, new_state).items():
+            if key == ENTITY_EVENT_REMOVE:
+                event.setdefault(key, []).extend(value)
+            else:
+                event.setdefault(key, {}).update(value)
+    if not event:
+        return None
+    return b"".join(
+        (
+            (
+                _message_to_json_bytes_or_none({"type": "event", "event": event})
+                or INVALID_JSON_PARTIAL_MESSAGE
+            )[:-1],
+            b',"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -185,7 +220,21 @@ def _state_diff_event(
     | dict[str, CompressedState]
     | dict[str, dict[str, dict[str, str | list[str]]]],
 ]:
-    """Convert a state_changed event to the minimal version.
+    """Convert a state_changed event to the minimal version."""
+    return _state_diff(
+        event.data["entity_id"], event.data["old_state"], event.data["new_state"]
+    )
+
+
+def _state_diff(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> dict[
+    str,
+    list[str]
+    | dict[str, CompressedState]
+    | dict[str, dict[str, dict[str, str | list[str]]]],
+]:
+    """Convert a change of the state of an entity to the minimal version.
 
     State update example
 
@@ -195,9 +244,9 @@ def _state_diff_event(
         "r": [entity_id,…]
     }
     """
-    if (new_state := event.data["new_state"]) is None:
-        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
-    if (old_state := event.data["old_state"]) is None:
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if old_state is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
@@ -18,7 +18,7 @@ from collections.abc import (
     ValuesView,
 )
 import concurrent.futures
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import datetime
 import enum
 import functools
@@ -104,8 +104,13 @@ from .util.event_type import EventType
 from .util.executor import InterruptibleThreadPoolExecutor
 from .util.hass_dict import HassDict
 from .util.json import JsonObjectType
-from .util.read_only_dict import ReadOnlyDict
+from .util.read_only_dict import ReadOnlyDict, ReadOnlyDictPool
 from .util.timeout import TimeoutManager
+from .util.timer_wheel import (
+    DEFAULT_MIN_DELAY as TIMER_WHEEL_MIN_DELAY,
+    DEFAULT_RESOLUTION as TIMER_WHEEL_RESOLUTION,
+    TimerWheel,
+)
 from .util.ulid import ulid_at_time, ulid_now
 
 # Typing imports that create a circular dependency
@@ -201,6 +206,11 @@ _DEPRECATED_Config = DeferredDeprecatedAlias(
 # How long to wait until things that run on startup have to finish.
 TIMEOUT_EVENT_START = 15
 
+# Attributes are indexed on their first lookup until there are this many
+# indexes, lookups of other attributes scan all states. Each index is
+# updated on every state write.
+MAX_AUTO_ATTRIBUTE_INDEXES = 8
+
 
 EVENTS_EXCLUDED_FROM_MATCH_ALL = {
     EVENT_HOMEASSISTANT_CLOSE,
@@ -458,6 +468,10 @@ class HomeAssistant:
         self._stopped: asyncio.Event | None = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # Coalesces the timers of the event helpers
+        self.timer_wheel = TimerWheel(
+            self.loop, TIMER_WHEEL_RESOLUTION, TIMER_WHEEL_MIN_DELAY
+        )
         self._stop_future: concurrent.futures.Future[None] | None = None
         self._shutdown_jobs: list[HassJobWithArgs] = []
         self.import_executor = InterruptibleThreadPoolExecutor(
@@ -1246,6 +1260,13 @@ class HomeAssistant:
                 and job.cancel_on_shutdown
             ):
                 handle.cancel()
+        for timer in self.timer_wheel.timers():
+            if (
+                (args := timer.args)
+                and type(job := args[0]) is HassJob
+                and job.cancel_on_shutdown
+            ):
+                timer.cancel()
 
     def _async_log_running_tasks(self, stage: str) -> None:
         """Log all running tasks."""
@@ -1455,6 +1476,50 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
+@dataclass(slots=True)
+class _BatchedListener(Generic[_DataT]):
+    hass: HomeAssistant
+    listener_job: HassJob[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None]
+    window: float | None
+    events: list[Event[_DataT]] = field(default_factory=list)
+    handle: asyncio.Handle | None = None
+
+    @callback
+    def __call__(self, event: Event[_DataT]) -> None:
+        """Collect the event and schedule the listener to run."""
+        self.events.append(event)
+        if self.handle is not None:
+            return
+        if self.window:
+            self.handle = self.hass.loop.call_later(self.window, self.async_flush)
+        else:
+            self.handle = self.hass.loop.call_soon(self.async_flush)
+
+    @callback
+    def async_flush(self) -> None:
+        """Pass the collected events to the listener."""
+        self.handle = None
+        if not (events := self.events):
+            return
+        self.events = []
+        self.hass.async_run_hass_job(self.listener_job, events)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the scheduled run and drop the collected events."""
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        self.events = []
+
+    def __repr__(self) -> str:
+        """Return the representation of the listener and source module."""
+        module = inspect.getmodule(self.listener_job.target)
+        if module:
+            return f"<_BatchedListener {module.__name__}:{self.listener_job.target}>"
+        return f"<_BatchedListener {self.listener_job.target}>"
+
+
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
@@ -1651,6 +1716,58 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_batched(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+        window: float | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type and receive them in batches.
+
+        Instead of being called once per event, the listener is called with
+        a list of the events fired since it last ran, in the order they
+        were fired. By default the events fired within one event loop
+        iteration are batched. If window is passed, the listener runs at
+        most once every window seconds.
+
+        This is intended for listeners that can process bursts of events,
+        like state_changed events, more efficiently in bulk.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if the
+        event is added to the batch.
+
+        This method must be run in the event loop.
+        """
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        if event_type == EVENT_STATE_REPORTED and not event_filter:
+            raise HomeAssistantError(f"Event filter is required for event {event_type}")
+        batched_listener: _BatchedListener[_DataT] = _BatchedListener(
+            self._hass, HassJob(listener, f"listen batched {event_type}"), window
+        )
+        remove = self._async_listen_filterable_job(
+            event_type,
+            (
+                HassJob(
+                    batched_listener,
+                    f"batched listen {event_type} {listener}",
+                    job_type=HassJobType.Callback,
+                ),
+                event_filter,
+            ),
+        )
+
+        @callback
+        def _async_remove_batched_listener() -> None:
+            """Remove the listener and drop any pending events."""
+            remove()
+            batched_listener.async_cancel()
+
+        return _async_remove_batched_listener
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -2036,12 +2153,17 @@ class States(UserDict[str, State]):
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    And optional indexes, created with index_attribute or on first use
+    up to MAX_AUTO_ATTRIBUTE_INDEXES:
+    - attribute -> attribute value -> dict[str, State]
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._attribute_index: dict[str, dict[Any, dict[str, State]]] = {}
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2049,6 +2171,10 @@ class States(UserDict[str, State]):
 
     def __setitem__(self, key: str, entry: State) -> None:
         """Add an item."""
+        if self._attribute_index:
+            if (old_entry := self.data.get(key)) is not None:
+                self._remove_from_attribute_index(old_entry)
+            self._add_to_attribute_index(entry)
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
 
@@ -2056,8 +2182,71 @@ class States(UserDict[str, State]):
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
+        if self._attribute_index:
+            self._remove_from_attribute_index(entry)
         super().__delitem__(key)
 
+    def _add_to_attribute_index(self, entry: State) -> None:
+        """Add a state to the attribute indexes."""
+        attributes = entry.attributes
+        for attribute, index in self._attribute_index.items():
+            if (value := attributes.get(attribute)) is None:
+                continue
+            try:
+                bucket = index.setdefault(value, {})
+            except TypeError:
+                # Unhashable values, like lists, are not indexed
+                continue
+            bucket[entry.entity_id] = entry
+
+    def _remove_from_attribute_index(self, entry: State) -> None:
+        """Remove a state from the attribute indexes."""
+        attributes = entry.attributes
+        for attribute, index in self._attribute_index.items():
+            if (value := attributes.get(attribute)) is None:
+                continue
+            try:
+                bucket = index.get(value)
+            except TypeError:
+                continue
+            if bucket is None:
+                continue
+            bucket.pop(entry.entity_id, None)
+            if not bucket:
+                del index[value]
+
+    def index_attribute(self, attribute: str) -> None:
+        """Index states by the value of an attribute."""
+        if attribute in self._attribute_index:
+            return
+        self._attribute_index[attribute] = {}
+        for entry in self.data.values():
+            self._add_to_attribute_index(entry)
+
+    def attribute_states(
+        self, attribute: str, value: Any
+    ) -> ValuesView[State] | list[State] | tuple[()]:
+        """Get all states with an attribute set to a value."""
+        if value is None:
+            return ()
+        try:
+            hash(value)
+        except TypeError:
+            # Unhashable values are never indexed
+            return ()
+        if attribute not in self._attribute_index:
+            if len(self._attribute_index) >= MAX_AUTO_ATTRIBUTE_INDEXES:
+                return [
+                    entry
+                    for entry in self.data.values()
+                    if entry.attributes.get(attribute) == value
+                ]
+            self.index_attribute(attribute)
+        bucket = self._attribute_index[attribute].get(value)
+        if bucket is None:
+            return ()
+        return bucket.values()
+
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
         # Avoid polluting _domain_index with non-existing domains
@@ -2076,7 +2265,15 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_attributes_pool",
+        "_change_count",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2085,9 +2282,22 @@ class StateMachine:
         # up read operations
         self._states_data = self._states.data
         self._reservations: set[str] = set()
+        # Identical attributes are shared between states, the
+        # old and new state of an entity as well as different entities
+        self._attributes_pool = ReadOnlyDictPool()
+        self._change_count = 0
         self._bus = bus
         self._loop = loop
 
+    @property
+    def change_count(self) -> int:
+        """Return the number of state changes and removals so far.
+
+        The count only increases, which makes it possible to detect
+        if any state changed since it was last read.
+        """
+        return self._change_count
+
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
         future = run_callback_threadsafe(
@@ -2157,6 +2367,42 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_index_attribute(self, attribute: str) -> None:
+        """Index the states by the value of an attribute.
+
+        The index is kept up to date on every state write, making
+        async_all_with_attribute lookups for the attribute O(1).
+
+        This method must be run in the event loop.
+        """
+        self._states.index_attribute(attribute)
+
+    @callback
+    def async_all_with_attribute(
+        self,
+        attribute: str,
+        value: Any,
+        domain_filter: str | Iterable[str] | None = None,
+    ) -> list[State]:
+        """Create a list of all states with an attribute set to a value.
+
+        The attribute is indexed on first use until there are
+        MAX_AUTO_ATTRIBUTE_INDEXES indexes, other attributes are looked up
+        by scanning all states, see async_index_attribute. Unhashable
+        values are not indexed and never match.
+
+        This method must be run in the event loop.
+        """
+        states = self._states.attribute_states(attribute, value)
+        if domain_filter is None:
+            return list(states)
+
+        if isinstance(domain_filter, str):
+            domain_filter = (domain_filter.lower(),)
+        domains = set(domain_filter)
+        return [state for state in states if state.domain in domains]
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2199,6 +2445,7 @@ class StateMachine:
             return False
 
         old_state.expire()
+        self._change_count += 1
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -2367,6 +2614,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        else:
+            attributes = self._attributes_pool.intern(attributes or {})
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2385,6 +2634,7 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        self._change_count += 1
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -4,14 +4,17 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
-from collections.abc import Callable, Container, Generator
+from collections.abc import Callable, Container, Generator, Sequence
 from contextlib import contextmanager
 from datetime import datetime, time as dt_time, timedelta
 import functools as ft
+from itertools import groupby
 import logging
+from operator import itemgetter
 import re
 import sys
 from typing import Any, Protocol, cast
+import weakref
 
 import voluptuous as vol
 
@@ -65,6 +68,7 @@ from .template import Template, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -92,6 +96,20 @@ _PLATFORM_ALIASES = {
     "zone": None,
 }
 
+# Relative cost of evaluating a condition. Compiled conditions evaluate the
+# conditions of and, or and not conditions cheapest first.
+_CONDITION_COSTS = {
+    "state": 1,
+    "time": 1,
+    "trigger": 1,
+    "numeric_state": 2,
+    "sun": 2,
+    "device": 3,
+    "zone": 4,
+    "template": 5,
+}
+_DEFAULT_CONDITION_COST = 3
+
 INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
@@ -182,9 +200,199 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
             condition_trace_update_result(result=result)
             return result
 
+    _UNTRACED_CONDITIONS[wrapper] = condition
     return wrapper
 
 
+# The path of a compiled check: the condition type, index and total
+# number of conditions at each level of the flattened conditions
+type _CheckPath = tuple[tuple[str, int, int], ...]
+
+# Condition functions wrapped by trace_condition_function
+_UNTRACED_CONDITIONS: weakref.WeakKeyDictionary[
+    ConditionCheckerType, ConditionCheckerType
+] = weakref.WeakKeyDictionary()
+# The type, configs and checks of and, or and not conditions
+_COMPOUND_CONDITIONS: weakref.WeakKeyDictionary[
+    ConditionCheckerType,
+    tuple[str, Sequence[ConfigType | Template], list[ConditionCheckerType]],
+] = weakref.WeakKeyDictionary()
+
+
+def _condition_cost(config: ConfigType | Template) -> int:
+    """Return the relative cost of evaluating a condition."""
+    if isinstance(config, Template):
+        return _CONDITION_COSTS["template"]
+    condition = config.get(CONF_CONDITION)
+    if condition in ("and", "or", "not"):
+        return sum(_condition_cost(entry) for entry in config["conditions"])
+    if condition == "numeric_state" and CONF_VALUE_TEMPLATE in config:
+        return _CONDITION_COSTS["template"]
+    return _CONDITION_COSTS.get(condition, _DEFAULT_CONDITION_COST)
+
+
+def _compile_checks(
+    operator: str,
+    condition: str,
+    configs: Sequence[ConfigType | Template],
+    checks: list[ConditionCheckerType],
+    path: _CheckPath,
+) -> list[tuple[int, _CheckPath, ConditionCheckerType]]:
+    """Return the untraced checks of conditions with their cost and path.
+
+    The checks of nested and and or conditions are flattened into the
+    checks of their parent with the same operator.
+    """
+    compiled: list[tuple[int, _CheckPath, ConditionCheckerType]] = []
+    total = len(checks)
+    for index, (config, check) in enumerate(zip(configs, checks, strict=True)):
+        check_path = (*path, (condition, index, total))
+        if (compound := _COMPOUND_CONDITIONS.get(check)) is None:
+            compiled.append(
+                (
+                    _condition_cost(config),
+                    check_path,
+                    _UNTRACED_CONDITIONS.get(check, check),
+                )
+            )
+        elif compound[0] == operator != "not":
+            compiled.extend(_compile_checks(operator, *compound, check_path))
+        else:
+            compiled.append(
+                (_condition_cost(config), check_path, _compile_condition(*compound))
+            )
+    return compiled
+
+
+def _index_errors(
+    errors: list[tuple[_CheckPath, ConditionError]],
+) -> list[ConditionErrorIndex]:
+    """Return the errors of compiled checks nested as their conditions are."""
+    errors.sort(key=itemgetter(0))
+    indexed: list[ConditionErrorIndex] = []
+    for (condition, index, total), group in groupby(
+        errors, key=lambda path_error: path_error[0][0]
+    ):
+        group_errors = list(group)
+        path, error = group_errors[0]
+        if len(path) > 1:
+            error = ConditionErrorContainer(
+                path[1][0],
+                errors=_index_errors(
+                    [(path[1:], error) for path, error in group_errors]
+                ),
+            )
+        indexed.append(
+            ConditionErrorIndex(condition, index=index, total=total, error=error)
+        )
+    return indexed
+
+
+def _evaluate_and(
+    condition: str,
+    checks: tuple[tuple[_CheckPath, ConditionCheckerType], ...],
+    hass: HomeAssistant,
+    variables: TemplateVarsType,
+) -> bool:
+    """Test compiled and condition."""
+    errors: list[tuple[_CheckPath, ConditionError]] = []
+    for path, check in checks:
+        try:
+            if check(hass, variables) is False:
+                return False
+        except ConditionError as ex:
+            errors.append((path, ex))
+
+    # Raise the errors if no check was false
+    if errors:
+        raise ConditionErrorContainer(condition, errors=_index_errors(errors))
+
+    return True
+
+
+def _evaluate_or(
+    condition: str,
+    checks: tuple[tuple[_CheckPath, ConditionCheckerType], ...],
+    hass: HomeAssistant,
+    variables: TemplateVarsType,
+) -> bool:
+    """Test compiled or condition."""
+    errors: list[tuple[_CheckPath, ConditionError]] = []
+    for path, check in checks:
+        try:
+            if check(hass, variables) is True:
+                return True
+        except ConditionError as ex:
+            errors.append((path, ex))
+
+    # Raise the errors if no check was true
+    if errors:
+        raise ConditionErrorContainer(condition, errors=_index_errors(errors))
+
+    return False
+
+
+def _evaluate_not(
+    condition: str,
+    checks: tuple[tuple[_CheckPath, ConditionCheckerType], ...],
+    hass: HomeAssistant,
+    variables: TemplateVarsType,
+) -> bool:
+    """Test compiled not condition."""
+    errors: list[tuple[_CheckPath, ConditionError]] = []
+    for path, check in checks:
+        try:
+            if check(hass, variables):
+                return False
+        except ConditionError as ex:
+            errors.append((path, ex))
+
+    # Raise the errors if no check was true
+    if errors:
+        raise ConditionErrorContainer(condition, errors=_index_errors(errors))
+
+    return True
+
+
+_EVALUATORS = {
+    "and": _evaluate_and,
+    "or": _evaluate_or,
+    "not": _evaluate_not,
+}
+
+
+def _compile_condition(
+    operator: str,
+    configs: Sequence[ConfigType | Template],
+    checks: list[ConditionCheckerType],
+    condition: str | None = None,
+) -> ConditionCheckerType:
+    """Compile an and, or or not condition into a single untraced check.
+
+    Nested and and or conditions are flattened into their parent and all
+    conditions are evaluated cheapest first, without trace bookkeeping.
+    The result does not depend on the order, and errors are raised as
+    the traced conditions raise them.
+    """
+    condition = condition or operator
+    compiled_checks = tuple(
+        (path, check)
+        for _, path, check in sorted(
+            _compile_checks(operator, condition, configs, checks, ()),
+            key=itemgetter(0),
+        )
+    )
+    evaluate = _EVALUATORS[operator]
+
+    def compiled_condition(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test compiled condition."""
+        return evaluate(condition, compiled_checks, hass, variables)
+
+    return compiled_condition
+
+
 async def _async_get_condition_platform(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionProtocol | None:
@@ -286,6 +494,7 @@ async def async_and_from_config(
 
         return True
 
+    _COMPOUND_CONDITIONS[if_and_condition] = ("and", config["conditions"], checks)
     return if_and_condition
 
 
@@ -317,6 +526,7 @@ async def async_or_from_config(
 
         return False
 
+    _COMPOUND_CONDITIONS[if_or_condition] = ("or", config["conditions"], checks)
     return if_or_condition
 
 
@@ -348,6 +558,7 @@ async def async_not_from_config(
 
         return True
 
+    _COMPOUND_CONDITIONS[if_not_condition] = ("not", config["conditions"], checks)
     return if_not_condition
 
 
@@ -1070,15 +1281,33 @@ async def async_conditions_from_config(
     condition_configs: list[ConfigType],
     logger: logging.Logger,
     name: str,
+    *,
+    compiled: bool = False,
 ) -> Callable[[TemplateVarsType], bool]:
-    """AND all conditions."""
+    """AND all conditions.
+
+    With compiled set, the conditions are evaluated cheapest first when
+    no trace is recorded. Traced evaluations keep the declared order.
+    """
     checks: list[ConditionCheckerType] = [
         await async_from_config(hass, condition_config)
         for condition_config in condition_configs
     ]
+    compiled_check = (
+        _compile_condition("and", condition_configs, checks, "condition")
+        if compiled
+        else None
+    )
 
     def check_conditions(variables: TemplateVarsType = None) -> bool:
         """AND all conditions."""
+        if compiled_check is not None and trace_cv.get() is None:
+            try:
+                return compiled_check(hass, variables)
+            except ConditionErrorContainer as ex:
+                logger.warning("Error evaluating condition in '%s':\n%s", name, ex)
+                return False
+
         errors: list[ConditionErrorIndex] = []
         for index, check in enumerate(checks):
             try:
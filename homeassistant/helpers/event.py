@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from collections.abc import Callable, Coroutine, Hashable, Iterable, Mapping, Sequence
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import partial, wraps
 import logging
@@ -42,6 +42,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.timer_wheel import TimerWheelHandle
 
 from . import frame
 from .device_registry import (
@@ -75,6 +76,15 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TRACK_UTC_TIME_CHANGE_DATA: HassKey[
+    dict[
+        tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool],
+        _TrackUTCTimeChange,
+    ]
+] = HassKey("track_utc_time_change_data")
+_SHARED_TEMPLATE_RENDERS: HassKey[_SharedTemplateRenders] = HassKey(
+    "shared_template_renders"
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -973,6 +983,90 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+@dataclass(slots=True)
+class _SharedTemplateRender:
+    """Last render of a template shared between template trackers."""
+
+    refs: int = 0
+    event: Event[EventStateChangedData] | None = None
+    change_count: int = -1
+    info: RenderInfo | None = None
+
+
+def _shared_render_key(track_template_: TrackTemplate) -> Hashable | None:
+    """Return the key to share renders of a template, or None if not possible."""
+    template = track_template_.template
+    # Renders with a custom log function are not shared
+    if template._log_fn is not None:  # noqa: SLF001
+        return None
+    variables = track_template_.variables
+    try:
+        key = (
+            template.template,
+            template._limited,  # noqa: SLF001
+            template._strict,  # noqa: SLF001
+            frozenset(variables.items()) if variables else None,
+        )
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class _SharedTemplateRenders:
+    """Share renders of identical templates between template trackers.
+
+    Trackers of the same template with the same variables are triggered by
+    the same state_changed events. The first tracker renders the template
+    and the others reuse its render for that event, as long as no state
+    changed in the meantime.
+    """
+
+    __slots__ = ("_states", "_renders")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared renders."""
+        self._states = hass.states
+        self._renders: dict[Hashable, _SharedTemplateRender] = {}
+
+    @callback
+    def async_ref(self, key: Hashable) -> None:
+        """Register a tracker of the template."""
+        if (shared := self._renders.get(key)) is None:
+            shared = self._renders[key] = _SharedTemplateRender()
+        shared.refs += 1
+
+    @callback
+    def async_unref(self, key: Hashable) -> None:
+        """Unregister a tracker of the template."""
+        shared = self._renders[key]
+        shared.refs -= 1
+        if not shared.refs:
+            del self._renders[key]
+
+    @callback
+    def async_render_to_info(
+        self,
+        key: Hashable,
+        template: Template,
+        variables: TemplateVarsType,
+        event: Event[EventStateChangedData],
+    ) -> RenderInfo:
+        """Render the template unless it was already rendered for the event."""
+        shared = self._renders[key]
+        change_count = self._states.change_count
+        if (
+            shared.info is not None
+            and shared.event is event
+            and shared.change_count == change_count
+        ):
+            return shared.info
+        shared.info = info = template.async_render_to_info(variables)
+        shared.event = event
+        shared.change_count = change_count
+        return info
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -1013,6 +1107,13 @@ class TrackTemplateResultInfo:
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
+        if (shared_renders := hass.data.get(_SHARED_TEMPLATE_RENDERS)) is None:
+            shared_renders = hass.data[_SHARED_TEMPLATE_RENDERS] = (
+                _SharedTemplateRenders(hass)
+            )
+        self._shared_renders = shared_renders
+        self._shared_render_keys: dict[Template, Hashable | None] = {}
+
     def __repr__(self) -> str:
         """Return the representation."""
         return f"<TrackTemplateResultInfo {self._info}>"
@@ -1126,6 +1227,10 @@ class TrackTemplateResultInfo:
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
+        for key in self._shared_render_keys.values():
+            if key is not None:
+                self._shared_renders.async_unref(key)
+        self._shared_render_keys.clear()
 
     @callback
     def async_refresh(self) -> None:
@@ -1176,9 +1281,11 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        if event:
+            info = self._async_render_shared(track_template_, event)
+        else:
+            info = template.async_render_to_info(track_template_.variables)
+        self._info[template] = info
 
         try:
             result: str | TemplateError = info.result()
@@ -1196,6 +1303,30 @@ class TrackTemplateResultInfo:
 
         return TrackTemplateResult(template, last_result, result)
 
+    @callback
+    def _async_render_shared(
+        self, track_template_: TrackTemplate, event: Event[EventStateChangedData]
+    ) -> RenderInfo:
+        """Render the template, reusing the render of an identical template."""
+        template = track_template_.template
+        if template in self._shared_render_keys:
+            key = self._shared_render_keys[template]
+        elif template._compiled is None:  # noqa: SLF001
+            # The environment of the template is only known once compiled
+            key = None
+        else:
+            key = self._shared_render_keys[template] = _shared_render_key(
+                track_template_
+            )
+            if key is not None:
+                self._shared_renders.async_ref(key)
+
+        if key is None:
+            return template.async_render_to_info(track_template_.variables)
+        return self._shared_renders.async_render_to_info(
+            key, template, track_template_.variables, event
+        )
+
     @staticmethod
     def _super_template_as_boolean(result: bool | str | TemplateError) -> bool:
         """Return True if the result is truthy or a TemplateError."""
@@ -1498,13 +1629,13 @@ class _TrackPointUTCTime:
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     utc_point_in_time: datetime
     expected_fire_timestamp: float
-    _cancel_callback: asyncio.TimerHandle | None = None
+    _cancel_callback: asyncio.TimerHandle | TimerWheelHandle | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        loop = self.hass.loop
-        self._cancel_callback = loop.call_at(
-            loop.time() + self.expected_fire_timestamp - time.time(), self
+        hass = self.hass
+        self._cancel_callback = hass.timer_wheel.call_at(
+            hass.loop.time() + self.expected_fire_timestamp - time.time(), self
         )
 
     @callback
@@ -1523,8 +1654,10 @@ class _TrackPointUTCTime:
         # time.
         if (delta := (self.expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
-            loop = self.hass.loop
-            self._cancel_callback = loop.call_at(loop.time() + delta, self)
+            hass = self.hass
+            self._cancel_callback = hass.timer_wheel.call_at(
+                hass.loop.time() + delta, self
+            )
             return
 
         self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
@@ -1589,7 +1722,7 @@ def async_call_at(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_at {loop_time}")
     )
-    return hass.loop.call_at(loop_time, _run_async_call_action, hass, job).cancel
+    return hass.timer_wheel.call_at(loop_time, _run_async_call_action, hass, job).cancel
 
 
 @callback
@@ -1611,8 +1744,9 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    loop = hass.loop
-    return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
+    return hass.timer_wheel.call_at(
+        hass.loop.time() + delay, _run_async_call_action, hass, job
+    ).cancel
 
 
 call_later = threaded_listener_factory(async_call_later)
@@ -1629,7 +1763,7 @@ class _TrackTimeInterval:
     cancel_on_shutdown: bool | None
     _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _timer_handle: asyncio.TimerHandle | TimerWheelHandle | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1651,9 +1785,8 @@ class _TrackTimeInterval:
         if TYPE_CHECKING:
             assert self._track_job is not None
         hass = self.hass
-        loop = hass.loop
-        self._timer_handle = loop.call_at(
-            loop.time() + self.seconds, self._interval_listener, self._track_job
+        self._timer_handle = hass.timer_wheel.call_at(
+            hass.loop.time() + self.seconds, self._interval_listener, self._track_job
         )
 
     @callback
@@ -1796,12 +1929,16 @@ time_tracker_timestamp = time.time
 
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
+    """Shared schedule of all listeners of the same time pattern."""
+
     hass: HomeAssistant
     time_match_expression: tuple[list[int], list[int], list[int]]
     microsecond: int
     local: bool
-    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     listener_job_name: str
+    jobs: dict[HassJob[[datetime], Coroutine[Any, Any, None] | None], None] = field(
+        default_factory=dict
+    )
     _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
     _cancel_callback: CALLBACK_TYPE | None = None
 
@@ -1840,7 +1977,13 @@ class _TrackUTCTimeChange:
             self._pattern_time_change_listener_job,
             self._calculate_next(utc_now + timedelta(seconds=1)),
         )
-        hass.async_run_hass_job(self.job, localized_now, background=True)
+        # A listener may remove itself or others while we iterate
+        for job in list(self.jobs):
+            # A failing listener must not stop the others
+            try:
+                hass.async_run_hass_job(job, localized_now, background=True)
+            except Exception:
+                _LOGGER.exception("Error while running time pattern job %s", job)
 
     @callback
     def async_cancel(self) -> None:
@@ -1850,6 +1993,32 @@ class _TrackUTCTimeChange:
         self._cancel_callback()
 
 
+@callback
+def _async_remove_time_change_listener(
+    hass: HomeAssistant,
+    key: tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool],
+    job: HassJob[[datetime], Coroutine[Any, Any, None] | None],
+) -> None:
+    """Remove a listener from its time pattern schedule."""
+    schedules = hass.data[_TRACK_UTC_TIME_CHANGE_DATA]
+    if (track := schedules.get(key)) is None or job not in track.jobs:
+        return
+    del track.jobs[job]
+    if not track.jobs:
+        track.async_cancel()
+        del schedules[key]
+
+
+@callback
+def async_time_change_schedules_count(hass: HomeAssistant) -> int:
+    """Return the number of distinct time pattern schedules.
+
+    Listeners of async_track_utc_time_change and async_track_time_change
+    with the same time pattern share a schedule.
+    """
+    return len(hass.data.get(_TRACK_UTC_TIME_CHANGE_DATA, ()))
+
+
 @callback
 @bind_hass
 def async_track_utc_time_change(
@@ -1878,21 +2047,34 @@ def async_track_utc_time_change(
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
-    track = _TrackUTCTimeChange(
-        hass,
-        (matching_seconds, matching_minutes, matching_hours),
-        microsecond,
+    # Listeners of the same pattern share one schedule so the next
+    # fire time is only calculated once for all of them
+    key = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
         local,
-        job,
-        listener_job_name,
     )
-    track.async_attach()
-    return track.async_cancel
+    schedules = hass.data.setdefault(_TRACK_UTC_TIME_CHANGE_DATA, {})
+    if (track := schedules.get(key)) is None:
+        # Avoid aligning all time trackers to the same fraction of a second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+        listener_job_name = (
+            f"time change listener {hour}:{minute}:{second} local={local}"
+        )
+        track = _TrackUTCTimeChange(
+            hass,
+            (matching_seconds, matching_minutes, matching_hours),
+            microsecond,
+            local,
+            listener_job_name,
+        )
+        track.async_attach()
+        schedules[key] = track
+    track.jobs[job] = None
+    return partial(_async_remove_time_change_listener, hass, key, job)
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -1975,11 +2157,27 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    new_state = event.data["new_state"]
+    old_state = event.data["old_state"]
 
     if info.filter(entity_id):
-        return True
+        if (
+            new_state is None
+            or old_state is None
+            or (attributes := info.entity_attributes.get(entity_id)) is None
+        ):
+            return True
+        # Only the state and some attributes of the entity were read
+        if new_state.state != old_state.state:
+            return True
+        new_attributes = new_state.attributes
+        old_attributes = old_state.attributes
+        return new_attributes is not old_attributes and any(
+            new_attributes.get(attribute) != old_attributes.get(attribute)
+            for attribute in attributes
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
@@ -12,8 +12,10 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -22,6 +24,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+from time import monotonic
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
@@ -44,11 +47,14 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
@@ -69,6 +75,7 @@ from homeassistant.util import (
     slugify as slugify_util,
 )
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
@@ -85,6 +92,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import STORAGE_DIR
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -102,6 +110,14 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+
+BYTECODE_CACHE_FILE = "core.template_bytecode"
+# Entries not used for this long are evicted when the cache is saved
+BYTECODE_CACHE_MAX_AGE = 30 * 86400
+BYTECODE_CACHE_MAX_ENTRIES = 20000
+# How often the last use of an entry is refreshed
+BYTECODE_CACHE_TOUCH_INTERVAL = 86400
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -385,6 +401,7 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_attributes",
         "rate_limit",
         "has_time",
     )
@@ -403,6 +420,8 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities of which only the state and the listed attributes were read
+        self.entity_attributes: dict[str, collections.abc.Set[str]] = {}
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -415,6 +434,7 @@ class RenderInfo:
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
             f" entities={self.entities}"
+            f" entity_attributes={self.entity_attributes}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
             f" exception={self.exception}"
@@ -457,10 +477,32 @@ class RenderInfo:
         self.all_states = False
 
     def _freeze_sets(self) -> None:
+        if self.entity_attributes:
+            self._freeze_entity_attributes()
         self.entities = frozenset(self.entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
+    def _freeze_entity_attributes(self) -> None:
+        """Merge entities of which only some attributes were read.
+
+        Entities that were also read as a whole, or are part of a tracked
+        domain, re-render on any change of the entity.
+        """
+        entity_attributes = self.entity_attributes
+        entities = self.entities
+        domains = self.domains
+        self.entities = {*entities, *entity_attributes}
+        if self.all_states:
+            self.entity_attributes = {}
+            return
+        self.entity_attributes = {
+            entity_id: frozenset(attributes)
+            for entity_id, attributes in entity_attributes.items()
+            if entity_id not in entities
+            and split_entity_id(entity_id)[0] not in domains
+        }
+
     def _freeze(self) -> None:
         self._freeze_sets()
 
@@ -1045,10 +1087,28 @@ class TemplateStateBase(State):
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
+    def _collect_attribute(self, attribute: str | None) -> None:
+        """Collect a read of the state and optionally of a single attribute."""
+        if self._collect and (render_info := _render_info.get()):
+            if (
+                attributes := render_info.entity_attributes.get(self._entity_id)
+            ) is None:
+                attributes = render_info.entity_attributes[self._entity_id] = set()
+            if attribute is not None:
+                attributes.add(attribute)  # type: ignore[attr-defined]
+
+    def _get_attribute(self, attribute: str) -> Any:
+        """Return a single attribute of the state."""
+        self._collect_attribute(attribute)
+        return self._state.attributes.get(attribute)
+
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
+        if item == "state":
+            self._collect_attribute(None)
+            return self._state.state
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
@@ -1071,7 +1131,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_attribute(None)
         return self._state.state
 
     @property
@@ -1220,6 +1280,25 @@ def _state_generator(
         yield _template_state_no_collect(hass, state)
 
 
+def states_with_attribute(
+    hass: HomeAssistant, attribute: str, value: Any, domain: str | None = None
+) -> list[TemplateState]:
+    """Return the states with an attribute set to a value.
+
+    Uses the attribute index of the state machine instead of
+    iterating over all states of a domain.
+    """
+    if (render_info := _render_info.get()) is not None:
+        if domain is None:
+            render_info.all_states = True
+        else:
+            render_info.domains.add(domain)  # type: ignore[attr-defined]
+    return [
+        _template_state_no_collect(hass, state)
+        for state in hass.states.async_all_with_attribute(attribute, value, domain)
+    ]
+
+
 def _get_state_if_valid(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
     state = hass.states.get(entity_id)
     if state is None and not valid_entity_id(entity_id):
@@ -1876,7 +1955,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._get_attribute(name)  # noqa: SLF001
     return None
 
 
@@ -2793,6 +2872,35 @@ async def async_load_custom_templates(hass: HomeAssistant) -> None:
     _get_hass_loader(hass).sources = custom_templates
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the persisted compiled templates and save them once started."""
+    bytecode_cache = TemplateBytecodeCache(
+        hass.config.path(STORAGE_DIR, BYTECODE_CACHE_FILE)
+    )
+    await hass.async_add_executor_job(bytecode_cache.load)
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+    async def _async_started(_: Any) -> None:
+        """Report the time spent compiling templates during startup."""
+        _LOGGER.debug(
+            (
+                "Templates compiled during startup: %s loaded from cache in %.3fs,"
+                " %s compiled in %.3fs"
+            ),
+            bytecode_cache.hits,
+            bytecode_cache.load_time,
+            bytecode_cache.misses,
+            bytecode_cache.compile_time,
+        )
+        await bytecode_cache.async_save(hass)
+
+    async def _async_final_write(_: Any) -> None:
+        await bytecode_cache.async_save(hass)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_started)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_final_write)
+
+
 def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     result = {}
     jinja_path = hass.config.path("custom_templates")
@@ -2841,6 +2949,102 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+class TemplateBytecodeCache:
+    """Persistent cache of compiled template code.
+
+    Code objects are stored with marshal, keyed by the kind of environment
+    and a hash of the template source. The whole cache is discarded when
+    the version of Python, Jinja or Home Assistant changes, and entries
+    that were not used for BYTECODE_CACHE_MAX_AGE are evicted on save.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the cache."""
+        self._path = path
+        self._version = f"{sys.version}|{jinja2.__version__}|{__version__}"
+        self._entries: dict[str, tuple[CodeType, float]] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0.0
+        self.compile_time = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of cached templates."""
+        return len(self._entries)
+
+    def load(self) -> None:
+        """Load the cache from disk.
+
+        Must be run in the executor.
+        """
+        start = monotonic()
+        try:
+            with open(self._path, "rb") as file:
+                data = marshal.load(file)
+        except FileNotFoundError:
+            return
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.warning("Unable to load template cache %s: %s", self._path, err)
+            self._dirty = True
+            return
+        if not isinstance(data, dict) or data.get("version") != self._version:
+            _LOGGER.debug("Discarding template cache of a different version")
+            self._dirty = True
+            return
+        self._entries = data["templates"]
+        self.load_time = monotonic() - start
+
+    def compile(self, key: str, compile_source: Callable[[], CodeType]) -> CodeType:
+        """Return the cached code or compile it."""
+        now = dt_util.utcnow().timestamp()
+        if (entry := self._entries.get(key)) is not None:
+            self.hits += 1
+            code, last_used = entry
+            if now - last_used > BYTECODE_CACHE_TOUCH_INTERVAL:
+                self._entries[key] = (code, now)
+                self._dirty = True
+            return code
+        start = monotonic()
+        code = compile_source()
+        self.compile_time += monotonic() - start
+        self.misses += 1
+        self._entries[key] = (code, now)
+        self._dirty = True
+        return code
+
+    async def async_save(self, hass: HomeAssistant) -> None:
+        """Save the cache if it changed."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        entries = self._entries.copy()
+        kept = await hass.async_add_executor_job(self._save, entries)
+        for key in entries.keys() - kept:
+            self._entries.pop(key, None)
+
+    def _save(self, entries: dict[str, tuple[CodeType, float]]) -> set[str]:
+        """Evict stale entries and write the cache to disk."""
+        min_last_used = dt_util.utcnow().timestamp() - BYTECODE_CACHE_MAX_AGE
+        kept = {
+            key: entry for key, entry in entries.items() if entry[1] > min_last_used
+        }
+        if len(kept) > BYTECODE_CACHE_MAX_ENTRIES:
+            kept = dict(
+                sorted(kept.items(), key=lambda item: item[1][1])[
+                    -BYTECODE_CACHE_MAX_ENTRIES:
+                ]
+            )
+        data = marshal.dumps({"version": self._version, "templates": kept})
+        try:
+            pathlib.Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+            write_utf8_file(self._path, data, private=True, mode="wb")
+        except WriteError:
+            # The error is already logged, try again on the next save
+            self._dirty = True
+        return set(kept)
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2854,6 +3058,10 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # Environments with a custom log function are not persisted
+        self._bytecode_cache_prefix = (
+            None if log_fn is not None else f"{int(bool(limited))}{int(bool(strict))}"
+        )
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3068,6 +3276,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 "is_state_attr",
                 "state_attr",
                 "states",
+                "states_with_attribute",
                 "state_translated",
                 "has_value",
                 "utcnow",
@@ -3097,6 +3306,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 "has_value",
                 "label_id",
                 "label_name",
+                "states_with_attribute",
             ]
             hass_tests = [
                 "has_value",
@@ -3129,6 +3339,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.filters["state_attr"] = self.globals["state_attr"]
         self.globals["states"] = AllStates(hass)
         self.filters["states"] = self.globals["states"]
+        self.globals["states_with_attribute"] = hassfunction(states_with_attribute)
+        self.filters["states_with_attribute"] = self.globals["states_with_attribute"]
         self.globals["state_translated"] = StateTranslated(hass)
         self.filters["state_translated"] = self.globals["state_translated"]
         self.globals["has_value"] = hassfunction(has_value)
@@ -3209,7 +3421,19 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is not None
+            and self._bytecode_cache_prefix is not None
+            and isinstance(source, str)
+            and (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is not None
+        ):
+            source_hash = hashlib.sha256(source.encode()).hexdigest()
+            compiled = bytecode_cache.compile(
+                f"{self._bytecode_cache_prefix}:{source_hash}",
+                partial(super().compile, source),
+            )
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
@@ -7,16 +7,21 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import condition, config_validation as cv
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.trace import trace_clear, trace_cv
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +313,335 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def state_attributes_memory(hass):
+    """Measure the memory per entity of 12k states with shared attributes."""
+    entity_count = 12000
+    start = timer()
+
+    def make_attributes(idx: int, with_name: bool) -> dict[str, str | int | None]:
+        # Entities of the same device model share all attributes but the name
+        attributes: dict[str, str | int | None] = {
+            "state_class": "measurement",
+            "unit_of_measurement": "°C" if idx % 2 else "W",
+            "device_class": "temperature" if idx % 2 else "power",
+            "icon": None,
+            "supported_features": idx % 3,
+        }
+        if with_name:
+            attributes["friendly_name"] = f"Entity {idx}"
+        return attributes
+
+    def measure(create_state, with_name: bool) -> float:
+        # Hold on to the old and new state of every write like listeners do
+        held: list[core.State] = []
+        tracemalloc.start()
+        start_size = tracemalloc.get_traced_memory()[0]
+        for idx in range(entity_count):
+            entity_id = f"sensor.entity_{idx}"
+            held.append(create_state(entity_id, "1", make_attributes(idx, with_name)))
+            held.append(create_state(entity_id, "2", make_attributes(idx, with_name)))
+        size = tracemalloc.get_traced_memory()[0] - start_size
+        tracemalloc.stop()
+        for state in held:
+            hass.states.async_remove(state.entity_id)
+        return size / entity_count
+
+    def create_unshared(entity_id, state, attributes):
+        return core.State(entity_id, state, attributes)
+
+    def create_shared(entity_id, state, attributes):
+        hass.states.async_set(entity_id, state, attributes)
+        return hass.states.get(entity_id)
+
+    for with_name in (False, True):
+        before = measure(create_unshared, with_name)
+        after = measure(create_shared, with_name)
+        print(
+            f"{'Unique' if with_name else 'No'} friendly_name: "
+            f"{before:.0f} bytes per entity unshared, {after:.0f} bytes shared"
+        )
+
+    return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_subscriptions(hass):
+    """Match 100k topics against a growing number of wildcard subscriptions."""
+    # Imported here, the other benchmarks don't need the MQTT requirements
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    messages = 10**5
+    job = core.HassJob(core.callback(lambda msg: None))
+    topics = [f"zigbee2mqtt/device_{idx % 3000}/state" for idx in range(messages)]
+    total = 0.0
+
+    for subscription_count in (10, 100, 1000, 3000):
+        trie = SubscriptionTrie()
+        for idx in range(subscription_count):
+            trie.add(Subscription(f"zigbee2mqtt/device_{idx}/+", False, job))
+        trie.add(Subscription("homeassistant/#", False, job))
+
+        start = timer()
+        for topic in topics:
+            trie.matches(topic)
+        runtime = timer() - start
+        total += runtime
+        print(
+            f"{subscription_count} subscriptions: {messages / runtime:.0f} messages/sec"
+        )
+
+    return total
+
+
+# Conditions as they are commonly found in automations
+_AUTOMATION_CONDITIONS = [
+    [
+        {
+            "condition": "template",
+            "value_template": "{{ states('sensor.lux') | float(0) < 50 }}",
+        },
+        {"condition": "state", "entity_id": "input_boolean.guest_mode", "state": "off"},
+        {"condition": "time", "after": "07:00:00", "before": "23:00:00"},
+    ],
+    [
+        {
+            "condition": "or",
+            "conditions": [
+                {
+                    "condition": "template",
+                    "value_template": (
+                        "{{ state_attr('climate.living', 'temperature') | float(0)"
+                        " > states('sensor.outside') | float(0) }}"
+                    ),
+                },
+                {"condition": "state", "entity_id": "person.alice", "state": "home"},
+                {"condition": "state", "entity_id": "person.bob", "state": "home"},
+            ],
+        },
+        {
+            "condition": "numeric_state",
+            "entity_id": "sensor.outside",
+            "below": 10,
+        },
+    ],
+    [
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "template",
+                    "value_template": "{{ is_state('alarm_panel.home', 'disarmed') }}",
+                },
+                {
+                    "condition": "not",
+                    "conditions": [
+                        {
+                            "condition": "state",
+                            "entity_id": "binary_sensor.window",
+                            "state": "on",
+                        },
+                    ],
+                },
+                {
+                    "condition": "state",
+                    "entity_id": "sun.sun",
+                    "state": "below_horizon",
+                },
+            ],
+        },
+    ],
+]
+
+
+@benchmark
+async def automation_conditions(hass):
+    """Evaluate a corpus of automation conditions.
+
+    Compares the traced evaluation in the declared order, the same
+    evaluation without a trace, and the compiled evaluation, which
+    evaluates the conditions cheapest first when no trace is recorded.
+    """
+    evaluations = 10**4
+    hass.states.async_set("sensor.lux", "120")
+    hass.states.async_set("input_boolean.guest_mode", "off")
+    hass.states.async_set("climate.living", "heat", {"temperature": 21})
+    hass.states.async_set("sensor.outside", "8")
+    hass.states.async_set("person.alice", "not_home")
+    hass.states.async_set("person.bob", "home")
+    hass.states.async_set("alarm_panel.home", "armed_away")
+    hass.states.async_set("binary_sensor.window", "off")
+    hass.states.async_set("sun.sun", "below_horizon")
+
+    async def compile_checks(compiled):
+        checks = []
+        for conditions in _AUTOMATION_CONDITIONS:
+            configs = await condition.async_validate_conditions_config(
+                hass, [cv.CONDITION_SCHEMA(config) for config in conditions]
+            )
+            checks.append(
+                await condition.async_conditions_from_config(
+                    hass,
+                    configs,
+                    logging.getLogger(__name__),
+                    "benchmark",
+                    compiled=compiled,
+                )
+            )
+        return checks
+
+    checks = await compile_checks(False)
+    compiled_checks = await compile_checks(True)
+
+    total = 0.0
+    for name, traced, evaluated_checks in (
+        ("Traced", True, checks),
+        ("Untraced", False, checks),
+        ("Compiled", False, compiled_checks),
+    ):
+        start = timer()
+        for _ in range(evaluations):
+            if traced:
+                trace_clear()
+            else:
+                trace_cv.set(None)
+            for check in evaluated_checks:
+                check(None)
+        runtime = timer() - start
+        total += runtime
+        print(
+            f"{name}: {evaluations * len(evaluated_checks) / runtime:.0f}"
+            " conditions/sec"
+        )
+
+    return total
+
+
+def _recorder_write_states(bulk: bool) -> float:
+    """Write state changes the way the recorder does and return the runtime.
+
+    Uses the database of BENCHMARK_RECORDER_DB_URL, such as a local
+    PostgreSQL database, or a temporary SQLite database if it is not set.
+    """
+    # Imported here, the other benchmarks don't need the recorder requirements
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.bulk_writer import BulkWriter
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    commits = 50
+    states_per_commit = 400
+    entities = 100
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(
+            os.environ.get("BENCHMARK_RECORDER_DB_URL")
+            or f"sqlite:///{tmp_dir}/benchmark.db"
+        )
+        Base.metadata.create_all(engine)
+        bulk_writer = BulkWriter() if bulk else None
+        # Committed ids, or objects pending in the current commit
+        states_meta: dict[str, int | StatesMeta] = {}
+        state_attributes: dict[bytes, int | StateAttributes] = {}
+        last_states: dict[str, int | States] = {}
+        runtime = 0.0
+        try:
+            with Session(engine) as session:
+
+                def add(obj: Base) -> None:
+                    if bulk_writer is None or not bulk_writer.add(obj):
+                        session.add(obj)
+
+                for commit in range(commits):
+                    start = timer()
+                    for index in range(states_per_commit):
+                        entity_id = f"sensor.benchmark_{index % entities}"
+                        event = core.Event(
+                            EVENT_STATE_CHANGED,
+                            {
+                                "entity_id": entity_id,
+                                "old_state": None,
+                                "new_state": core.State(
+                                    entity_id,
+                                    str(commit * states_per_commit + index),
+                                    {"unit_of_measurement": "W", "phase": index % 3},
+                                ),
+                            },
+                        )
+                        dbstate = States.from_event(event)
+                        dbstate.entity_id = None
+                        if isinstance(meta := states_meta.get(entity_id), int):
+                            dbstate.metadata_id = meta
+                        else:
+                            if meta is None:
+                                meta = states_meta[entity_id] = StatesMeta(
+                                    entity_id=entity_id
+                                )
+                                add(meta)
+                            dbstate.states_meta_rel = meta
+                        shared_attrs_bytes = JSON_DUMP(
+                            event.data["new_state"].attributes
+                        ).encode()
+                        attrs = state_attributes.get(shared_attrs_bytes)
+                        if isinstance(attrs, int):
+                            dbstate.attributes_id = attrs
+                        else:
+                            if attrs is None:
+                                attrs = state_attributes[shared_attrs_bytes] = (
+                                    StateAttributes(
+                                        shared_attrs=shared_attrs_bytes.decode(),
+                                        hash=StateAttributes.hash_shared_attrs_bytes(
+                                            shared_attrs_bytes
+                                        ),
+                                    )
+                                )
+                                add(attrs)
+                            dbstate.state_attributes = attrs
+                        if isinstance(old_state := last_states.get(entity_id), int):
+                            dbstate.old_state_id = old_state
+                        elif old_state is not None:
+                            dbstate.old_state = old_state
+                        last_states[entity_id] = dbstate
+                        add(dbstate)
+                    if bulk_writer:
+                        bulk_writer.flush(session)
+                    session.commit()
+                    if bulk_writer:
+                        bulk_writer.clear()
+                    # Like the table managers after the commit
+                    for entity_id, meta in states_meta.items():
+                        if not isinstance(meta, int):
+                            states_meta[entity_id] = meta.metadata_id
+                    for shared_attrs_bytes, attrs in state_attributes.items():
+                        if not isinstance(attrs, int):
+                            state_attributes[shared_attrs_bytes] = attrs.attributes_id
+                    for entity_id, old_state in last_states.items():
+                        if not isinstance(old_state, int):
+                            last_states[entity_id] = old_state.state_id
+                    runtime += timer() - start
+        finally:
+            Base.metadata.drop_all(engine)
+            engine.dispose()
+    print(f"{commits * states_per_commit / runtime:.0f} states/sec")
+    return runtime
+
+
+@benchmark
+async def recorder_orm_insert(hass):
+    """Write state changes with the recorder ORM session."""
+    return await hass.async_add_executor_job(_recorder_write_states, False)
+
+
+@benchmark
+async def recorder_bulk_insert(hass):
+    """Write state changes with the recorder bulk writer."""
+    return await hass.async_add_executor_job(_recorder_write_states, True)
@@ -1,7 +1,10 @@
 """Read only dictionary."""
 
+from collections.abc import Iterable, Mapping
 from copy import deepcopy
+import sys
 from typing import Any
+import weakref
 
 
 def _readonly(*args: Any, **kwargs: Any) -> Any:
@@ -29,3 +32,64 @@ class ReadOnlyDict[_KT, _VT](dict[_KT, _VT]):
         return ReadOnlyDict(
             {deepcopy(key, memo): deepcopy(value, memo) for key, value in self.items()}
         )
+
+
+# Types of values that are immutable and hash by value. Subclasses,
+# like StrEnum, are added when they are first seen.
+_POOLABLE_VALUE_TYPES: set[type] = {str, int, float, bool, type(None)}
+
+
+def _poolable_value_types(value_types: Iterable[type]) -> bool:
+    """Return if all value types are immutable scalars."""
+    for value_type in value_types:
+        if value_type in _POOLABLE_VALUE_TYPES:
+            continue
+        if not issubclass(value_type, (str, int, float)):
+            return False
+        _POOLABLE_VALUE_TYPES.add(value_type)
+    return True
+
+
+class ReadOnlyDictPool:
+    """Deduplicate read only dicts with identical content.
+
+    Only dicts with string keys and scalar values are pooled, values are
+    compared together with their type so 1, 1.0 and True are never merged.
+    Keys of pooled dicts are interned. Pooled dicts are held weakly and
+    are released once nothing else references them.
+    """
+
+    __slots__ = ("_pool",)
+
+    def __init__(self) -> None:
+        """Initialize the pool."""
+        self._pool: weakref.WeakValueDictionary[int, ReadOnlyDict[str, Any]] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def __len__(self) -> int:
+        """Return the number of pooled dicts."""
+        return len(self._pool)
+
+    def intern(self, data: Mapping[str, Any]) -> ReadOnlyDict[str, Any]:
+        """Return a shared read only dict equal to data."""
+        values = data.values()
+        value_types = tuple(map(type, values))
+        if not _POOLABLE_VALUE_TYPES.issuperset(
+            value_types
+        ) and not _poolable_value_types(value_types):
+            return data if type(data) is ReadOnlyDict else ReadOnlyDict(data)
+        key = hash((tuple(data.items()), value_types))
+        if (
+            (pooled := self._pool.get(key)) is not None
+            and pooled == data
+            and tuple(map(type, pooled.values())) == value_types
+        ):
+            return pooled
+        try:
+            pooled = ReadOnlyDict(zip(map(sys.intern, data), values, strict=True))
+        except TypeError:
+            # Keys that are not strings can not be interned
+            return data if type(data) is ReadOnlyDict else ReadOnlyDict(data)
+        self._pool[key] = pooled
+        return pooled
@@ -0,0 +1,192 @@
+"""Timer wheel to coalesce event loop timers."""
+
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, TimerHandle
+from collections.abc import Callable, Iterator
+import math
+from operator import attrgetter
+from typing import Any
+
+_WHEN = attrgetter("when")
+
+# Home Assistant coalesces the timers of the event helpers which are
+# due at least DEFAULT_MIN_DELAY seconds later, they fire at most
+# DEFAULT_RESOLUTION seconds late. Shorter timers are not delayed.
+DEFAULT_RESOLUTION = 0.25
+DEFAULT_MIN_DELAY = 10.0
+
+
+class TimerWheelHandle:
+    """Handle of a timer scheduled on the timer wheel."""
+
+    __slots__ = ("_wheel", "_bucket_when", "when", "callback", "args", "_cancelled")
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        bucket_when: float,
+        when: float,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        """Initialize the handle."""
+        self._wheel = wheel
+        self._bucket_when = bucket_when
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self._cancelled = False
+
+    def __repr__(self) -> str:
+        """Return the representation of the handle."""
+        return f"<TimerWheelHandle when={self.when} {self.callback!r}{self.args!r}>"
+
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        if self._cancelled:
+            return
+        self._cancelled = True
+        self._wheel._remove(self)  # noqa: SLF001
+
+    def cancelled(self) -> bool:
+        """Return if the timer was cancelled or has fired."""
+        return self._cancelled
+
+
+class _Bucket:
+    """Timers that fire in the same tick."""
+
+    __slots__ = ("handle", "timers")
+
+    def __init__(self, handle: TimerHandle) -> None:
+        """Initialize the bucket."""
+        self.handle = handle
+        self.timers: dict[TimerWheelHandle, None] = {}
+
+
+class TimerWheel:
+    """Coalesce event loop timers into buckets.
+
+    Timers are rounded up to the next multiple of the resolution, and
+    all timers of the same tick share a single loop timer handle. This
+    keeps the asyncio timer heap small when tens of thousands of timers
+    are active, and makes adding and cancelling a timer O(1) as long as
+    its tick already has a handle. Timers fire at most one resolution
+    late, and never early.
+
+    Timers due sooner than min_delay, or all timers with a resolution
+    of 0, are passed to the loop unchanged.
+    """
+
+    __slots__ = (
+        "_loop",
+        "resolution",
+        "min_delay",
+        "_buckets",
+        "_active_timers",
+        "_fired_timers",
+        "_total_late",
+        "_max_late",
+    )
+
+    def __init__(
+        self, loop: AbstractEventLoop, resolution: float = 0, min_delay: float = 0
+    ) -> None:
+        """Initialize the timer wheel."""
+        self._loop = loop
+        self.resolution = resolution
+        self.min_delay = min_delay
+        self._buckets: dict[float, _Bucket] = {}
+        self._active_timers = 0
+        self._fired_timers = 0
+        self._total_late = 0.0
+        self._max_late = 0.0
+
+    @property
+    def active_timers(self) -> int:
+        """Return the number of timers waiting to fire."""
+        return self._active_timers
+
+    @property
+    def active_ticks(self) -> int:
+        """Return the number of loop timer handles in use."""
+        return len(self._buckets)
+
+    @property
+    def fired_timers(self) -> int:
+        """Return the number of timers that have fired."""
+        return self._fired_timers
+
+    @property
+    def max_late(self) -> float:
+        """Return the maximum number of seconds a timer fired late."""
+        return self._max_late
+
+    @property
+    def average_late(self) -> float:
+        """Return the average number of seconds timers fired late."""
+        if not self._fired_timers:
+            return 0.0
+        return self._total_late / self._fired_timers
+
+    def timers(self) -> Iterator[TimerWheelHandle]:
+        """Iterate over the timers waiting to fire."""
+        for bucket in list(self._buckets.values()):
+            yield from list(bucket.timers)
+
+    def call_at(
+        self, when: float, callback: Callable[..., Any], *args: Any
+    ) -> TimerHandle | TimerWheelHandle:
+        """Schedule callback to be called at or after the loop time when."""
+        if (resolution := self.resolution) <= 0 or (
+            when - self._loop.time() < self.min_delay
+        ):
+            return self._loop.call_at(when, callback, *args)
+        bucket_when = math.ceil(when / resolution) * resolution
+        timer = TimerWheelHandle(self, bucket_when, when, callback, args)
+        if (bucket := self._buckets.get(bucket_when)) is None:
+            bucket = self._buckets[bucket_when] = _Bucket(
+                self._loop.call_at(bucket_when, self._fire, bucket_when)
+            )
+        bucket.timers[timer] = None
+        self._active_timers += 1
+        return timer
+
+    def _remove(self, timer: TimerWheelHandle) -> None:
+        """Remove a cancelled timer."""
+        if (bucket := self._buckets.get(timer._bucket_when)) is None:  # noqa: SLF001
+            return
+        if bucket.timers.pop(timer, False) is not False:
+            self._active_timers -= 1
+        if not bucket.timers:
+            bucket.handle.cancel()
+            del self._buckets[timer._bucket_when]  # noqa: SLF001
+
+    def _fire(self, bucket_when: float) -> None:
+        """Fire all timers of a tick in the order they are due."""
+        if (bucket := self._buckets.pop(bucket_when, None)) is None:
+            return
+        timers = sorted(bucket.timers, key=_WHEN)
+        self._active_timers -= len(timers)
+        now = self._loop.time()
+        for timer in timers:
+            # A timer of the same tick may have been cancelled by
+            # one of the callbacks that already ran
+            if timer._cancelled:  # noqa: SLF001
+                continue
+            timer._cancelled = True  # noqa: SLF001
+            if (late := now - timer.when) > 0:
+                self._total_late += late
+                self._max_late = max(late, self._max_late)
+            self._fired_timers += 1
+            try:
+                timer.callback(*timer.args)
+            except Exception as exc:  # noqa: BLE001
+                self._loop.call_exception_handler(
+                    {
+                        "message": f"Exception in timer {timer!r}",
+                        "exception": exc,
+                        "handle": bucket.handle,
+                    }
+                )
@@ -2,8 +2,11 @@
 
 import asyncio
 from datetime import timedelta
+import threading
+from typing import Any
 from unittest.mock import ANY, patch
 
+from aiohttp.http_websocket import WebSocketWriter
 from freezegun import freeze_time
 import pytest
 
@@ -454,6 +457,212 @@ async def test_history_during_period_bad_end_time(
     assert response["error"]["code"] == "invalid_end_time"
 
 
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period_chunked sends the history in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for entity_id in ("sensor.one", "sensor.two", "sensor.three"):
+        hass.states.async_set(entity_id, "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "ENTITIES_PER_HISTORY_CHUNK", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period_chunked",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one", "sensor.two", "sensor.three"],
+                "no_attributes": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+
+        response = await client.receive_json()
+        assert response["type"] == "event"
+        assert response["event"] == {
+            "states": {
+                "sensor.one": [{"s": "on", "lu": ANY}],
+                "sensor.two": [{"s": "on", "lu": ANY}],
+            },
+            "complete": False,
+        }
+        response = await client.receive_json()
+        assert response["event"] == {
+            "states": {"sensor.three": [{"s": "on", "lu": ANY}]},
+            "complete": True,
+        }
+
+        # The subscription ends with the last chunk
+        await client.send_json(
+            {"id": 3, "type": "unsubscribe_events", "subscription": 1}
+        )
+        response = await client.receive_json()
+        assert not response["success"]
+        assert response["error"]["code"] == "not_found"
+
+        # The history of a period in the future is empty
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "history/history_during_period_chunked",
+                "start_time": (now + timedelta(days=1)).isoformat(),
+                "entity_ids": ["sensor.one"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"] == {"states": {}, "complete": True}
+
+
+async def test_history_during_period_chunked_unsubscribe(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test unsubscribing from history_during_period_chunked stops the chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for entity_id in ("sensor.one", "sensor.two", "sensor.three"):
+        hass.states.async_set(entity_id, "on")
+    await async_wait_recording_done(hass)
+
+    fetching = threading.Event()
+    unsubscribed = threading.Event()
+    original_get_chunk = websocket_api._ws_get_significant_states_chunk
+
+    def _get_chunk(*args: Any) -> bytes:
+        fetching.set()
+        unsubscribed.wait(5)
+        return original_get_chunk(*args)
+
+    client = await hass_ws_client()
+    with (
+        patch.object(websocket_api, "ENTITIES_PER_HISTORY_CHUNK", 1),
+        patch.object(
+            websocket_api, "_ws_get_significant_states_chunk", side_effect=_get_chunk
+        ) as get_chunk,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period_chunked",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one", "sensor.two", "sensor.three"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        await hass.async_add_executor_job(fetching.wait, 5)
+
+        await client.send_json(
+            {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 2
+        unsubscribed.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        # No chunk is sent after unsubscribing
+        await client.send_json({"id": 3, "type": "ping"})
+        response = await client.receive_json()
+        assert response == {"id": 3, "type": "pong"}
+        assert get_chunk.call_count == 1
+
+
+async def test_history_during_period_chunked_slow_client(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period_chunked waits for the client to read a chunk."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for entity_id in ("sensor.one", "sensor.two", "sensor.three"):
+        hass.states.async_set(entity_id, "on")
+    await async_wait_recording_done(hass)
+
+    stalled = asyncio.Event()
+    original_send_frame = WebSocketWriter.send_frame
+
+    async def _send_frame(
+        self: WebSocketWriter, message: bytes, *args: Any, **kwargs: Any
+    ) -> None:
+        # Only the frames sent to the client are stalled
+        if b'"type":"result"' in message or b'"type":"event"' in message:
+            await stalled.wait()
+        await original_send_frame(self, message, *args, **kwargs)
+
+    fetched = threading.Event()
+    original_get_chunk = websocket_api._ws_get_significant_states_chunk
+
+    def _get_chunk(*args: Any) -> bytes:
+        chunk = original_get_chunk(*args)
+        fetched.set()
+        return chunk
+
+    with (
+        patch.object(websocket_api, "ENTITIES_PER_HISTORY_CHUNK", 1),
+        patch.object(
+            websocket_api, "_ws_get_significant_states_chunk", side_effect=_get_chunk
+        ) as get_chunk,
+        patch.object(WebSocketWriter, "send_frame", _send_frame),
+    ):
+        client = await hass_ws_client()
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period_chunked",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one", "sensor.two", "sensor.three"],
+            }
+        )
+        await hass.async_add_executor_job(fetched.wait, 5)
+        await hass.async_block_till_done()
+        await async_recorder_block_till_done(hass)
+
+        # The writer is stuck sending the result, only the first chunk
+        # was fetched and queued
+        assert get_chunk.call_count == 1
+
+        stalled.set()
+        response = await client.receive_json()
+        assert response["success"]
+        for entity_id in ("sensor.one", "sensor.two", "sensor.three"):
+            response = await client.receive_json()
+            assert list(response["event"]["states"]) == [entity_id]
+        assert response["event"]["complete"] is True
+        assert get_chunk.call_count == 3
+
+
+async def test_history_during_period_chunked_bad_start_time(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period_chunked bad start time."""
+    await async_setup_component(hass, "history", {"history": {}})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period_chunked",
+            "entity_ids": ["sensor.pet"],
+            "start_time": "cats",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 async def test_history_stream_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
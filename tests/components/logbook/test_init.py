@@ -4,7 +4,8 @@ import asyncio
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
-from unittest.mock import Mock
+from typing import Any
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -15,13 +16,21 @@ from homeassistant.components import logbook, recorder
 # pylint: disable-next=hass-component-root-import
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
-from homeassistant.components.logbook.models import EventAsRow, LazyEventPartialState
-from homeassistant.components.logbook.processor import EventProcessor
+from homeassistant.components.logbook.helpers import async_determine_event_types
+from homeassistant.components.logbook.models import (
+    EventAsRow,
+    LazyEventPartialState,
+    LogbookCursor,
+    LogbookTableRow,
+)
+from homeassistant.components.logbook.processor import EventProcessor, _rows_after
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
+from homeassistant.components.logbook.queries.logbook_table import logbook_table_stmt
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.const import (
+    ATTR_DEVICE_ID,
     ATTR_DOMAIN,
     ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
@@ -2764,6 +2773,106 @@ async def test_get_events_with_device_ids(
     assert isinstance(results[3]["when"], float)
 
 
+@pytest.mark.parametrize("recorder_config", [{"logbook_table": True}])
+async def test_get_events_from_logbook_table(
+    hass: HomeAssistant, recorder_mock: Recorder, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test entity and device logbooks read from the logbook table."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    assert recorder_mock.logbook_table_since is not None
+    assert recorder_mock.logbook_table_since <= now.timestamp()
+
+    entry = MockConfigEntry(domain="test")
+    entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("sensor.power", "1", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    await hass.async_block_till_done()
+    service_context = ha.Context()
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {
+            ATTR_DOMAIN: "light",
+            ATTR_SERVICE: "turn_on",
+            "service_data": {ATTR_ENTITY_ID: "light.kitchen"},
+        },
+        context=service_context,
+    )
+    hass.states.async_set("light.kitchen", STATE_ON, context=service_context)
+    hass.states.async_set("sensor.power", "100", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    await hass.async_block_till_done()
+    automation_context = ha.Context()
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+        context=automation_context,
+    )
+    hass.bus.async_fire(
+        EVENT_LOGBOOK_ENTRY,
+        {
+            ATTR_NAME: "Kitchen",
+            logbook.ATTR_MESSAGE: "is on fire",
+            ATTR_DEVICE_ID: device.id,
+        },
+        context=automation_context,
+    )
+    hass.states.async_set("light.kitchen", STATE_OFF, context=automation_context)
+    await async_wait_recording_done(hass)
+
+    def _get_events(
+        entity_ids: list[str] | None, device_ids: list[str] | None
+    ) -> list[dict[str, Any]]:
+        event_processor = EventProcessor(
+            hass,
+            async_determine_event_types(hass, entity_ids, device_ids),
+            entity_ids,
+            device_ids,
+        )
+        return event_processor.get_events(now, dt_util.utcnow() + timedelta(hours=1))
+
+    for entity_ids, device_ids in (
+        (["light.kitchen", "sensor.power"], None),
+        (None, [device.id]),
+        (["light.kitchen"], [device.id]),
+    ):
+        events = _get_events(entity_ids, device_ids)
+        # The entries and their context match the entries
+        # found from the states and events tables
+        with patch.object(recorder_mock, "logbook_table_since", None):
+            assert events == _get_events(entity_ids, device_ids)
+
+    assert [
+        (event.get("entity_id"), event.get("state"), event.get("context_event_type"))
+        for event in _get_events(["light.kitchen"], [device.id])
+    ] == [
+        ("light.kitchen", "on", EVENT_CALL_SERVICE),
+        (None, None, EVENT_AUTOMATION_TRIGGERED),
+        ("light.kitchen", "off", EVENT_AUTOMATION_TRIGGERED),
+    ]
+
+    # Entries from before the logbook table was written
+    # are found from the states and events tables
+    with patch(
+        "homeassistant.components.logbook.processor.logbook_table_stmt",
+        wraps=logbook_table_stmt,
+    ) as logbook_table_stmt_mock:
+        _get_events(["light.kitchen"], None)
+        recorder_mock.logbook_table_since = now.timestamp() + 1
+        _get_events(["light.kitchen"], None)
+    assert logbook_table_stmt_mock.call_count == 1
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_logbook_select_entities_context_id(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
@@ -3002,3 +3111,57 @@ async def test_logbook_with_non_iterable_entity_filter(hass: HomeAssistant) -> N
         },
     )
     await hass.async_block_till_done()
+
+
+def _table_row(
+    row_id: int, event_type: str | None, time_fired_ts: float
+) -> LogbookTableRow:
+    """Return a logbook row of an event or of a state when event_type is None."""
+    return LogbookTableRow(
+        row_id=row_id,
+        event_type=event_type,
+        event_data=None,
+        time_fired_ts=time_fired_ts,
+        context_id_bin=None,
+        context_user_id_bin=None,
+        context_parent_id_bin=None,
+        state=None if event_type else "on",
+        entity_id=None if event_type else "light.kitchen",
+        icon=None,
+        context_only=None,
+        context_row=None,
+    )
+
+
+def test_rows_after_cursor_with_same_time_and_id() -> None:
+    """Test an event and a state with the same time and id are both paged."""
+    rows = [
+        _table_row(1, None, 1.0),
+        _table_row(1, "test_event", 1.0),
+        _table_row(2, None, 1.0),
+        _table_row(2, "test_event", 2.0),
+    ]
+    # Events come before states with the same time
+    ordered_rows = [rows[1], rows[0], rows[2], rows[3]]
+    logbook_run = Mock(context_lookup={})
+    last_row: list[LogbookTableRow] = []
+
+    assert list(_rows_after(rows, None, logbook_run, last_row)) == ordered_rows
+    for index, row in enumerate(ordered_rows):
+        cursor = LogbookCursor(row.time_fired_ts, row.event_type is None, row.row_id)
+        assert (
+            list(_rows_after(rows, cursor, logbook_run, last_row))
+            == ordered_rows[index + 1 :]
+        )
+
+
+def test_logbook_cursor_string() -> None:
+    """Test cursors are converted to strings and back."""
+    for cursor in (
+        LogbookCursor(1707000000.123456, False, 5),
+        LogbookCursor(1707000000.123456, True, 5),
+    ):
+        assert LogbookCursor.from_string(cursor.as_string()) == cursor
+    for invalid in ("1707000000.1:5", "1707000000.1:x:5", "invalid"):
+        with pytest.raises(ValueError):
+            LogbookCursor.from_string(invalid)
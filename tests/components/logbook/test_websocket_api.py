@@ -292,6 +292,86 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_in_pages(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events in pages continued with a cursor."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF):
+        hass.states.async_set("light.kitchen", state)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.kitchen"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    all_events = response["result"]
+    assert [event["state"] for event in all_events] == ["on", "off", "on", "off"]
+
+    events: list[dict[str, Any]] = []
+    cursor: str | None = None
+    for msg_id in range(2, 4):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.kitchen"],
+                "limit": 3,
+                **({"cursor": cursor} if cursor else {}),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        events.extend(response["result"]["events"])
+        cursor = response["result"]["next_cursor"]
+    assert cursor is None
+    assert events == all_events
+
+    await client.send_json(
+        {
+            "id": 4,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "limit": 3,
+            "cursor": "invalid",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+    # Cursors without the source of the row are not valid
+    await client.send_json(
+        {
+            "id": 5,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "limit": 3,
+            "cursor": f"{now.timestamp()!r}:1",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
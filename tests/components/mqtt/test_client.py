@@ -13,7 +13,11 @@ import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -23,7 +27,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -633,6 +643,68 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+@pytest.mark.parametrize(
+    ("topic", "expected"),
+    [
+        (
+            "home/kitchen/temperature",
+            ["home/#", "home/+/temperature", "home/kitchen/#", "+/+/+"],
+        ),
+        ("home/kitchen", ["home/#", "home/kitchen/#"]),
+        ("home", ["home/#"]),
+        ("home/kitchen/light/state", ["home/#", "home/kitchen/#"]),
+        ("$SYS/broker/uptime", ["$SYS/#"]),
+        ("other/topic", []),
+    ],
+)
+def test_subscription_trie_matches(topic: str, expected: list[str]) -> None:
+    """Test matching topics against wildcard subscriptions in the trie."""
+    job = HassJob(lambda msg: None)
+    trie = SubscriptionTrie()
+    subscriptions = {
+        sub_topic: Subscription(sub_topic, False, job)
+        for sub_topic in (
+            "home/#",
+            "home/+/temperature",
+            "home/kitchen/#",
+            "+/+/+",
+            "$SYS/#",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+
+    # Matches are returned in the order the subscriptions were added
+    assert [sub.topic for sub in trie.matches(topic)] == sorted(
+        expected, key=list(subscriptions).index
+    )
+
+
+def test_subscription_trie_remove() -> None:
+    """Test removing subscriptions from the trie."""
+    job = HassJob(lambda msg: None)
+    trie = SubscriptionTrie()
+    first = Subscription("home/+/temperature", False, job)
+    second = Subscription("home/+/temperature", False, job, qos=1)
+    trie.add(first)
+    trie.add(second)
+    assert len(trie) == 2
+    assert trie.has_topic("home/+/temperature")
+    assert not trie.has_topic("home/+")
+
+    trie.remove(first)
+    assert trie.matches("home/kitchen/temperature") == [second]
+    assert trie.has_topic("home/+/temperature")
+
+    trie.remove(second)
+    assert trie.matches("home/kitchen/temperature") == []
+    assert not trie.has_topic("home/+/temperature")
+    assert list(trie) == []
+
+    with pytest.raises(KeyError):
+        trie.remove(second)
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
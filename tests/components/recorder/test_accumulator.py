@@ -0,0 +1,139 @@
+"""Test accumulating states for short term statistics."""
+
+from datetime import datetime, timedelta
+
+from homeassistant.components.recorder.accumulator import ShortTermStatisticsAccumulator
+from homeassistant.components.recorder.history import NumericStatesAggregate
+from homeassistant.core import State
+from homeassistant.util import dt as dt_util
+
+ZERO = datetime(2024, 3, 5, 12, tzinfo=dt_util.UTC)
+CELSIUS = {"unit_of_measurement": "°C"}
+FAHRENHEIT = {"unit_of_measurement": "°F"}
+
+
+def _state(
+    state: str,
+    minutes: float,
+    attributes: dict[str, str] | None = None,
+    changed_minutes: float | None = None,
+) -> State:
+    """Return a state of sensor.test updated minutes after ZERO."""
+    last_updated = ZERO + timedelta(minutes=minutes)
+    return State(
+        "sensor.test",
+        state,
+        attributes or CELSIUS,
+        last_changed=None
+        if changed_minutes is None
+        else ZERO + timedelta(minutes=changed_minutes),
+        last_updated=last_updated,
+    )
+
+
+def test_accumulate_aggregates() -> None:
+    """Test numeric states are accumulated per period and unit."""
+    accumulator = ShortTermStatisticsAccumulator()
+    accumulator.track([_state("10", -1)], [])
+    for state in (
+        _state("20", 1),
+        # Changes of only the attributes and non numeric states are ignored
+        _state("20", 2, FAHRENHEIT, changed_minutes=1),
+        _state("unavailable", 3),
+        _state("68", 4, FAHRENHEIT),
+        _state("30", 6),
+    ):
+        accumulator.add_state("sensor.test", state)
+    five = ZERO + timedelta(minutes=5)
+    ten = ZERO + timedelta(minutes=10)
+
+    assert accumulator.pop_aggregates(["sensor.test"], ZERO, five) == {
+        "sensor.test": [
+            NumericStatesAggregate(CELSIUS, ZERO.timestamp(), 240, 4200, 10, 20),
+            NumericStatesAggregate(
+                FAHRENHEIT, (ZERO + timedelta(minutes=4)).timestamp(), 60, 4080, 68, 68
+            ),
+        ]
+    }
+    assert accumulator.pop_aggregates(["sensor.test"], five, ten) == {
+        "sensor.test": [
+            NumericStatesAggregate(FAHRENHEIT, five.timestamp(), 60, 4080, 68, 68),
+            NumericStatesAggregate(
+                CELSIUS, (ZERO + timedelta(minutes=6)).timestamp(), 240, 7200, 30, 30
+            ),
+        ]
+    }
+
+    accumulator.reset()
+    assert accumulator.pop_aggregates(["sensor.test"], ten, ten + (five - ZERO)) == {}
+
+
+def test_accumulate_aggregates_unavailable() -> None:
+    """Test the value is not carried into a period starting non numeric."""
+    accumulator = ShortTermStatisticsAccumulator()
+    accumulator.track([_state("10", -1)], [])
+    for state in (
+        _state("20", 1),
+        _state("unavailable", 3),
+        _state("30", 7),
+        _state("unavailable", 11),
+    ):
+        accumulator.add_state("sensor.test", state)
+    five = ZERO + timedelta(minutes=5)
+    ten = ZERO + timedelta(minutes=10)
+    fifteen = ZERO + timedelta(minutes=15)
+    twenty = ZERO + timedelta(minutes=20)
+
+    # The value of a numeric state is kept until the end of the period
+    assert accumulator.pop_aggregates(["sensor.test"], ZERO, five) == {
+        "sensor.test": [
+            NumericStatesAggregate(CELSIUS, ZERO.timestamp(), 300, 5400, 10, 20)
+        ]
+    }
+    assert accumulator.pop_aggregates(["sensor.test"], five, ten) == {
+        "sensor.test": [
+            NumericStatesAggregate(
+                CELSIUS, (ZERO + timedelta(minutes=7)).timestamp(), 180, 5400, 30, 30
+            )
+        ]
+    }
+    assert accumulator.pop_aggregates(["sensor.test"], ten, fifteen) == {
+        "sensor.test": [
+            NumericStatesAggregate(CELSIUS, ten.timestamp(), 300, 9000, 30, 30)
+        ]
+    }
+    assert accumulator.pop_aggregates(["sensor.test"], fifteen, twenty) == {
+        "sensor.test": []
+    }
+
+
+def test_accumulate_states() -> None:
+    """Test states are kept until their period is compiled."""
+    accumulator = ShortTermStatisticsAccumulator()
+    accumulator.track([], [_state("1", -1)])
+    accumulator.add_state("sensor.test", _state("2", 1))
+    accumulator.add_state("sensor.test", _state("3", 6))
+    five = ZERO + timedelta(minutes=5)
+    ten = ZERO + timedelta(minutes=10)
+
+    states = accumulator.pop_states(["sensor.test"], ZERO, five)
+    assert [state.state for state in states["sensor.test"]] == ["1", "2"]
+    states = accumulator.pop_states(["sensor.test"], five, ten)
+    assert [state.state for state in states["sensor.test"]] == ["2", "3"]
+
+
+def test_periods_before_tracking() -> None:
+    """Test periods starting before an entity was tracked are not accumulated."""
+    accumulator = ShortTermStatisticsAccumulator()
+    accumulator.track([_state("10", 1)], [])
+    five = ZERO + timedelta(minutes=5)
+
+    assert accumulator.pop_aggregates(["sensor.test"], ZERO, five) == {}
+    assert accumulator.pop_states(["sensor.test"], ZERO, five) == {}
+    assert accumulator.pop_aggregates(
+        ["sensor.test"], five, five + timedelta(minutes=5)
+    ) == {
+        "sensor.test": [
+            NumericStatesAggregate(CELSIUS, five.timestamp(), 300, 3000, 10, 10)
+        ]
+    }
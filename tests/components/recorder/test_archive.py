@@ -0,0 +1,220 @@
+"""Test archiving old states."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun import freeze_time
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.archive import (
+    ArchivedState,
+    archive_states,
+    decode_block,
+    encode_block,
+    get_archived_start_states,
+)
+from homeassistant.components.recorder.db_schema import States, StatesArchive
+from homeassistant.components.recorder.history import (
+    get_significant_states,
+    state_changes_during_period,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+def test_encode_decode_block() -> None:
+    """Test encoding and decoding archive blocks."""
+    states = [
+        ArchivedState(5, "on", 1700000000.123456, None, '{"a":1}'),
+        ArchivedState(5, "off", 1700000030.5, 1700000001.25, '{"a":1}'),
+        ArchivedState(5, None, 1700000060.000001, None, None),
+        ArchivedState(5, "on", 1700000060.000001, None, '{"b":"c"}'),
+    ]
+    assert decode_block(5, encode_block(states)) == states
+
+
+async def _add_states(hass: HomeAssistant) -> None:
+    """Add states 10, 5 and 0 days ago."""
+    utcnow = dt_util.utcnow()
+    with freeze_time() as freezer:
+        for days_ago, state in ((10, "ten"), (5, "five"), (0, "now")):
+            freezer.move_to(utcnow - timedelta(days=days_ago))
+            hass.states.async_set("sensor.one", state, {"days_ago": days_ago})
+            hass.states.async_set("sensor.two", state)
+            await async_wait_recording_done(hass)
+
+
+async def test_archive_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test states are moved to the archive and read back by history."""
+    await _add_states(hass)
+    utcnow = dt_util.utcnow()
+
+    assert await recorder_mock.async_add_executor_job(
+        archive_states, recorder_mock, utcnow - timedelta(days=1)
+    )
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 2
+        assert session.query(StatesArchive).count() == 2
+    assert recorder_mock.states_archived_until == pytest.approx(
+        (utcnow - timedelta(days=5)).timestamp()
+    )
+
+    hist = await recorder_mock.async_add_executor_job(
+        get_significant_states,
+        hass,
+        utcnow - timedelta(days=11),
+        None,
+        ["sensor.one", "sensor.two"],
+    )
+    assert [state.state for state in hist["sensor.one"]] == ["ten", "five", "now"]
+    assert [state.state for state in hist["sensor.two"]] == ["ten", "five", "now"]
+    assert hist["sensor.one"][1].attributes == {"days_ago": 5}
+
+    # The start state comes from the archive
+    with patch(
+        "homeassistant.components.recorder.history.modern."
+        "_get_run_start_ts_for_utc_point_in_time",
+        return_value=(utcnow - timedelta(days=30)).timestamp(),
+    ):
+        hist = await recorder_mock.async_add_executor_job(
+            get_significant_states,
+            hass,
+            utcnow - timedelta(days=2),
+            None,
+            ["sensor.one"],
+        )
+    assert [state.state for state in hist["sensor.one"]] == ["five", "now"]
+
+    hist = await recorder_mock.async_add_executor_job(
+        state_changes_during_period,
+        hass,
+        utcnow - timedelta(days=11),
+        None,
+        "sensor.two",
+        False,
+        False,
+        1,
+    )
+    assert [state.state for state in hist["sensor.two"]] == ["ten"]
+
+
+async def test_archived_start_states(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the archive is only read for start states missing in the states table."""
+    await _add_states(hass)
+    utcnow = dt_util.utcnow()
+
+    assert await recorder_mock.async_add_executor_job(
+        archive_states, recorder_mock, utcnow - timedelta(days=7)
+    )
+
+    def _get_start_states(days_ago: int) -> tuple[list[str], list[list[int]]]:
+        with (
+            patch(
+                "homeassistant.components.recorder.history.modern."
+                "_get_run_start_ts_for_utc_point_in_time",
+                return_value=(utcnow - timedelta(days=30)).timestamp(),
+            ),
+            patch(
+                "homeassistant.components.recorder.history.modern."
+                "get_archived_start_states",
+                wraps=get_archived_start_states,
+            ) as get_archived_start_states_mock,
+        ):
+            hist = get_significant_states(
+                hass,
+                utcnow - timedelta(days=days_ago),
+                None,
+                ["sensor.one", "sensor.two"],
+            )
+        return (
+            [state.state for state in hist["sensor.one"]],
+            [call.args[1] for call in get_archived_start_states_mock.call_args_list],
+        )
+
+    # The start state is in the states table
+    states, calls = await recorder_mock.async_add_executor_job(_get_start_states, 2)
+    assert states == ["five", "now"]
+    assert calls == []
+
+    # The start state is in the archive
+    states, calls = await recorder_mock.async_add_executor_job(_get_start_states, 6)
+    assert states == ["ten", "five", "now"]
+    assert len(calls) == 1
+    assert len(calls[0]) == 2
+
+
+async def test_archived_states_no_attributes(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test archived states have no attributes when they are not requested."""
+    await _add_states(hass)
+    utcnow = dt_util.utcnow()
+
+    assert await recorder_mock.async_add_executor_job(
+        archive_states, recorder_mock, utcnow - timedelta(days=1)
+    )
+
+    def _get_attributes(no_attributes: bool) -> list[dict[str, int]]:
+        hist = get_significant_states(
+            hass,
+            utcnow - timedelta(days=11),
+            None,
+            ["sensor.one"],
+            significant_changes_only=False,
+            no_attributes=no_attributes,
+        )
+        return [state.attributes for state in hist["sensor.one"]]
+
+    assert await recorder_mock.async_add_executor_job(_get_attributes, True) == [
+        {},
+        {},
+        {},
+    ]
+    assert await recorder_mock.async_add_executor_job(_get_attributes, False) == [
+        {"days_ago": 10},
+        {"days_ago": 5},
+        {"days_ago": 0},
+    ]
+
+
+async def test_purge_archived_states(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test archived states are purged."""
+    await _add_states(hass)
+    utcnow = dt_util.utcnow()
+
+    assert await recorder_mock.async_add_executor_job(
+        archive_states, recorder_mock, utcnow - timedelta(days=7)
+    )
+    assert await recorder_mock.async_add_executor_job(
+        archive_states, recorder_mock, utcnow - timedelta(days=1)
+    )
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatesArchive).count() == 4
+
+    assert await recorder_mock.async_add_executor_job(
+        purge_old_data, recorder_mock, utcnow - timedelta(days=7), False
+    )
+    with session_scope(hass=hass, read_only=True) as session:
+        five_days_ago_ts = (utcnow - timedelta(days=5)).timestamp()
+        assert [
+            row.start_ts for row in session.query(StatesArchive.start_ts)
+        ] == pytest.approx([five_days_ago_ts, five_days_ago_ts])
+        assert session.query(States).count() == 2
@@ -0,0 +1,157 @@
+"""Test caching the states of closed periods of the history."""
+
+from datetime import timedelta
+import math
+from unittest.mock import patch
+
+from freezegun import freeze_time
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.history import get_significant_states, modern
+from homeassistant.components.recorder.history.cache import (
+    PERIOD_SECONDS,
+    CachedState,
+    HistoryCache,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+ZERO = 1_699_999_200
+STATES = [
+    CachedState(1, "on", ZERO + 10, None, None, None),
+    CachedState(1, "off", ZERO + PERIOD_SECONDS, None, None, None),
+    CachedState(1, "on", ZERO + 2 * PERIOD_SECONDS + 5, None, None, '{"a":1}'),
+    CachedState(2, "5", ZERO + PERIOD_SECONDS + 1, None, None, None),
+]
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+class _Fetcher:
+    """Return STATES during a period and record the periods."""
+
+    def __init__(self) -> None:
+        """Initialize the fetcher."""
+        self.calls: list[tuple[float, float]] = []
+
+    def __call__(self, start_ts: float, end_ts: float) -> list[CachedState]:
+        """Return the states after start_ts and before end_ts."""
+        self.calls.append((start_ts, end_ts))
+        return sorted(
+            (state for state in STATES if start_ts < state.last_updated_ts < end_ts),
+            key=lambda state: (state.metadata_id, state.last_updated_ts),
+        )
+
+
+def test_closed_periods() -> None:
+    """Test the closed periods of a query."""
+    cache = HistoryCache()
+    assert not cache.closed_periods((1,), ZERO, None, None)
+    assert cache.closed_periods((1,), ZERO, None, ZERO + 3 * PERIOD_SECONDS + 1) == (
+        range(ZERO + PERIOD_SECONDS, ZERO + 3 * PERIOD_SECONDS, PERIOD_SECONDS)
+    )
+    assert cache.closed_periods(
+        (1,), ZERO - 1, ZERO + 2 * PERIOD_SECONDS, ZERO + 5 * PERIOD_SECONDS
+    ) == range(ZERO, ZERO + 2 * PERIOD_SECONDS, PERIOD_SECONDS)
+
+    # Periods before a purge of any of the entities are not cached again
+    cache.invalidate_entities([2], ZERO + 1)
+    end_ts = ZERO + 3 * PERIOD_SECONDS
+    assert cache.closed_periods((1, 2), ZERO - 1, None, end_ts).start == (
+        ZERO + PERIOD_SECONDS
+    )
+    assert cache.closed_periods((1,), ZERO - 1, None, end_ts).start == ZERO
+
+
+def test_get_states() -> None:
+    """Test states of periods are fetched once and split into periods."""
+    cache = HistoryCache()
+    fetcher = _Fetcher()
+    periods = range(ZERO, ZERO + 3 * PERIOD_SECONDS, PERIOD_SECONDS)
+
+    states = cache.get_states((1, 2), "key", periods, fetcher)
+    assert states == [[STATES[0]], [STATES[1], STATES[3]], [STATES[2]]]
+    assert fetcher.calls == [
+        (math.nextafter(ZERO, -math.inf), ZERO + 3 * PERIOD_SECONDS)
+    ]
+    assert cache.size
+
+    assert cache.get_states((1, 2), "key", periods, fetcher) == states
+    assert len(fetcher.calls) == 1
+
+    # Only the invalidated period is fetched again
+    cache.invalidate_before(ZERO + 1)
+    assert cache.get_states((1, 2), "key", periods, fetcher) == states
+    assert fetcher.calls[1] == (math.nextafter(ZERO, -math.inf), ZERO + PERIOD_SECONDS)
+
+    cache.invalidate_entities([2], ZERO + 2 * PERIOD_SECONDS)
+    cache.get_states((1, 2), "key", periods, fetcher)
+    assert fetcher.calls[2] == (
+        math.nextafter(ZERO, -math.inf),
+        ZERO + 2 * PERIOD_SECONDS,
+    )
+    cache.get_states((1,), "key", periods, fetcher)
+    assert len(fetcher.calls) == 4
+
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_evict_least_recently_used() -> None:
+    """Test the least recently used periods are evicted over the size."""
+    cache = HistoryCache(max_bytes=600)
+    fetcher = _Fetcher()
+    for metadata_ids in ((1,), (2,), (1,), (3,), (1,)):
+        cache.get_states(metadata_ids, "key", range(ZERO, ZERO + 1, 1), fetcher)
+    assert cache.size <= 600
+    assert len(fetcher.calls) == 3
+
+    cache.get_states((2,), "key", range(ZERO, ZERO + 1, 1), fetcher)
+    assert len(fetcher.calls) == 4
+
+
+async def test_history_cache(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test history reuses the cached periods until they are purged."""
+    utcnow = dt_util.utcnow()
+    with freeze_time() as freezer:
+        for hours_ago, state in ((3, "3"), (2, "2"), (0, "0")):
+            freezer.move_to(utcnow - timedelta(hours=hours_ago))
+            hass.states.async_set("sensor.one", state)
+            await async_wait_recording_done(hass)
+    assert recorder_mock.states_committed_until == pytest.approx(utcnow.timestamp())
+
+    def _get_states() -> list[str]:
+        hist = get_significant_states(
+            hass, utcnow - timedelta(hours=4), None, ["sensor.one"]
+        )
+        return [state.state for state in hist.get("sensor.one", [])]
+
+    assert await recorder_mock.async_add_executor_job(_get_states) == ["3", "2", "0"]
+    assert recorder_mock.history_cache.size
+
+    with patch.object(
+        modern, "_significant_states_rows", wraps=modern._significant_states_rows
+    ) as significant_states_rows:
+        assert await recorder_mock.async_add_executor_job(_get_states) == [
+            "3",
+            "2",
+            "0",
+        ]
+    # Only the periods before and after the cached ones are queried
+    assert significant_states_rows.call_count == 2
+
+    assert await recorder_mock.async_add_executor_job(
+        purge_old_data, recorder_mock, utcnow - timedelta(hours=1), False
+    )
+    assert await recorder_mock.async_add_executor_job(_get_states) == ["0"]
@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -21,6 +22,7 @@ from homeassistant.components.lock import LockState
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BULK_INSERT,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
@@ -1468,6 +1470,100 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_INSERT: True}])
+async def test_saving_with_bulk_insert(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test saving states and events with bulk inserts."""
+    assert recorder_mock._bulk_writer is not None
+    hass.bus.async_fire("custom_event", {"some": "data"})
+    hass.bus.async_fire("custom_event", {"some": "data"})
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    hass.states.async_set("test.two", "s2", {"attr": 1})
+    hass.states.async_set("test.one", "s3", {"attr": 2})
+    hass.states.async_set("test.one", "s4", {"attr": 2})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s5", {"attr": 1})
+    hass.states.async_remove("test.two")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 6
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s5"].entity_id == "test.one"
+        assert states_by_state[None].entity_id == "test.two"
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state[None].old_state_id == states_by_state["s2"].state_id
+
+        assert (
+            states_by_state["s1"].attributes_id
+            == states_by_state["s2"].attributes_id
+            == states_by_state["s5"].attributes_id
+        )
+        assert (
+            states_by_state["s3"].attributes_id
+            == states_by_state["s4"].attributes_id
+            != states_by_state["s1"].attributes_id
+        )
+
+        events = list(
+            session.query(EventTypes.event_type, EventData.shared_data)
+            .select_from(Events)
+            .outerjoin(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+            .filter(EventTypes.event_type == "custom_event")
+        )
+        assert events == [
+            ("custom_event", '{"some":"data"}'),
+            ("custom_event", '{"some":"data"}'),
+        ]
+        assert (
+            session.query(EventData)
+            .filter(EventData.shared_data == '{"some":"data"}')
+            .count()
+            == 1
+        )
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_read_only_session(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test read only sessions use the read only connections.
+
+    This test is specific for SQLite.
+    """
+    hass.states.async_set("test.one", "on", {})
+    await async_wait_recording_done(hass)
+
+    def _read_states() -> int:
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.get_bind() is recorder_mock._read_only_engine
+            with pytest.raises(OperationalError, match="readonly"):
+                session.execute(text("DELETE FROM states"))
+            return session.query(States).count()
+
+    assert await recorder_mock.async_add_executor_job(_read_states) == 1
+    assert recorder_mock.pool_wait_statistics["read_only"].connections == 1
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -0,0 +1,246 @@
+"""Test partitioning the states and events tables."""
+
+from datetime import datetime, timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from sqlalchemy import text
+
+from homeassistant.components.recorder import CONF_PARTITION_INTERVAL, Recorder
+from homeassistant.components.recorder.const import PartitionInterval
+from homeassistant.components.recorder.db_schema import States, StatesMeta
+from homeassistant.components.recorder.partitions import (
+    EVENTS_PARTITIONED_TABLE,
+    PARTITIONED_TABLES,
+    PARTITIONS_AHEAD,
+    STATES_PARTITIONED_TABLE,
+    PartitionedTable,
+    _parse_bound,
+    get_partitions,
+    is_partitioned,
+    next_period_start,
+    partition_name,
+    period_start,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.util import periodic_db_cleanups, session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.common import async_test_home_assistant
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.mark.parametrize(
+    ("interval", "moment", "start", "next_start"),
+    [
+        (
+            PartitionInterval.DAILY,
+            datetime(2024, 2, 29, 13, 45, 12, tzinfo=dt_util.UTC),
+            datetime(2024, 2, 29, tzinfo=dt_util.UTC),
+            datetime(2024, 3, 1, tzinfo=dt_util.UTC),
+        ),
+        (
+            PartitionInterval.MONTHLY,
+            datetime(2024, 1, 31, 23, 59, 59, tzinfo=dt_util.UTC),
+            datetime(2024, 1, 1, tzinfo=dt_util.UTC),
+            datetime(2024, 2, 1, tzinfo=dt_util.UTC),
+        ),
+        (
+            PartitionInterval.MONTHLY,
+            datetime(2024, 12, 15, tzinfo=dt_util.UTC),
+            datetime(2024, 12, 1, tzinfo=dt_util.UTC),
+            datetime(2025, 1, 1, tzinfo=dt_util.UTC),
+        ),
+    ],
+)
+def test_periods(
+    interval: PartitionInterval,
+    moment: datetime,
+    start: datetime,
+    next_start: datetime,
+) -> None:
+    """Test the start of periods."""
+    assert period_start(moment, interval) == start
+    assert next_period_start(start, interval) == next_start
+
+
+def test_partition_name() -> None:
+    """Test partition names."""
+    start = datetime(2024, 3, 5, tzinfo=dt_util.UTC)
+    assert (
+        partition_name(STATES_PARTITIONED_TABLE, start, PartitionInterval.DAILY)
+        == "states_20240305"
+    )
+    assert (
+        partition_name(EVENTS_PARTITIONED_TABLE, start, PartitionInterval.MONTHLY)
+        == "events_202403"
+    )
+
+
+def test_parse_bound() -> None:
+    """Test parsing partition bounds."""
+    assert _parse_bound("MINVALUE") is None
+    assert _parse_bound("'1709596800'") == 1709596800.0
+    assert _parse_bound("1709596800.5") == 1709596800.5
+
+
+@pytest.mark.skip_on_db_engine("postgresql")
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize(
+    "recorder_config", [{CONF_PARTITION_INTERVAL: PartitionInterval.DAILY}]
+)
+async def test_partitioning_ignored_without_postgresql(
+    hass: HomeAssistant, recorder_mock: Recorder, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the partition interval is ignored on databases other than PostgreSQL."""
+    assert recorder_mock.partition_interval is None
+    assert "only supported with PostgreSQL" in caplog.text
+
+
+def _partition_names(
+    table: PartitionedTable, interval: PartitionInterval, now: datetime
+) -> list[str]:
+    """Return the names of the partitions created on a new partitioned table."""
+    names = [f"{table.name}_legacy"]
+    start = period_start(now, interval)
+    for _ in range(PARTITIONS_AHEAD):
+        start = next_period_start(start, interval)
+        names.append(partition_name(table, start, interval))
+    return names
+
+
+@pytest.mark.skip_on_db_engine(["sqlite", "mysql"])
+@pytest.mark.usefixtures("hass_storage", "skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_migrate_to_partitioned_tables(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Test the existing rows are kept in the legacy partition."""
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass) as instance,
+    ):
+        await hass.async_start()
+        hass.states.async_set("sensor.test", "1")
+        hass.bus.async_fire("test_event")
+        await async_wait_recording_done(hass)
+        assert instance.partition_interval is None
+        await hass.async_stop()
+
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(
+            hass, {CONF_PARTITION_INTERVAL: PartitionInterval.DAILY}
+        ) as instance,
+    ):
+        await hass.async_start()
+        hass.states.async_set("sensor.test", "2")
+        hass.bus.async_fire("test_event")
+        await async_wait_recording_done(hass)
+        assert instance.partition_interval is PartitionInterval.DAILY
+
+        def _check_partitions() -> None:
+            now = dt_util.utcnow()
+            with session_scope(hass=hass, read_only=True) as session:
+                for table in PARTITIONED_TABLES:
+                    assert is_partitioned(session, table)
+                    assert [
+                        partition.name for partition in get_partitions(session, table)
+                    ] == _partition_names(table, PartitionInterval.DAILY, now)
+                    assert session.execute(
+                        text(
+                            f"SELECT DISTINCT tableoid::regclass::text FROM {table.name}"  # noqa: S608
+                        )
+                    ).scalars().all() == [f"{table.name}_legacy"]
+
+                states = (
+                    session.query(States)
+                    .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                    .filter(StatesMeta.entity_id == "sensor.test")
+                    .order_by(States.state_id)
+                    .all()
+                )
+                assert [state.state for state in states] == ["1", "2"]
+                assert states[1].old_state_id == states[0].state_id
+
+        await instance.async_add_executor_job(_check_partitions)
+        await hass.async_stop()
+
+
+@pytest.mark.skip_on_db_engine(["sqlite", "mysql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize(
+    "recorder_config", [{CONF_PARTITION_INTERVAL: PartitionInterval.DAILY}]
+)
+async def test_purge_expired_partitions(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test purging drops the expired partitions."""
+    now = dt_util.utcnow()
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+    freezer.move_to(now + timedelta(days=2))
+    hass.states.async_set("sensor.test", "2")
+    await async_wait_recording_done(hass)
+
+    purge_before = period_start(now + timedelta(days=2), PartitionInterval.DAILY)
+    assert purge_old_data(recorder_mock, purge_before, repack=False)
+
+    # The legacy partition and the partition of the next day are expired
+    names = _partition_names(STATES_PARTITIONED_TABLE, PartitionInterval.DAILY, now)
+    with session_scope(hass=hass) as session:
+        assert [
+            partition.name
+            for partition in get_partitions(session, STATES_PARTITIONED_TABLE)
+        ] == names[2:]
+        states = session.query(States).all()
+        assert [state.state for state in states] == ["2"]
+        assert states[0].old_state_id is None
+    assert "sensor.test" in recorder_mock.states_manager._last_committed_id
+
+
+@pytest.mark.skip_on_db_engine(["sqlite", "mysql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize(
+    "recorder_config", [{CONF_PARTITION_INTERVAL: PartitionInterval.DAILY}]
+)
+async def test_create_partition_overlapping_default_partition(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a partition overlapping rows of the default partition is skipped."""
+    now = dt_util.utcnow()
+    last_end = period_start(now, PartitionInterval.DAILY) + timedelta(
+        days=PARTITIONS_AHEAD + 1
+    )
+    with session_scope(hass=hass) as session:
+        # A row from a clock that was set ahead ends up in the default partition
+        session.add(
+            States(
+                state="ahead",
+                last_updated_ts=(last_end + timedelta(hours=1)).timestamp(),
+            )
+        )
+
+    freezer.move_to(now + timedelta(days=1))
+    await recorder_mock.async_add_executor_job(periodic_db_cleanups, recorder_mock)
+
+    name = partition_name(STATES_PARTITIONED_TABLE, last_end, PartitionInterval.DAILY)
+    assert f"Error creating partition {name} of the states table" in caplog.text
+    with session_scope(hass=hass, read_only=True) as session:
+        assert [
+            partition.name
+            for partition in get_partitions(session, STATES_PARTITIONED_TABLE)
+        ] == _partition_names(STATES_PARTITIONED_TABLE, PartitionInterval.DAILY, now)
+        assert [
+            partition.name
+            for partition in get_partitions(session, EVENTS_PARTITIONED_TABLE)
+        ] == [
+            *_partition_names(EVENTS_PARTITIONED_TABLE, PartitionInterval.DAILY, now),
+            partition_name(EVENTS_PARTITIONED_TABLE, last_end, PartitionInterval.DAILY),
+        ]
@@ -1,13 +1,16 @@
 """Test pool."""
 
+from functools import partial
+from pathlib import Path
+import sqlite3
 import threading
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from homeassistant.components.recorder.const import DB_WORKER_PREFIX
-from homeassistant.components.recorder.pool import RecorderPool
+from homeassistant.components.recorder.pool import ReadOnlyPool, RecorderPool
 
 
 async def test_recorder_pool_called_from_event_loop() -> None:
@@ -78,3 +81,51 @@ def test_recorder_pool(caplog: pytest.LogCaptureFixture) -> None:
     new_thread.join()
     assert "accesses the database without the database executor" not in caplog.text
     assert connections[6] != connections[7]
+
+
+def _read_only_engine(tmp_path: Path):
+    """Create an engine with read only connections to a new database."""
+    db_path = tmp_path / "test.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE test (id INTEGER)")
+    return create_engine(
+        "sqlite://",
+        creator=partial(
+            sqlite3.connect,
+            f"file:{db_path}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        ),
+        poolclass=ReadOnlyPool,
+    )
+
+
+async def test_read_only_pool_called_from_event_loop(tmp_path: Path) -> None:
+    """Test we raise an exception when calling from the event loop."""
+    engine = _read_only_engine(tmp_path)
+    with pytest.raises(RuntimeError):
+        sessionmaker(bind=engine)().connection()
+
+
+def test_read_only_pool(tmp_path: Path) -> None:
+    """Test ReadOnlyPool records the wait for connections."""
+    engine = _read_only_engine(tmp_path)
+    pool = engine.pool
+    assert isinstance(pool, ReadOnlyPool)
+    assert pool.size() == 4
+    wait_statistics = pool.wait_statistics
+    assert wait_statistics.average_wait == 0
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM test")).scalar() == 0
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            conn.connection.driver_connection.execute("INSERT INTO test VALUES (1)")
+    with engine.connect():
+        pass
+
+    assert wait_statistics.connections == 2
+    assert wait_statistics.max_wait >= wait_statistics.average_wait > 0
+
+    engine.dispose()
+    assert engine.pool is not pool
+    assert engine.pool.wait_statistics is wait_statistics
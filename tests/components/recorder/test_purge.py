@@ -25,7 +25,11 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    MIN_PURGE_BATCH_SIZE,
+    PurgeProgress,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -110,6 +114,76 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+async def test_purge_progress(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test the progress of a purge that runs over multiple purge tasks."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 24),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 24),
+    ):
+        assert not purge_old_data(
+            recorder_mock,
+            purge_before,
+            states_batch_size=1,
+            events_batch_size=1,
+            repack=False,
+        )
+        progress = recorder_mock.purge_progress
+        assert progress is not None
+        assert progress.purge_before == purge_before
+        assert progress.rows_purged == 24
+        assert progress.rows_remaining == 24
+        assert progress.as_dict()["rows_remaining"] == 24
+
+        assert not purge_old_data(
+            recorder_mock,
+            purge_before,
+            states_batch_size=1,
+            events_batch_size=1,
+            repack=False,
+        )
+        assert recorder_mock.purge_progress is progress
+        assert progress.rows_remaining == 0
+
+        assert purge_old_data(recorder_mock, purge_before, repack=False)
+        assert recorder_mock.purge_progress is None
+
+
+def test_purge_progress_batch_size() -> None:
+    """Test the purge batch size adapts to the time a batch takes."""
+    progress = PurgeProgress(dt_util.utcnow(), 10000, 4000)
+
+    # A slow batch makes the batches smaller
+    progress.record_batch(4000, 2.0, 4000)
+    assert progress.batch_size == 2500
+    # Partial batches are not used to adapt the batch size
+    progress.record_batch(10, 2.0, 4000)
+    assert progress.batch_size == 2500
+    # A fast batch makes the batches larger, up to max_bind_vars
+    progress.record_batch(2500, 0.1, 4000)
+    assert progress.batch_size == 4000
+    for _ in range(20):
+        progress.record_batch(progress.batch_size, 60, 4000)
+    assert progress.batch_size == MIN_PURGE_BATCH_SIZE
+    assert progress.rows_remaining == 0
+
+
+def test_purge_progress_should_yield() -> None:
+    """Test a purge run yields when the backlog grows or it runs out of time."""
+    progress = PurgeProgress(dt_util.utcnow(), 100, 4000)
+    with patch("homeassistant.components.recorder.purge.time.monotonic") as now:
+        now.return_value = 100
+        progress.start_run(10)
+        assert not progress.should_yield(10)
+        assert progress.should_yield(1000)
+        now.return_value = 200
+        assert progress.should_yield(10)
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     await _add_test_states(hass)
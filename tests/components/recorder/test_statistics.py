@@ -9,7 +9,11 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    Statistics,
+    StatisticsRollup,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -30,6 +34,7 @@ from homeassistant.components.recorder.statistics import (
     get_metadata_with_session,
     get_short_term_statistics_run_cache,
     list_statistic_ids,
+    rebuild_statistics_rollups,
     validate_statistics,
 )
 from homeassistant.components.recorder.table_managers.statistics_meta import (
@@ -1844,6 +1849,282 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.usefixtures("recorder_mock")
+async def test_statistics_rollups(hass: HomeAssistant, timezone: str) -> None:
+    """Test day, week and month statistics are read from the rollups."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-29 00:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hours),
+            "mean": hours % 7,
+            "min": hours % 7 - 1,
+            "max": hours % 7 + 1,
+            "state": hours,
+            "sum": hours * 2,
+        }
+        for hours in range(0, 24 * 5, 5)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+    # The time zone changed, so the import queued a rebuild of the rollups
+    await async_recorder_block_till_done(hass)
+    assert instance.statistics_rollups_ready
+
+    def _get_stats(period: str) -> tuple[dict, dict]:
+        """Return the statistics with and without the rollups."""
+        stats = statistics_during_period(
+            hass,
+            start - timedelta(days=40),
+            period=period,
+            statistic_ids={"test:total_energy_import"},
+            types={"change", "last_reset", "max", "mean", "min", "state", "sum"},
+        )
+        with patch.object(instance, "statistics_rollups_ready", False):
+            folded_stats = statistics_during_period(
+                hass,
+                start - timedelta(days=40),
+                period=period,
+                statistic_ids={"test:total_energy_import"},
+                types={"change", "last_reset", "max", "mean", "min", "state", "sum"},
+            )
+        return stats, folded_stats
+
+    for period in ("day", "week", "month"):
+        stats, folded_stats = _get_stats(period)
+        assert stats
+        assert stats == folded_stats
+
+    # Adjusting the statistics updates the rollups
+    recorder.get_instance(hass).async_adjust_statistics(
+        "test:total_energy_import", start + timedelta(days=2), 100, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    for period in ("day", "week", "month"):
+        stats, folded_stats = _get_stats(period)
+        assert stats == folded_stats
+
+    # The rebuild restores missing rollups
+    def _delete_rollups() -> None:
+        with session_scope(hass=hass) as session:
+            session.query(StatisticsRollup).delete()
+
+    await instance.async_add_executor_job(_delete_rollups)
+    instance.statistics_rollups_ready = False
+    assert await instance.async_add_executor_job(rebuild_statistics_rollups, instance)
+    assert instance.statistics_rollups_ready
+    for period in ("day", "week", "month"):
+        stats, folded_stats = _get_stats(period)
+        assert stats == folded_stats
+
+
+async def test_statistics_rollups_time_zone_change(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test the rollups are rebuilt when the time zone changes."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    start = dt_util.parse_datetime("2022-10-03 00:00:00+00:00")
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        [
+            {"start": start + timedelta(hours=hours), "sum": hours}
+            for hours in range(48)
+        ],
+    )
+    await async_wait_recording_done(hass)
+    # The time zone changed, so the import queued a rebuild of the rollups
+    await async_recorder_block_till_done(hass)
+    assert instance.statistics_rollups_ready
+    assert instance.statistics_rollup_time_zone == "UTC"
+
+    await hass.config.async_set_time_zone("Asia/Tokyo")
+    # Until the rollups are rebuilt, the hourly statistics are used
+    assert not statistics._statistics_rollups_ready(instance)
+    async_add_external_statistics(
+        hass, external_metadata, [{"start": start + timedelta(hours=48), "sum": 48}]
+    )
+    await async_wait_recording_done(hass)
+    await async_recorder_block_till_done(hass)
+    assert statistics._statistics_rollups_ready(instance)
+    assert instance.statistics_rollup_time_zone == "Asia/Tokyo"
+
+    def _get_time_zones() -> set[str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return {
+                time_zone for (time_zone,) in session.query(StatisticsRollup.time_zone)
+            }
+
+    assert await instance.async_add_executor_job(_get_time_zones) == {"Asia/Tokyo"}
+
+    stats = statistics_during_period(
+        hass,
+        start,
+        period="day",
+        statistic_ids={"test:total_energy_import"},
+        types={"change", "sum"},
+    )
+    with patch.object(instance, "statistics_rollups_ready", False):
+        folded_stats = statistics_during_period(
+            hass,
+            start,
+            period="day",
+            statistic_ids={"test:total_energy_import"},
+            types={"change", "sum"},
+        )
+    assert stats == folded_stats
+    # The days start at midnight in Tokyo, 9 hours before midnight in UTC
+    assert [row["start"] for row in stats["test:total_energy_import"]] == [
+        dt_util.parse_datetime(day).timestamp()
+        for day in (
+            "2022-10-03 00:00:00+09:00",
+            "2022-10-04 00:00:00+09:00",
+            "2022-10-05 00:00:00+09:00",
+        )
+    ]
+    assert [row["sum"] for row in stats["test:total_energy_import"]] == [14, 38, 48]
+    assert [row["change"] for row in stats["test:total_energy_import"]] == [
+        14,
+        24,
+        10,
+    ]
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.usefixtures("recorder_mock")
+async def test_statistics_rollups_partial_periods(
+    hass: HomeAssistant, timezone: str
+) -> None:
+    """Test hours outside of the rollups are reduced from the hourly statistics."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-01 00:00:00"))
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": True,
+            "has_sum": True,
+            "name": "Total imported energy",
+            "source": "test",
+            "statistic_id": "test:total_energy_import",
+            "unit_of_measurement": "kWh",
+        },
+        [
+            {
+                "start": start + timedelta(hours=hours),
+                "mean": hours % 7,
+                "min": hours % 7 - 1,
+                "max": hours % 7 + 1,
+                "state": hours,
+                "sum": hours * 2,
+            }
+            for hours in range(0, 24 * 70, 3)
+        ],
+    )
+    await async_wait_recording_done(hass)
+    # The time zone changed, so the import queued a rebuild of the rollups
+    await async_recorder_block_till_done(hass)
+    assert instance.statistics_rollups_ready
+
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+    ranges = (
+        (start + timedelta(hours=5, minutes=30), None),
+        (start + timedelta(hours=5), start + timedelta(days=45, hours=7)),
+        (start + timedelta(days=2), start + timedelta(days=40)),
+        (start + timedelta(hours=2), start + timedelta(hours=20)),
+    )
+
+    def _get_stats() -> None:
+        with session_scope(hass=hass, read_only=True) as session:
+            metadata = instance.statistics_meta_manager.get_many(
+                session, statistic_ids={"test:total_energy_import"}
+            )
+            metadata_ids = [metadata["test:total_energy_import"][0]]
+            for (
+                period,
+                reduce_statistics,
+            ) in statistics._STATISTICS_ROLLUP_PERIOD_REDUCERS.items():
+                for start_time, end_time in ranges:
+                    stats = statistics._statistics_rollups_during_period(
+                        hass,
+                        session,
+                        start_time,
+                        end_time,
+                        {"test:total_energy_import"},
+                        metadata_ids,
+                        metadata,
+                        period,
+                        None,
+                        types,
+                    )
+                    folded_stats = reduce_statistics(
+                        statistics._statistics_during_period_from_table(
+                            hass,
+                            session,
+                            start_time,
+                            end_time,
+                            {"test:total_energy_import"},
+                            metadata_ids,
+                            metadata,
+                            Statistics,
+                            None,
+                            types,
+                        ),
+                        types,
+                    )
+                    assert stats
+                    assert stats == folded_stats
+
+    await instance.async_add_executor_job(_get_stats)
+
+    # Periods are aligned by statistics_during_period, the change of the first
+    # period is relative to the sum before it
+    for period in ("day", "week", "month"):
+        stats = statistics_during_period(
+            hass,
+            start + timedelta(days=3, hours=5),
+            end_time=start + timedelta(days=50, hours=7),
+            period=period,
+            statistic_ids={"test:total_energy_import"},
+            types={"change", "max", "mean", "min", "state", "sum"},
+        )
+        with patch.object(instance, "statistics_rollups_ready", False):
+            folded_stats = statistics_during_period(
+                hass,
+                start + timedelta(days=3, hours=5),
+                end_time=start + timedelta(days=50, hours=7),
+                period=period,
+                statistic_ids={"test:total_energy_import"},
+                types={"change", "max", "mean", "min", "state", "sum"},
+            )
+        assert stats
+        assert stats == folded_stats
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -27,6 +27,7 @@ from homeassistant.components.recorder.db_schema import (
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
+    StatisticResult,
     process_timestamp,
 )
 from homeassistant.components.recorder.statistics import (
@@ -36,6 +37,7 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor.recorder import compile_statistics
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
@@ -2331,6 +2333,175 @@ async def test_compile_hourly_statistics_partially_unavailable(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_statistics_aggregated_by_database(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the statistics aggregated by the database match the loaded states."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    with freeze_time(zero) as freezer:
+        await async_record_states(
+            hass, freezer, zero, "sensor.test1", TEMPERATURE_SENSOR_ATTRIBUTES
+        )
+        freezer.move_to(zero + timedelta(minutes=4))
+        hass.states.async_set(
+            "sensor.test1",
+            "86",
+            attributes=TEMPERATURE_SENSOR_ATTRIBUTES | {"unit_of_measurement": "°F"},
+        )
+    await async_record_states_partially_unavailable(
+        hass, zero, "sensor.test2", POWER_SENSOR_ATTRIBUTES
+    )
+    await async_wait_recording_done(hass)
+
+    def _compile_statistics() -> list[StatisticResult]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return compile_statistics(
+                hass, session, zero, zero + timedelta(minutes=5)
+            ).platform_stats
+
+    aggregated = await recorder_mock.async_add_executor_job(_compile_statistics)
+    with patch.object(
+        history, "get_numeric_states_aggregates_with_session", return_value={}
+    ):
+        loaded = await recorder_mock.async_add_executor_job(_compile_statistics)
+
+    assert len(aggregated) == 2
+    assert [result["meta"] for result in aggregated] == [
+        result["meta"] for result in loaded
+    ]
+    for aggregated_result, loaded_result in zip(aggregated, loaded, strict=True):
+        assert aggregated_result["stat"] == {
+            key: pytest.approx(value) if isinstance(value, float) else value
+            for key, value in loaded_result["stat"].items()
+        }
+
+
+async def test_compile_statistics_from_accumulator(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test compiling statistics from the states accumulated by the recorder."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    with freeze_time(zero) as freezer:
+        hass.states.async_set("sensor.test1", "10", TEMPERATURE_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.test2", "100", ENERGY_SENSOR_ATTRIBUTES)
+        await async_wait_recording_done(hass)
+        # The sensors are tracked from their current state
+        do_adhoc_statistics(hass, start=zero - timedelta(minutes=5))
+        await async_wait_recording_done(hass)
+
+        freezer.move_to(zero + timedelta(minutes=1))
+        hass.states.async_set("sensor.test1", "20", TEMPERATURE_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.test2", "150", ENERGY_SENSOR_ATTRIBUTES)
+        await async_wait_recording_done(hass)
+
+    with (
+        patch.object(
+            history,
+            "get_full_significant_states_with_session",
+            wraps=history.get_full_significant_states_with_session,
+        ) as get_states_mock,
+        patch.object(
+            history,
+            "get_numeric_states_aggregates_with_session",
+            wraps=history.get_numeric_states_aggregates_with_session,
+        ) as get_aggregates_mock,
+    ):
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    get_states_mock.assert_not_called()
+    get_aggregates_mock.assert_not_called()
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(18.0),
+                "min": pytest.approx(10.0),
+                "max": pytest.approx(20.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ],
+        "sensor.test2": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": pytest.approx(150.0),
+                "sum": pytest.approx(50.0),
+            }
+        ],
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
+@pytest.mark.parametrize(
+    "state",
+    [
+        "+5",
+        "5.",
+        ".5",
+        "01",
+        "-0",
+        "1e100",
+        "1E-100",
+        "1e400",
+        "1e-400",
+        " 5 ",
+        "1_000",
+        "0x10",
+        "Infinity",
+        "nan",
+    ],
+)
+async def test_compile_statistics_aggregated_number_formats(
+    hass: HomeAssistant, recorder_mock: Recorder, state: str
+) -> None:
+    """Test the database aggregates the states float() accepts."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    with freeze_time(zero) as freezer:
+        for minutes, value in ((0, "10"), (1, state), (2, "20")):
+            freezer.move_to(zero + timedelta(minutes=minutes))
+            hass.states.async_set(
+                "sensor.test1", value, attributes=TEMPERATURE_SENSOR_ATTRIBUTES
+            )
+            await async_wait_recording_done(hass)
+
+    def _compile_statistics() -> list[StatisticResult]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return compile_statistics(
+                hass, session, zero, zero + timedelta(minutes=5)
+            ).platform_stats
+
+    aggregated = await recorder_mock.async_add_executor_job(_compile_statistics)
+    with patch.object(
+        history, "get_numeric_states_aggregates_with_session", return_value={}
+    ):
+        loaded = await recorder_mock.async_add_executor_job(_compile_statistics)
+
+    assert len(aggregated) == 1
+    assert aggregated[0]["meta"] == loaded[0]["meta"]
+    assert aggregated[0]["stat"] == {
+        key: pytest.approx(value) if isinstance(value, float) else value
+        for key, value in loaded[0]["stat"].items()
+    }
+
+
 @pytest.mark.parametrize(
     ("device_class", "state_unit", "value"),
     [
@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -27,6 +28,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +36,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1262,6 +1265,115 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shared_listener(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test connections subscribed to entities share a listener."""
+    init_count = sum(hass.bus.async_listeners().values())
+    other_client = await hass_ws_client(hass)
+
+    for client in (websocket_client, other_client):
+        await client.send_json({"id": 7, "type": "subscribe_entities"})
+        msg = await client.receive_json()
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["type"] == "event"
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.states.async_set("light.permitted", "on")
+    for client in (websocket_client, other_client):
+        msg = await client.receive_json()
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert msg["event"]["a"]["light.permitted"]["s"] == "on"
+
+    for client in (websocket_client, other_client):
+        await client.send_json(
+            {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+        )
+        msg = await client.receive_json()
+        assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_subscribe_entities_coalesce(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the changes of entities are merged during a coalescing window."""
+    hass.states.async_set("light.kitchen", "off", {"color": "red"})
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_ms": 1000}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.kitchen"]["s"] == "off"
+
+    hass.states.async_set("light.kitchen", "on", {"color": "blue", "level": 1})
+    hass.states.async_set("light.kitchen", "off", {"level": 1})
+    hass.states.async_set("light.hall", "on")
+    hass.states.async_remove("light.hall")
+    hass.states.async_set("light.porch", "on")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.porch": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {
+            "light.kitchen": {
+                "+": {"a": {"level": 1}, "c": ANY, "lc": ANY},
+                "-": {"a": ["color"]},
+            }
+        },
+    }
+
+
+async def test_subscribe_events_coalesce(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test state changes of an entity are collapsed during a coalescing window."""
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_events",
+            "event_type": "state_changed",
+            "coalesce_ms": 1000,
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"]["data"]["entity_id"] == "light.kitchen"
+    assert msg["event"]["data"]["old_state"]["state"] == "on"
+    assert msg["event"]["data"]["new_state"]["state"] == "off"
+
+    # The window is dropped when unsubscribing
+    hass.states.async_set("light.kitchen", "on")
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+    await websocket_client.send_json({"id": 9, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["type"] == "pong"
+
+
 async def test_subscribe_unsubscribe_entities_with_filter(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
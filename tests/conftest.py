@@ -91,6 +91,7 @@ from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util, location
 from homeassistant.util.async_ import create_eager_task, get_scheduled_timer_handles
 from homeassistant.util.json import json_loads
+from homeassistant.util.timer_wheel import TimerWheel, TimerWheelHandle
 
 from .ignore_uncaught_exceptions import IGNORE_UNCAUGHT_EXCEPTIONS
 from .syrupy import HomeAssistantSnapshotExtension, override_syrupy_finish
@@ -351,6 +352,28 @@ def enable_event_loop_debug(event_loop: asyncio.AbstractEventLoop) -> None:
     event_loop.set_debug(True)
 
 
+def _scheduled_timers(
+    loop: asyncio.AbstractEventLoop,
+) -> list[tuple[asyncio.TimerHandle | TimerWheelHandle, tuple[Any, ...]]]:
+    """Return the active timers of the loop with their arguments.
+
+    The timers of a timer wheel tick share a single loop timer handle,
+    they are returned instead of the handle of the tick.
+    """
+    timers: list[tuple[asyncio.TimerHandle | TimerWheelHandle, tuple[Any, ...]]] = []
+    wheels: set[int] = set()
+    for handle in get_scheduled_timer_handles(loop):
+        if handle.cancelled():
+            continue
+        wheel = getattr(handle._callback, "__self__", None)
+        if not isinstance(wheel, TimerWheel):
+            timers.append((handle, handle._args))
+        elif id(wheel) not in wheels:
+            wheels.add(id(wheel))
+            timers.extend((timer, timer.args) for timer in wheel.timers())
+    return timers
+
+
 @pytest.fixture(autouse=True)
 def verify_cleanup(
     event_loop: asyncio.AbstractEventLoop,
@@ -382,18 +405,17 @@ def verify_cleanup(
     if tasks:
         event_loop.run_until_complete(asyncio.wait(tasks))
 
-    for handle in get_scheduled_timer_handles(event_loop):
-        if not handle.cancelled():
-            with long_repr_strings():
-                if expected_lingering_timers:
-                    _LOGGER.warning("Lingering timer after test %r", handle)
-                elif handle._args and isinstance(job := handle._args[-1], HassJob):
-                    if job.cancel_on_shutdown:
-                        continue
-                    pytest.fail(f"Lingering timer after job {job!r}")
-                else:
-                    pytest.fail(f"Lingering timer after test {handle!r}")
-                handle.cancel()
+    for handle, args in _scheduled_timers(event_loop):
+        with long_repr_strings():
+            if expected_lingering_timers:
+                _LOGGER.warning("Lingering timer after test %r", handle)
+            elif args and isinstance(job := args[-1], HassJob):
+                if job.cancel_on_shutdown:
+                    continue
+                pytest.fail(f"Lingering timer after job {job!r}")
+            else:
+                pytest.fail(f"Lingering timer after test {handle!r}")
+            handle.cancel()
 
     # Verify no threads where left behind.
     threads = frozenset(threading.enumerate()) - threads_before
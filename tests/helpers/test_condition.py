@@ -1,6 +1,7 @@
 """Test the condition helper."""
 
 from datetime import datetime, timedelta
+import logging
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -371,6 +372,149 @@ async def test_malformed_and_condition_list_shorthand(hass: HomeAssistant) -> No
         cv.CONDITION_SCHEMA(config)
 
 
+async def _async_conditions_from_config(
+    hass: HomeAssistant, configs: list[dict[str, Any]], compiled: bool
+) -> Any:
+    """Return a check of conditions, compiled or not."""
+    configs = await condition.async_validate_conditions_config(
+        hass, [cv.CONDITION_SCHEMA(config) for config in configs]
+    )
+    return await condition.async_conditions_from_config(
+        hass, configs, logging.getLogger(__name__), "test", compiled=compiled
+    )
+
+
+async def test_compiled_conditions(hass: HomeAssistant) -> None:
+    """Test compiled conditions are evaluated cheapest first without a trace."""
+    configs = [
+        {"condition": "template", "value_template": "{{ true }}"},
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "template",
+                    "value_template": "{{ true }}",
+                },
+                {
+                    "condition": "state",
+                    "entity_id": "sensor.temperature",
+                    "state": "100",
+                },
+            ],
+        },
+    ]
+    test = await _async_conditions_from_config(hass, configs, True)
+
+    hass.states.async_set("sensor.temperature", 120)
+    with patch(
+        "homeassistant.helpers.condition.async_template",
+        wraps=condition.async_template,
+    ) as template_mock:
+        trace.trace_cv.set(None)
+        assert not test(None)
+        assert not template_mock.called
+
+        hass.states.async_set("sensor.temperature", 100)
+        trace.trace_cv.set(None)
+        assert test(None)
+        assert template_mock.call_count == 2
+
+    # The declared order is kept when a trace is recorded
+    hass.states.async_set("sensor.temperature", 120)
+    trace.trace_clear()
+    assert not test(None)
+    assert_condition_trace(
+        {
+            "condition/0": [{"result": {"result": True, "entities": []}}],
+            "condition/1": [{"result": {"result": False}}],
+            "condition/1/conditions/0": [{"result": {"result": True, "entities": []}}],
+            "condition/1/conditions/1": [{"result": {"result": False}}],
+            "condition/1/conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": "120",
+                        "wanted_state": "100",
+                    }
+                }
+            ],
+        }
+    )
+
+
+async def test_compiled_conditions_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test compiled conditions report the same errors as declared ones."""
+    configs = [
+        {"condition": "template", "value_template": "{{ 1 / 0 }}"},
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "numeric_state",
+                    "entity_id": "sensor.missing",
+                    "below": 110,
+                },
+                {
+                    "condition": "or",
+                    "conditions": [
+                        {
+                            "condition": "numeric_state",
+                            "entity_id": "sensor.other_missing",
+                            "below": 110,
+                        },
+                        {
+                            "condition": "state",
+                            "entity_id": "sensor.temperature",
+                            "state": "100",
+                        },
+                    ],
+                },
+            ],
+        },
+        {
+            "condition": "not",
+            "conditions": [
+                {"condition": "template", "value_template": "{{ false }}"},
+                {
+                    "condition": "numeric_state",
+                    "entity_id": "sensor.temperature",
+                    "attribute": "missing",
+                    "below": 110,
+                },
+            ],
+        },
+    ]
+    hass.states.async_set("sensor.temperature", "120")
+
+    messages = []
+    for compiled in (False, True):
+        test = await _async_conditions_from_config(hass, configs, compiled)
+        caplog.clear()
+        trace.trace_cv.set(None)
+        with patch(
+            "homeassistant.helpers.condition.async_template",
+            wraps=condition.async_template,
+        ) as template_mock:
+            assert not test(None)
+        assert template_mock.call_count == 2
+        messages.append(
+            [
+                record.getMessage()
+                for record in caplog.records
+                if record.name == __name__
+            ]
+        )
+
+    # No condition is false, so all the errors are reported
+    assert len(messages[0]) == 1
+    assert "In 'condition' (item 1 of 3)" in messages[0][0]
+    assert "In 'or' (item 1 of 2)" in messages[0][0]
+    assert "In 'not' (item 2 of 2)" in messages[0][0]
+    assert messages[1] == messages[0]
+
+
 async def test_or_condition(hass: HomeAssistant) -> None:
     """Test the 'or' condition."""
     config = {
@@ -1506,7 +1650,7 @@ async def test_numeric_state_known_non_matching(hass: HomeAssistant) -> None:
     )
 
     # Unknown state
-    hass.states.async_set("sensor.temperature", "unknown")
+    hass.states.async_set("sensor.temperature", "120")
     assert not test(hass)
 
     assert_condition_trace(
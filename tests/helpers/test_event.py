@@ -30,6 +30,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_time_change_schedules_count,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -1067,6 +1068,118 @@ async def test_track_template_result(hass: HomeAssistant) -> None:
     assert len(wildercard_runs) == 4
 
 
+async def test_track_template_result_shared_render(hass: HomeAssistant) -> None:
+    """Test identical templates of different trackers render once per change."""
+    first_runs = []
+    second_runs = []
+    template_str = "{{ states('sensor.one') }} {{ states('sensor.two') }}"
+    first_template = Template(template_str, hass)
+    second_template = Template(template_str, hass)
+
+    @callback
+    def first_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        first_runs.append(updates.pop().result)
+        # Change a state the template depends on while the event is dispatched
+        if hass.states.get("sensor.two").state != "changed":
+            hass.states.async_set("sensor.two", "changed")
+
+    @callback
+    def second_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        second_runs.append(updates.pop().result)
+
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    first_info = async_track_template_result(
+        hass, [TrackTemplate(first_template, None)], first_run_callback
+    )
+    second_info = async_track_template_result(
+        hass, [TrackTemplate(second_template, None)], second_run_callback
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.two", "changed")
+    await hass.async_block_till_done()
+    assert first_runs == ["1 changed"]
+    assert second_runs == ["1 changed"]
+
+    second_renders = second_template._renders
+    hass.states.async_set("sensor.one", "one")
+    await hass.async_block_till_done()
+    assert first_runs == ["1 changed", "one changed"]
+    assert second_runs == ["1 changed", "one changed"]
+    assert second_template._renders == second_renders
+
+    # A state changed by a listener is not hidden by the shared render
+    hass.states.async_set("sensor.two", "two")
+    await hass.async_block_till_done()
+    assert first_runs[-1] == "one changed"
+    assert second_runs[-1] == "one changed"
+
+    first_info.async_remove()
+    hass.states.async_set("sensor.one", "uno")
+    await hass.async_block_till_done()
+    assert first_runs[-1] == "one changed"
+    assert second_runs[-1] == "uno changed"
+
+    second_info.async_remove()
+
+
+async def test_track_template_result_attribute_changes(hass: HomeAssistant) -> None:
+    """Test templates only re-render when a state or attribute they read changes."""
+    runs = []
+    template_attribute = Template(
+        "{{ states('climate.living') }} {{ state_attr('climate.living', 'temperature') }}",
+        hass,
+    )
+
+    @callback
+    def run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    hass.states.async_set(
+        "climate.living", "heat", {"temperature": 21, "current_temperature": 19}
+    )
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_attribute, None)], run_callback
+    )
+    await hass.async_block_till_done()
+    renders = template_attribute._renders
+
+    hass.states.async_set(
+        "climate.living", "heat", {"temperature": 21, "current_temperature": 20}
+    )
+    await hass.async_block_till_done()
+    assert template_attribute._renders == renders
+    assert runs == []
+
+    hass.states.async_set(
+        "climate.living", "heat", {"temperature": 22, "current_temperature": 20}
+    )
+    await hass.async_block_till_done()
+    assert runs == ["heat 22"]
+
+    hass.states.async_set(
+        "climate.living", "off", {"temperature": 22, "current_temperature": 20}
+    )
+    await hass.async_block_till_done()
+    assert runs == ["heat 22", "off 22"]
+
+    hass.states.async_remove("climate.living")
+    await hass.async_block_till_done()
+    assert runs == ["heat 22", "off 22", "unknown None"]
+
+    info.async_remove()
+
+
 async def test_track_template_result_none(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -3604,7 +3717,8 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
         timedelta(seconds=10),
         name=unique_string,
     )
-    scheduled = getattr(hass.loop, "_scheduled")
+    # The timer may be on the timer wheel, which shares the loop handle
+    scheduled = [*getattr(hass.loop, "_scheduled"), *hass.timer_wheel.timers()]
     assert any(handle for handle in scheduled if unique_string in str(handle))
     unsub()
 
@@ -3998,6 +4112,102 @@ async def test_periodic_task_hour(
     assert len(specific_runs) == 3
 
 
+async def test_periodic_task_shared_schedule(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test periodic tasks with the same pattern share a schedule."""
+    runs_1: list[datetime] = []
+    runs_2: list[datetime] = []
+    runs_other: list[datetime] = []
+
+    @callback
+    def run_1(now: datetime) -> None:
+        runs_1.append(now)
+
+    @callback
+    def run_2(now: datetime) -> None:
+        runs_2.append(now)
+
+    @callback
+    def run_other(now: datetime) -> None:
+        runs_other.append(now)
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+
+    unsub_1 = async_track_utc_time_change(hass, run_1, minute="/5", second=0)
+    unsub_2 = async_track_utc_time_change(hass, run_2, minute="/5", second=0)
+    unsub_other = async_track_utc_time_change(
+        hass,
+        run_other,
+        minute="/5",
+        second=0,
+        local=True,
+    )
+    assert async_time_change_schedules_count(hass) == 2
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_1) == 1
+    assert runs_2 == runs_1
+    assert len(runs_other) == 1
+
+    unsub_1()
+    assert async_time_change_schedules_count(hass) == 2
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_1) == 1
+    assert len(runs_2) == 2
+
+    unsub_2()
+    unsub_2()
+    unsub_other()
+    assert async_time_change_schedules_count(hass) == 0
+
+
+async def test_shared_time_change_listener_raises(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failing listener does not stop the others of a time pattern."""
+    runs: list[datetime] = []
+
+    @callback
+    def run_raises(now: datetime) -> None:
+        raise ValueError("Broken")
+
+    @callback
+    def run(now: datetime) -> None:
+        runs.append(now)
+
+    now = dt_util.utcnow()
+    freezer.move_to(datetime(now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC))
+
+    unsub_raises = async_track_utc_time_change(hass, run_raises, minute="/5", second=0)
+    unsub = async_track_utc_time_change(hass, run, minute="/5", second=0)
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+    assert "Broken" in caplog.text
+
+    unsub_raises()
+    unsub()
+
+
 async def test_periodic_task_wrong_input(hass: HomeAssistant) -> None:
     """Test periodic tasks with wrong input."""
     specific_runs = []
@@ -4468,6 +4678,66 @@ async def test_async_call_later_cancel(hass: HomeAssistant) -> None:
             assert await future, "callback not canceled"
 
 
+async def test_timers_coalesced_by_timer_wheel(hass: HomeAssistant) -> None:
+    """Test timers of the event helpers are coalesced once a resolution is set."""
+    hass.timer_wheel.resolution = 1
+    hass.timer_wheel.min_delay = 0
+    calls: list[str] = []
+    now = dt_util.utcnow()
+
+    def record(name: str) -> Callable[[datetime], None]:
+        @callback
+        def _record(_: datetime) -> None:
+            calls.append(name)
+
+        return _record
+
+    async_call_later(hass, 5.1, record("call_later"))
+    async_call_later(hass, 5.2, record("call_later_2"))
+    async_track_point_in_utc_time(
+        hass, record("point_in_time"), now + timedelta(seconds=5.3)
+    )
+    cancel_interval = async_track_time_interval(
+        hass, record("interval"), timedelta(seconds=5.4)
+    )
+    cancel_later = async_call_later(hass, 30, record("later"))
+    cancel_later()
+
+    assert hass.timer_wheel.active_timers == 4
+    assert hass.timer_wheel.active_ticks <= 2
+
+    async_fire_time_changed(hass, now + timedelta(seconds=7))
+    await hass.async_block_till_done()
+    assert sorted(calls) == ["call_later", "call_later_2", "interval", "point_in_time"]
+    assert hass.timer_wheel.fired_timers == 4
+    # The interval timer was rescheduled
+    assert hass.timer_wheel.active_timers == 1
+
+    cancel_interval()
+    assert hass.timer_wheel.active_timers == 0
+    assert hass.timer_wheel.active_ticks == 0
+
+
+async def test_long_timers_use_timer_wheel_by_default(hass: HomeAssistant) -> None:
+    """Test long timers of the event helpers are on the timer wheel by default."""
+    calls: list[datetime] = []
+    now = dt_util.utcnow()
+
+    async_call_later(hass, 5, callback(calls.append))
+    async_call_later(hass, 30, callback(calls.append))
+    assert hass.timer_wheel.active_timers == 1
+
+    async_fire_time_changed(hass, now + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    async_fire_time_changed(hass, now + timedelta(seconds=30))
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert hass.timer_wheel.fired_timers == 1
+    assert hass.timer_wheel.active_timers == 0
+
+
 async def test_track_state_change_event_chain_multple_entity(
     hass: HomeAssistant,
 ) -> None:
@@ -4,15 +4,19 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime, timedelta
+from functools import partial
 import json
 import logging
 import math
+from pathlib import Path
 import random
 from types import MappingProxyType
 from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
+import jinja2
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -342,6 +346,60 @@ async def test_import_change(hass: HomeAssistant) -> None:
     assert to_test.async_render() == "macro2 variable2"
 
 
+async def test_bytecode_cache(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test compiled templates are persisted and loaded without recompiling."""
+    path = str(tmp_path / template.BYTECODE_CACHE_FILE)
+    bytecode_cache = template.TemplateBytecodeCache(path)
+    hass.data[template._BYTECODE_CACHE] = bytecode_cache
+    assert template.Template("{{ 40 + 2 }}", hass).async_render() == 42
+    assert bytecode_cache.misses == 1
+    await bytecode_cache.async_save(hass)
+
+    loaded_cache = template.TemplateBytecodeCache(path)
+    await hass.async_add_executor_job(loaded_cache.load)
+    assert len(loaded_cache) == 1
+    hass.data[template._BYTECODE_CACHE] = loaded_cache
+    env = template.TemplateEnvironment(hass)
+    with patch.object(
+        jinja2.sandbox.ImmutableSandboxedEnvironment, "compile"
+    ) as compile_mock:
+        code = env.compile("{{ 40 + 2 }}")
+    assert not compile_mock.called
+    assert loaded_cache.hits == 1
+    assert jinja2.Template.from_code(env, code, env.globals, None).render() == "42"
+
+    # Templates of other environments are compiled separately
+    template.TemplateEnvironment(hass, limited=True).compile("{{ 40 + 2 }}")
+    assert loaded_cache.misses == 1
+
+    with patch("homeassistant.helpers.template.__version__", "0.0.0"):
+        other_version_cache = template.TemplateBytecodeCache(path)
+    await hass.async_add_executor_job(other_version_cache.load)
+    assert len(other_version_cache) == 0
+
+
+async def test_bytecode_cache_eviction(
+    hass: HomeAssistant, tmp_path: Path, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test templates not used for a long time are evicted from the cache."""
+    path = str(tmp_path / template.BYTECODE_CACHE_FILE)
+    bytecode_cache = template.TemplateBytecodeCache(path)
+    bytecode_cache.compile("stale", partial(compile, "1", "<stale>", "eval"))
+    bytecode_cache.compile("used", partial(compile, "2", "<used>", "eval"))
+
+    freezer.tick(timedelta(days=20))
+    bytecode_cache.compile("used", partial(compile, "2", "<used>", "eval"))
+    freezer.tick(timedelta(days=20))
+    bytecode_cache.compile("new", partial(compile, "3", "<new>", "eval"))
+    await bytecode_cache.async_save(hass)
+    assert len(bytecode_cache) == 2
+
+    loaded_cache = template.TemplateBytecodeCache(path)
+    await hass.async_add_executor_job(loaded_cache.load)
+    assert len(loaded_cache) == 2
+    assert eval(loaded_cache.compile("used", pytest.fail)) == 2  # noqa: S307
+
+
 def test_loop_controls(hass: HomeAssistant) -> None:
     """Test that loop controls are enabled."""
     assert (
@@ -2040,6 +2098,43 @@ def test_state_attr(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "action"
 
 
+def test_state_attr_render_info(hass: HomeAssistant) -> None:
+    """Test the attributes read by a template are collected."""
+    hass.states.async_set(
+        "climate.living", "heat", {"temperature": 21, "current_temperature": 19}
+    )
+    hass.states.async_set("climate.office", "off", {"temperature": 18})
+
+    info = render_to_info(
+        hass,
+        "{{ states('climate.living') }} {{ state_attr('climate.living', 'temperature') }}",
+    )
+    assert_result_info(info, "heat 21", ["climate.living"])
+    assert info.entity_attributes == {"climate.living": frozenset({"temperature"})}
+
+    info = render_to_info(hass, "{{ states.climate.office.state }}")
+    assert_result_info(info, "off", ["climate.office"])
+    assert info.entity_attributes == {"climate.office": frozenset()}
+
+    # Reading all attributes falls back to tracking the whole entity
+    info = render_to_info(
+        hass,
+        "{{ state_attr('climate.living', 'temperature') }}"
+        " {{ states.climate.living.attributes | length }}",
+    )
+    assert_result_info(info, "21 2", ["climate.living"])
+    assert info.entity_attributes == {}
+
+    # Entities of a tracked domain re-render on any change
+    info = render_to_info(
+        hass,
+        "{{ state_attr('climate.living', 'temperature') }}"
+        " {{ states.climate | list | count }}",
+    )
+    assert_result_info(info, "21 2", ["climate.living"], ["climate"])
+    assert info.entity_attributes == {}
+
+
 def test_states_function(hass: HomeAssistant) -> None:
     """Test using states as a function."""
     hass.states.async_set("test.object", "available")
@@ -2066,6 +2161,34 @@ def test_states_function(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "available"
 
 
+def test_states_with_attribute(hass: HomeAssistant) -> None:
+    """Test states_with_attribute method."""
+    hass.states.async_set("sensor.kitchen", "21", {"device_class": "temperature"})
+    hass.states.async_set("sensor.hallway", "55", {"device_class": "humidity"})
+    hass.states.async_set("climate.office", "heat", {"device_class": "temperature"})
+
+    info = render_to_info(
+        hass,
+        "{{ states_with_attribute('device_class', 'temperature', 'sensor')"
+        " | map(attribute='entity_id') | list }}",
+    )
+    assert_result_info(info, ["sensor.kitchen"], [], ["sensor"])
+
+    info = render_to_info(
+        hass,
+        "{{ states_with_attribute('device_class', 'temperature')"
+        " | map(attribute='entity_id') | sort }}",
+    )
+    assert_result_info(info, ["climate.office", "sensor.kitchen"], [], all_states=True)
+
+    hass.states.async_set("sensor.hallway", "19", {"device_class": "temperature"})
+    assert render(
+        hass,
+        "{{ 'device_class' | states_with_attribute('temperature', 'sensor')"
+        " | map(attribute='entity_id') | sort }}",
+    ) == ["sensor.hallway", "sensor.kitchen"]
+
+
 async def test_state_translated(
     hass: HomeAssistant, entity_registry: er.EntityRegistry
 ) -> None:
@@ -65,6 +65,7 @@ from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from .common import (
     async_capture_events,
+    async_fire_time_changed,
     async_mock_service,
     help_test_all,
     import_and_test_deprecated_alias,
@@ -1216,6 +1217,72 @@ async def test_eventbus_listen_once_run_immediately_coro(hass: HomeAssistant) ->
     assert len(calls) == 1
 
 
+async def test_eventbus_listen_batched(hass: HomeAssistant) -> None:
+    """Test batched listeners get the events fired in one loop iteration."""
+    batches: list[list[ha.Event]] = []
+
+    @ha.callback
+    def listener(events: list[ha.Event]) -> None:
+        """Mock listener."""
+        batches.append(events)
+
+    @ha.callback
+    def mock_filter(event_data: dict[str, Any]) -> bool:
+        """Mock filter."""
+        return not event_data["filtered"]
+
+    unsub = hass.bus.async_listen_batched("test", listener, event_filter=mock_filter)
+
+    for idx in range(5):
+        hass.bus.async_fire("test", {"idx": idx, "filtered": idx == 2})
+    assert batches == []
+
+    await hass.async_block_till_done()
+    assert len(batches) == 1
+    assert [event.data["idx"] for event in batches[0]] == [0, 1, 3, 4]
+
+    hass.bus.async_fire("test", {"idx": 5, "filtered": False})
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert [event.data["idx"] for event in batches[1]] == [5]
+
+    # Pending events are dropped when the listener is removed
+    hass.bus.async_fire("test", {"idx": 6, "filtered": False})
+    unsub()
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+
+
+async def test_eventbus_listen_batched_window(hass: HomeAssistant) -> None:
+    """Test batched listeners with a time window."""
+    batches: list[list[ha.Event]] = []
+
+    async def listener(events: list[ha.Event]) -> None:
+        """Mock listener."""
+        batches.append(events)
+
+    hass.bus.async_listen_batched("test", listener, window=1)
+
+    hass.bus.async_fire("test", {"idx": 0})
+    await hass.async_block_till_done()
+    hass.bus.async_fire("test", {"idx": 1})
+    await hass.async_block_till_done()
+    assert batches == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert len(batches) == 1
+    assert [event.data["idx"] for event in batches[0]] == [0, 1]
+
+
+async def test_eventbus_listen_batched_state_reported_requires_filter(
+    hass: HomeAssistant,
+) -> None:
+    """Test batched listeners of state_reported require a filter."""
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batched(EVENT_STATE_REPORTED, lambda events: None)
+
+
 async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -1467,6 +1534,64 @@ async def test_statemachine_entity_ids(hass: HomeAssistant) -> None:
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_all_with_attribute(hass: HomeAssistant) -> None:
+    """Test async_all_with_attribute method."""
+    hass.states.async_set("sensor.kitchen", "21", {"device_class": "temperature"})
+    hass.states.async_set("sensor.hallway", "55", {"device_class": "humidity"})
+
+    def entity_ids(*args: Any) -> list[str]:
+        return sorted(
+            state.entity_id for state in hass.states.async_all_with_attribute(*args)
+        )
+
+    assert entity_ids("device_class", "temperature") == ["sensor.kitchen"]
+    assert entity_ids("device_class", "pressure") == []
+
+    # The index is kept up to date after it is created
+    hass.states.async_set("climate.office", "heat", {"device_class": "temperature"})
+    hass.states.async_set("sensor.hallway", "19", {"device_class": "temperature"})
+    assert entity_ids("device_class", "temperature") == [
+        "climate.office",
+        "sensor.hallway",
+        "sensor.kitchen",
+    ]
+    assert entity_ids("device_class", "humidity") == []
+    assert entity_ids("device_class", "temperature", "sensor") == [
+        "sensor.hallway",
+        "sensor.kitchen",
+    ]
+    assert entity_ids("device_class", "temperature", ("climate", "light")) == [
+        "climate.office"
+    ]
+
+    hass.states.async_set("sensor.kitchen", "21", {})
+    hass.states.async_remove("climate.office")
+    assert entity_ids("device_class", "temperature") == ["sensor.hallway"]
+
+    # Unhashable values are not indexed
+    hass.states.async_set("sensor.list", "1", {"options": ["a", "b"]})
+    assert entity_ids("options", ["a", "b"]) == []
+
+
+async def test_statemachine_all_with_attribute_index_limit(
+    hass: HomeAssistant,
+) -> None:
+    """Test attributes are not indexed on first use past the limit."""
+    hass.states.async_set("sensor.kitchen", "21", {"device_class": "temperature"})
+    for idx in range(ha.MAX_AUTO_ATTRIBUTE_INDEXES):
+        hass.states.async_all_with_attribute(f"attribute_{idx}", "value")
+
+    states = hass.states.async_all_with_attribute("device_class", "temperature")
+    assert [state.entity_id for state in states] == ["sensor.kitchen"]
+    assert "device_class" not in hass.states._states._attribute_index
+
+    # Explicitly indexed attributes are not limited
+    hass.states.async_index_attribute("device_class")
+    assert "device_class" in hass.states._states._attribute_index
+    states = hass.states.async_all_with_attribute("device_class", "temperature")
+    assert [state.entity_id for state in states] == ["sensor.kitchen"]
+
+
 async def test_statemachine_remove(hass: HomeAssistant) -> None:
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
@@ -1561,6 +1686,37 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_shares_identical_attributes(hass: HomeAssistant) -> None:
+    """Test states with identical attributes share the same ReadOnly dict."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.ceiling", "on", {"brightness": 100})
+    hass.states.async_set("light.desk", "on", {"brightness": 100.0})
+
+    bowl = hass.states.get("light.bowl")
+    assert isinstance(bowl.attributes, ReadOnlyDict)
+    assert bowl.attributes is hass.states.get("light.ceiling").attributes
+    assert bowl.attributes is not hass.states.get("light.desk").attributes
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 50})
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    assert hass.states.get("light.bowl").attributes is bowl.attributes
+
+
+async def test_statemachine_change_count(hass: HomeAssistant) -> None:
+    """Test the change count only increases when a state changes."""
+    change_count = hass.states.change_count
+    hass.states.async_set("light.bowl", "on")
+    assert hass.states.change_count == change_count + 1
+    hass.states.async_set("light.bowl", "on")
+    assert hass.states.change_count == change_count + 1
+    hass.states.async_set("light.bowl", "off")
+    assert hass.states.change_count == change_count + 2
+    assert hass.states.async_remove("light.bowl")
+    assert hass.states.change_count == change_count + 3
+    assert not hass.states.async_remove("light.bowl")
+    assert hass.states.change_count == change_count + 3
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1,11 +1,13 @@
 """Test read only dictionary."""
 
 import copy
+import gc
 import json
 
 import pytest
 
-from homeassistant.util.read_only_dict import ReadOnlyDict
+from homeassistant.const import UnitOfTemperature
+from homeassistant.util.read_only_dict import ReadOnlyDict, ReadOnlyDictPool
 
 
 def test_read_only_dict() -> None:
@@ -38,3 +40,34 @@ def test_read_only_dict() -> None:
     assert json.dumps(data) == json.dumps({"hello": "world"})
 
     assert copy.deepcopy(data) == {"hello": "world"}
+
+
+def test_read_only_dict_pool() -> None:
+    """Test deduplicating read only dictionaries."""
+    pool = ReadOnlyDictPool()
+
+    data = pool.intern({"unit_of_measurement": UnitOfTemperature.CELSIUS, "mode": 1})
+    assert isinstance(data, ReadOnlyDict)
+    assert data == {"unit_of_measurement": "°C", "mode": 1}
+    assert (
+        pool.intern({"unit_of_measurement": UnitOfTemperature.CELSIUS, "mode": 1})
+        is data
+    )
+
+    # Equal values of a different type are not merged
+    other = pool.intern(
+        {"unit_of_measurement": UnitOfTemperature.CELSIUS, "mode": True}
+    )
+    assert other is not data
+    assert other["mode"] is True
+
+    # Unhashable values are not pooled
+    unhashable = {"options": ["a", "b"]}
+    assert pool.intern(unhashable) is not pool.intern(unhashable)
+    assert pool.intern(unhashable) == unhashable
+    assert len(pool) == 2
+
+    # Pooled dicts are released once they are no longer used
+    del data, other
+    gc.collect()
+    assert len(pool) == 0
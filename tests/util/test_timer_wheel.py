@@ -0,0 +1,100 @@
+"""Test the timer wheel."""
+
+import asyncio
+from unittest.mock import Mock
+
+from homeassistant.util.async_ import get_scheduled_timer_handles
+from homeassistant.util.timer_wheel import TimerWheel, TimerWheelHandle
+
+
+async def test_timer_wheel_coalesces_timers() -> None:
+    """Test timers of the same tick share a loop timer handle."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, 0.05)
+    handles_before = len(get_scheduled_timer_handles(loop))
+    calls: list[int] = []
+    now = loop.time()
+
+    # Scheduled out of order, fired in the order they are due
+    for idx in reversed(range(10)):
+        assert isinstance(
+            wheel.call_at(now + 0.001 * idx, calls.append, idx), TimerWheelHandle
+        )
+    cancelled = wheel.call_at(now + 0.002, calls.append, 100)
+    cancelled.cancel()
+    cancelled.cancel()
+    assert cancelled.cancelled()
+
+    assert wheel.active_timers == 10
+    assert wheel.active_ticks <= 2
+    assert len(get_scheduled_timer_handles(loop)) - handles_before == wheel.active_ticks
+
+    await asyncio.sleep(0.15)
+    assert calls == list(range(10))
+    assert wheel.active_timers == 0
+    assert wheel.active_ticks == 0
+    assert wheel.fired_timers == 10
+    assert 0 <= wheel.average_late <= wheel.max_late
+
+
+async def test_timer_wheel_cancel_last_timer_of_tick() -> None:
+    """Test cancelling the last timer of a tick cancels its loop handle."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, 10)
+    callback = Mock()
+
+    handle = wheel.call_at(loop.time() + 1, callback)
+    assert wheel.active_ticks == 1
+    (timer,) = wheel.timers()
+    assert timer is handle
+
+    handle.cancel()
+    assert wheel.active_ticks == 0
+    assert wheel.active_timers == 0
+    assert list(wheel.timers()) == []
+    assert not callback.called
+
+
+async def test_timer_wheel_cancel_while_firing() -> None:
+    """Test a callback can cancel another timer of the same tick."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, 0.05)
+    now = loop.time()
+    second = Mock()
+    second_handle = wheel.call_at(now + 0.002, second)
+    wheel.call_at(now + 0.001, second_handle.cancel)
+
+    await asyncio.sleep(0.15)
+    assert not second.called
+    assert wheel.fired_timers == 1
+
+
+async def test_timer_wheel_min_delay() -> None:
+    """Test timers due sooner than the minimum delay are passed to the loop."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, 0.05, 10)
+    callback = Mock()
+
+    handle = wheel.call_at(loop.time(), callback, 1)
+    assert isinstance(handle, asyncio.TimerHandle)
+    later = wheel.call_at(loop.time() + 10, callback, 2)
+    assert isinstance(later, TimerWheelHandle)
+    assert wheel.active_timers == 1
+    later.cancel()
+
+    await asyncio.sleep(0.01)
+    callback.assert_called_once_with(1)
+
+
+async def test_timer_wheel_disabled() -> None:
+    """Test timers are passed to the loop without a resolution."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    callback = Mock()
+
+    handle = wheel.call_at(loop.time(), callback, 1)
+    assert isinstance(handle, asyncio.TimerHandle)
+    assert wheel.active_timers == 0
+
+    await asyncio.sleep(0.01)
+    callback.assert_called_once_with(1)